@@ -10,7 +10,8 @@ class AutomationPipeline:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.temp_manager = TempManager()
-        self.video_processor = VideoProcessor(self.temp_manager)
+        # The pipeline only needs scene boundaries, so sample every other frame
+        self.video_processor = VideoProcessor(self.temp_manager, scene_frame_step=2)
         # Access the scene_detector from the video_processor to avoid redundancy
         self.scene_detector = self.video_processor.scene_detector
         self.logger.info("AutomationPipeline initialized.")
@@ -67,14 +68,18 @@ class AutomationPipeline:
         zigzag_cuts_definitions = self.scene_detector.create_zigzag_sequence(cuts)
         self.logger.info(f"4 & 5. Fair Use: Generated {len(zigzag_cuts_definitions)} cuts and applied zigzag sequence.")
 
-        # Create the actual video clips for each cut definition
+        # Create the actual video clips for each cut definition, all in one
+        # trim mode so they can be concatenated without re-encoding
+        windows = [
+            (cut_def['start'], cut_def['start'] + cut_def['duration'])
+            for cut_def in zigzag_cuts_definitions
+        ]
+        stream_copy = self.video_processor.can_stream_copy(video_no_silence, windows)
         cut_files = []
-        for i, cut_def in enumerate(zigzag_cuts_definitions):
-            self.logger.debug(f"Creating clip {i} from {cut_def['start']:.2f}s for {cut_def['duration']:.2f}s")
+        for i, (start, end) in enumerate(windows):
+            self.logger.debug(f"Creating clip {i} from {start:.2f}s for {end - start:.2f}s")
             clip = self.video_processor.trim_video(
-                video_no_silence,
-                cut_def['start'],
-                cut_def['start'] + cut_def['duration']
+                video_no_silence, start, end, stream_copy=stream_copy
             )
             cut_files.append(clip)
         self.logger.info(f"   - Created {len(cut_files)} video clip files from definitions.")
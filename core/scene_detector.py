@@ -7,19 +7,41 @@ Depends on: temp_manager.py
 import cv2
 import numpy as np
 import logging
-from typing import List, Tuple, Dict, Optional
+import queue
+import subprocess
+import threading
+from typing import List, Tuple, Dict, Optional, Iterator
 import os
 
+# HSV histogram used to compare frames: 32 hue x 4 saturation x 4 value bins
+HIST_CHANNELS = [0, 1, 2]
+HIST_BINS = [32, 4, 4]
+HIST_RANGES = [0, 180, 0, 256, 0, 256]
+
 class SceneDetector:
     """
     Scene detection using OpenCV histogram analysis
     """
     
-    def __init__(self, temp_manager):
+    def __init__(self, temp_manager, keyframe_stride: int = 5, downsample: int = 2,
+                 frame_step: int = 1, ffprobe_path: str = 'ffprobe'):
         self.temp_manager = temp_manager
+        self.ffprobe_path = ffprobe_path
         self.sensitivity = 0.3
         self.min_scene_duration = 3.0
         self.logger = logging.getLogger(__name__)
+        
+        # Full histogram comparison runs every keyframe_stride frames; frames
+        # in between get a cheap check on a downsampled copy and only fall
+        # through to the histogram when that check sees a large change
+        self.keyframe_stride = max(1, keyframe_stride)
+        self.downsample = max(1, downsample)
+        self.frame_diff_threshold = 10.0  # Mean absolute pixel difference (0-255)
+        
+        # Only every frame_step-th frame is decoded to pixels; the others are
+        # just grabbed (demuxed/decoded without conversion or copy). The default
+        # of 1 samples every frame; callers opt in to coarser sampling
+        self.frame_step = max(1, frame_step)
     
     def detect_scenes(self, video_path: str) -> List[Tuple[float, float]]:
         """
@@ -42,24 +64,34 @@ class SceneDetector:
             
             scenes = []
             prev_hist = None
+            prev_small = None
+            hsv_frame = None  # Reused HSV conversion buffer
             scene_start = 0.0
+            scale = 1.0 / self.downsample
             
-            for frame_idx in range(frame_count):
-                ret, frame = cap.read()
-                if not ret:
-                    break
+            frames = self._iter_frames(cap, frame_count, self.frame_step)
+            for sample_idx, (frame_idx, frame) in enumerate(frames):
+                # Cheap check between keyframes: mean absolute difference of
+                # downsampled frames
+                small = cv2.resize(frame, None, fx=scale, fy=scale,
+                                   interpolation=cv2.INTER_AREA)
+                is_keyframe = sample_idx % self.keyframe_stride == 0
+                if not is_keyframe and prev_small is not None:
+                    diff = cv2.norm(small, prev_small, cv2.NORM_L1) / small.size
+                    is_keyframe = diff > self.frame_diff_threshold
+                prev_small = small
                 
-                # Convert to HSV for better histogram analysis
-                hsv_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+                if not is_keyframe:
+                    continue
                 
-                # Calculate histogram
-                hist = cv2.calcHist([hsv_frame], [0, 1, 2], None, [50, 60, 60], 
-                                  [0, 180, 0, 256, 0, 256])
-                hist = cv2.normalize(hist, hist).flatten()
+                # Calculate histogram; only the current frame's is computed,
+                # the previous one is carried over from the last keyframe
+                hsv_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=hsv_frame)
+                hist = self._hsv_histogram(hsv_frame)
                 
                 if prev_hist is not None:
                     # Compare histograms
-                    correlation = cv2.compareHist(prev_hist, hist, cv2.HISTCMP_CORREL)
+                    correlation = self._compare_histograms(prev_hist, hist)
                     
                     # If correlation is low, it's a scene change
                     if correlation < (1.0 - self.sensitivity):
@@ -85,6 +117,232 @@ class SceneDetector:
             self.logger.error(f"Scene detection failed: {e}")
             raise RuntimeError(f"Scene detection failed: {e}")
     
+    def _iter_frames(self, cap, frame_count: int, step: int = 1,
+                     prefetch: int = 8) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Yield (frame_idx, frame) for every step-th frame, decoding ahead on a
+        worker thread
+        
+        Skipped frames are only grabbed, never retrieved, so they skip the
+        color conversion and copy into a numpy array.
+        
+        OpenCV releases the GIL while decoding and while computing
+        histograms, so decoding the next frames overlaps with the analysis
+        of the current one.
+        """
+        frames = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        errors = []
+        
+        def put(item) -> bool:
+            # Give up once the consumer has stopped, so the thread can't hang
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def reader():
+            try:
+                for frame_idx in range(frame_count):
+                    if not cap.grab():
+                        break
+                    if frame_idx % step:
+                        continue
+                    
+                    ret, frame = cap.retrieve()
+                    if not ret or not put((frame_idx, frame)):
+                        break
+            except Exception as e:
+                errors.append(e)
+            finally:
+                put(None)
+        
+        thread = threading.Thread(target=reader, name="scene-frame-reader", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = frames.get()
+                if item is None:
+                    break
+                yield item
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            thread.join()
+    
+    def _frame_histogram(self, frame: np.ndarray) -> np.ndarray:
+        """Normalized HSV histogram of a BGR frame"""
+        # Convert to HSV for better histogram analysis
+        return self._hsv_histogram(cv2.cvtColor(frame, cv2.COLOR_BGR2HSV))
+    
+    def _hsv_histogram(self, hsv_frame: np.ndarray) -> np.ndarray:
+        """Normalized histogram of a frame already converted to HSV"""
+        hist = cv2.calcHist([hsv_frame], HIST_CHANNELS, None, HIST_BINS, HIST_RANGES)
+        cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
+        return hist
+    
+    def _compare_histograms(self, hist1: np.ndarray, hist2: np.ndarray) -> float:
+        """Similarity of two histograms: 1.0 identical, 0.0 no overlap"""
+        return 1.0 - cv2.compareHist(hist1, hist2, cv2.HISTCMP_BHATTACHARYYA)
+    
+    def analyze_frame_difference(self, frame1: np.ndarray, frame2: np.ndarray) -> float:
+        """
+        Compare two frames by their HSV color histograms
+        
+        Args:
+            frame1: First BGR frame
+            frame2: Second BGR frame
+            
+        Returns:
+            Similarity between 0.0 (completely different) and 1.0 (identical)
+        """
+        return self._compare_histograms(self._frame_histogram(frame1),
+                                        self._frame_histogram(frame2))
+    
+    def detect_keyframes(self, video_path: str, interval: float = 1.0) -> List[float]:
+        """
+        Find keyframe (I-frame) timestamps, at least interval seconds apart
+        
+        ffprobe skips every non-key frame before decoding, so only the
+        keyframes themselves are decoded.
+        
+        Args:
+            video_path: Path to video file
+            interval: Minimum spacing between returned keyframes in seconds
+            
+        Returns:
+            Sorted keyframe timestamps in seconds
+        """
+        cmd = [
+            self.ffprobe_path, '-loglevel', 'error',
+            '-select_streams', 'v:0',
+            '-skip_frame', 'nokey',
+            '-show_entries', 'frame=best_effort_timestamp_time',
+            '-of', 'csv=p=0',
+            video_path
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Keyframe detection timed out")
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Keyframe detection failed: {result.stderr}")
+        
+        times = sorted(
+            float(value) for value in result.stdout.split()
+            if value != 'N/A'
+        )
+        
+        keyframes = []
+        for t in times:
+            if not keyframes or t >= keyframes[-1] + interval:
+                keyframes.append(t)
+        
+        self.logger.info(f"Detected {len(keyframes)} keyframes")
+        return keyframes
+    
+    def export_scene_frames(self, video_path: str, scenes: List[Dict],
+                            output_dir: Optional[str] = None) -> List[str]:
+        """
+        Save the first frame of each scene as a JPEG thumbnail
+        
+        Args:
+            video_path: Path to video file
+            scenes: Scene dictionaries with a 'start_frame' index
+            output_dir: Target directory (temp 'scene_frames' dir if None)
+            
+        Returns:
+            Paths to the exported frames, in scene order
+        """
+        if output_dir is None:
+            output_dir = self.temp_manager.get_temp_dir('scene_frames')
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        # One capture for all scenes, visited in frame order so seeks only go forward
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise RuntimeError(f"Cannot open video file: {video_path}")
+        
+        frame_paths = {}
+        position = 0
+        try:
+            order = sorted(range(len(scenes)), key=lambda i: scenes[i]['start_frame'])
+            for scene_idx in order:
+                start_frame = int(scenes[scene_idx]['start_frame'])
+                if start_frame != position:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+                
+                ret, frame = cap.read()
+                if not ret:
+                    self.logger.warning(f"Could not read frame {start_frame} for scene {scene_idx}")
+                    position = -1
+                    continue
+                position = start_frame + 1
+                
+                ok, buffer = cv2.imencode('.jpg', frame)
+                if not ok:
+                    self.logger.warning(f"Could not encode frame for scene {scene_idx}")
+                    continue
+                
+                frame_path = os.path.join(output_dir, f"scene_{scene_idx:04d}.jpg")
+                fd = os.open(frame_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, buffer.tobytes())
+                finally:
+                    os.close(fd)
+                frame_paths[scene_idx] = frame_path
+        finally:
+            cap.release()
+        
+        self.logger.info(f"Exported {len(frame_paths)} scene frames to {output_dir}")
+        return [frame_paths[i] for i in sorted(frame_paths)]
+    
+    def filter_scene_breaks(self, raw_scenes: List, min_scene_duration: Optional[float] = None) -> List:
+        """
+        Drop scenes shorter than min_scene_duration
+        
+        Args:
+            raw_scenes: (start_time, end_time) tuples or dicts with 'duration'
+            min_scene_duration: Minimum duration to keep (defaults to self.min_scene_duration)
+            
+        Returns:
+            The scenes that are long enough, in their original order
+        """
+        if min_scene_duration is None:
+            min_scene_duration = self.min_scene_duration
+        
+        if not raw_scenes:
+            return []
+        
+        # Short lists: a plain comprehension beats building arrays
+        if len(raw_scenes) < 64:
+            return [scene for scene in raw_scenes
+                    if self._scene_duration(scene) >= min_scene_duration]
+        
+        if isinstance(raw_scenes[0], dict):
+            durations = np.fromiter((scene['duration'] for scene in raw_scenes),
+                                    dtype=np.float64, count=len(raw_scenes))
+        else:
+            bounds = np.asarray(raw_scenes, dtype=np.float64)
+            durations = bounds[:, 1] - bounds[:, 0]
+        
+        keep = np.flatnonzero(durations >= min_scene_duration)
+        return [raw_scenes[i] for i in keep]
+    
+    @staticmethod
+    def _scene_duration(scene) -> float:
+        """Duration of a scene given as a dict or a (start, end) tuple"""
+        if isinstance(scene, dict):
+            return scene['duration']
+        return scene[1] - scene[0]
+    
     def generate_fair_use_cuts(self, scenes: List[Tuple[float, float]], 
                               min_duration: float = 3.0, 
                               max_duration: float = 7.0) -> List[Dict]:
@@ -128,7 +386,8 @@ class SceneDetector:
     
     def create_zigzag_sequence(self, cuts: List[Dict]) -> List[int]:
         """
-        Create zigzag compilation order: 0,2,1,3,5,4,7,6...
+        Create zigzag compilation order: even positions first, then odd
+        (0,2,1,3 for four cuts; 0,2,4,1,3 for five)
         
         Args:
             cuts: List of cut dictionaries
@@ -136,27 +395,8 @@ class SceneDetector:
         Returns:
             List of cut indices in zigzag order
         """
-        sequence = []
-        n = len(cuts)
-        
-        for i in range(n):
-            if i % 2 == 0:
-                # Even indices: 0, 1, 2, 3...
-                if i < n:
-                    sequence.append(i)
-            else:
-                # Odd indices: reverse order
-                reverse_index = n - 1 - (i // 2)
-                if reverse_index > i and reverse_index < n:
-                    sequence.append(reverse_index)
-        
-        # Remove duplicates and ensure all cuts are included
-        sequence = list(dict.fromkeys(sequence))
-        
-        # Add any missing cuts
-        for i in range(n):
-            if i not in sequence:
-                sequence.append(i)
+        indices = np.arange(len(cuts))
+        sequence = np.concatenate((indices[::2], indices[1::2])).tolist()
         
         self.logger.info(f"Created zigzag sequence: {sequence}")
         return sequence
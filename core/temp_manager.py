@@ -10,6 +10,7 @@ import os
 import atexit
 import logging
 import time
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -26,6 +27,9 @@ class TempManager:
         self.logger = logging.getLogger(__name__)
         self.config = config or {}
         
+        # Guards temp_files and the temp dir; downloads and trims run on worker threads
+        self._lock = threading.RLock()
+        
         # Register cleanup on exit
         atexit.register(self.cleanup_all)
         
@@ -34,88 +38,172 @@ class TempManager:
         self.temp_dir_prefix = self.config.get('temp_dir_prefix', 'ffmpeg_editor_')
         self.cleanup_on_exit = self.config.get('cleanup_on_exit', True)
         
+        # Free space from the last disk_usage call: (monotonic time, path, free bytes)
+        self.disk_space_ttl = self.config.get('disk_space_ttl', 1.0)
+        self._disk_space_cache = (float('-inf'), None, 0)
+        
+        # Descriptors backing anonymous (O_TMPFILE) scratch files, by returned path
+        self._scratch_fds: Dict[str, int] = {}
+        
         self.logger.info("TempManager initialized")
     
     def create_temp_dir(self) -> str:
         """Create main temporary directory"""
-        if not self.temp_dir:
-            self.temp_dir = tempfile.mkdtemp(prefix=self.temp_dir_prefix)
-            self.logger.info(f"Created temp directory: {self.temp_dir}")
-        return self.temp_dir
+        with self._lock:
+            if not self.temp_dir:
+                self.temp_dir = tempfile.mkdtemp(prefix=self.temp_dir_prefix)
+                self.logger.info(f"Created temp directory: {self.temp_dir}")
+            return self.temp_dir
     
-    def get_temp_file(self, suffix: str = '.mp4') -> str:
-        """Generate unique temp file path"""
-        if not self.temp_dir:
-            self.create_temp_dir()
+    def get_temp_file(self, suffix: str = '.mp4', persistent: bool = True) -> str:
+        """
+        Generate unique temp file path
         
-        # Check if we have too many temp files
-        if len(self.temp_files) >= self.max_temp_files:
-            self.logger.warning(f"Too many temp files ({len(self.temp_files)}), forcing cleanup")
-            self.cleanup_old_files()
+        With persistent=False the file is short-lived scratch space. With an
+        empty suffix on Linux it is created with O_TMPFILE, so it never gets a
+        directory entry; the returned /proc/<pid>/fd path has no extension, so
+        only use it where the format does not come from the file name. With a
+        suffix (e.g. ffmpeg outputs) a regular suffixed file is created. Either
+        kind can be given back early with release_temp_file.
+        """
+        with self._lock:
+            if not self.temp_dir:
+                self.create_temp_dir()
+            
+            if not persistent:
+                return self._get_scratch_file(suffix)
+            
+            # Check if we have too many temp files
+            if len(self.temp_files) >= self.max_temp_files:
+                self.logger.warning(f"Too many temp files ({len(self.temp_files)}), forcing cleanup")
+                self.cleanup_old_files()
+            
+            temp_file = tempfile.mktemp(suffix=suffix, dir=self.temp_dir)
+            self.register_temp_file(temp_file)
+            return temp_file
+    
+    def _get_scratch_file(self, suffix: str) -> str:
+        """Anonymous O_TMPFILE file when no suffix is needed, otherwise a regular registered temp file"""
+        if not suffix and hasattr(os, 'O_TMPFILE'):
+            try:
+                fd = os.open(self.temp_dir, os.O_TMPFILE | os.O_RDWR, 0o600)
+                path = f"/proc/{os.getpid()}/fd/{fd}"
+                self._scratch_fds[path] = fd
+                return path
+            except OSError as e:
+                # Not every filesystem supports O_TMPFILE
+                self.logger.debug(f"O_TMPFILE unavailable in {self.temp_dir}: {e}")
         
-        temp_file = tempfile.mktemp(suffix=suffix, dir=self.temp_dir)
+        fd, temp_file = tempfile.mkstemp(suffix=suffix, dir=self.temp_dir)
+        os.close(fd)
         self.register_temp_file(temp_file)
         return temp_file
     
+    def release_temp_file(self, filepath: str):
+        """
+        Free a temp file before cleanup_all
+        
+        Closes the descriptor of an anonymous scratch file (which frees it),
+        or deletes and unregisters a regular temp file.
+        """
+        with self._lock:
+            fd = self._scratch_fds.pop(filepath, None)
+            if filepath in self.temp_files:
+                self.temp_files.remove(filepath)
+        
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+            return
+        
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to release temp file {filepath}: {e}")
+    
     def register_temp_file(self, filepath: str):
         """Register file for cleanup"""
-        if filepath not in self.temp_files:
-            self.temp_files.append(filepath)
-            self.logger.debug(f"Registered temp file: {filepath}")
+        with self._lock:
+            if filepath not in self.temp_files:
+                self.temp_files.append(filepath)
+                self.logger.debug(f"Registered temp file: {filepath}")
     
     def cleanup_all(self):
         """Clean all temporary files and directories"""
-        if not self.cleanup_on_exit:
-            self.logger.info("Cleanup on exit disabled, skipping")
-            return
+        with self._lock:
+            if not self.cleanup_on_exit:
+                self.logger.info("Cleanup on exit disabled, skipping")
+                return
             
-        cleaned_count = 0
-        
-        # Clean individual files
-        for temp_file in self.temp_files[:]:  # Copy list to avoid modification during iteration
-            if os.path.exists(temp_file):
+            cleaned_count = 0
+            
+            # Deleting files frees space, so the next check must ask the OS again
+            self._disk_space_cache = (float('-inf'), None, 0)
+            
+            # Closing the last descriptor frees an anonymous scratch file
+            for fd in self._scratch_fds.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._scratch_fds.clear()
+            
+            # Everything under the temp directory goes with a single rmtree;
+            # only files registered elsewhere need removing one by one
+            temp_root = os.path.join(self.temp_dir, '') if self.temp_dir else None
+            for temp_file in self.temp_files:
+                if temp_root and temp_file.startswith(temp_root):
+                    continue
                 try:
                     os.remove(temp_file)
                     cleaned_count += 1
                     self.logger.debug(f"Cleaned temp file: {temp_file}")
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
                     self.logger.warning(f"Failed to clean temp file {temp_file}: {e}")
-                finally:
-                    if temp_file in self.temp_files:
-                        self.temp_files.remove(temp_file)
-        
-        # Clean main temp directory
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            try:
-                shutil.rmtree(self.temp_dir)
-                self.logger.info(f"Cleaned temp directory: {self.temp_dir}")
-                cleaned_count += 1
-            except Exception as e:
-                self.logger.error(f"Failed to clean temp directory {self.temp_dir}: {e}")
-        
-        self.logger.info(f"Cleanup completed. {cleaned_count} items cleaned.")
+            self.temp_files.clear()
+            
+            # Clean main temp directory
+            if self.temp_dir and os.path.isdir(self.temp_dir):
+                try:
+                    shutil.rmtree(self.temp_dir)
+                    self.logger.info(f"Cleaned temp directory: {self.temp_dir}")
+                    cleaned_count += 1
+                    self.temp_dir = None
+                except Exception as e:
+                    self.logger.error(f"Failed to clean temp directory {self.temp_dir}: {e}")
+            else:
+                self.temp_dir = None
+            
+            self.logger.info(f"Cleanup completed. {cleaned_count} items cleaned.")
     
     def cleanup_old_files(self):
         """Clean oldest temp files when limit is reached"""
-        if len(self.temp_files) < self.max_temp_files:
-            return
+        with self._lock:
+            if len(self.temp_files) < self.max_temp_files:
+                return
             
-        # Sort files by modification time (oldest first)
-        sorted_files = sorted(
-            [f for f in self.temp_files if os.path.exists(f)],
-            key=lambda x: os.path.getmtime(x)
-        )
-        
-        # Remove oldest 20% of files
-        files_to_remove = sorted_files[:max(1, len(sorted_files) // 5)]
-        
-        for file_path in files_to_remove:
-            try:
-                os.remove(file_path)
-                self.temp_files.remove(file_path)
-                self.logger.debug(f"Removed old temp file: {file_path}")
-            except Exception as e:
-                self.logger.warning(f"Failed to remove old temp file {file_path}: {e}")
+            # Sort files by modification time (oldest first)
+            sorted_files = sorted(
+                [f for f in self.temp_files if os.path.exists(f)],
+                key=lambda x: os.path.getmtime(x)
+            )
+            
+            # Remove oldest 20% of files
+            files_to_remove = sorted_files[:max(1, len(sorted_files) // 5)]
+            
+            for file_path in files_to_remove:
+                try:
+                    os.remove(file_path)
+                    self.temp_files.remove(file_path)
+                    self.logger.debug(f"Removed old temp file: {file_path}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to remove old temp file {file_path}: {e}")
     
     def cleanup_on_error(self):
         """Emergency cleanup on errors"""
@@ -143,17 +231,7 @@ class TempManager:
     def get_disk_usage(self) -> Dict[str, Any]:
         """Get current disk usage info"""
         if self.temp_dir and os.path.exists(self.temp_dir):
-            total_size = 0
-            file_count = 0
-            
-            for dirpath, dirnames, filenames in os.walk(self.temp_dir):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    try:
-                        total_size += os.path.getsize(filepath)
-                        file_count += 1
-                    except OSError:
-                        continue
+            total_size, file_count = self._scan_dir(self.temp_dir)
             
             return {
                 'temp_dir_size_mb': total_size / (1024 * 1024),
@@ -164,11 +242,43 @@ class TempManager:
         
         return {'temp_dir_size_mb': 0, 'temp_file_count': 0, 'temp_dir_path': None}
     
+    def _scan_dir(self, root: str):
+        """Total size and count of files under root (single scandir pass per directory)"""
+        total_size = 0
+        file_count = 0
+        pending = [root]
+        
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+                            file_count += 1
+                    except OSError:
+                        continue
+        
+        return total_size, file_count
+    
     def check_disk_space(self, min_free_space_gb: float = 5.0) -> bool:
-        """Check if there's enough disk space"""
+        """Check if there's enough disk space (free space cached for disk_space_ttl seconds)"""
         try:
-            stat = shutil.disk_usage(self.temp_dir or tempfile.gettempdir())
-            free_gb = stat.free / (1024 ** 3)
+            path = self.temp_dir or tempfile.gettempdir()
+            now = time.monotonic()
+            checked_at, cached_path, free_bytes = self._disk_space_cache
+            
+            if cached_path != path or now - checked_at >= self.disk_space_ttl:
+                free_bytes = shutil.disk_usage(path).free
+                self._disk_space_cache = (now, path, free_bytes)
+            
+            free_gb = free_bytes / (1024 ** 3)
             return free_gb >= min_free_space_gb
         except Exception:
             return True  # Assume OK if we can't check
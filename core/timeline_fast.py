@@ -0,0 +1,151 @@
+# core/timeline_fast.py
+"""
+Compiled helpers for timeline hit-testing, overlap checks and time markers
+Used by: gui/timeline_widget.py
+"""
+
+import numpy as np
+
+# Numba optional - tanpa numba fungsi tetap jalan sebagai Python biasa
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def _first_end_at_or_after(ends, t):
+    """Index of the first interval whose end is >= t (ends must be sorted)"""
+    lo = 0
+    hi = ends.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ends[mid] < t:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+@njit(cache=True)
+def find_cut_at_time(starts, ends, t):
+    """
+    Find the interval containing time t
+
+    Args:
+        starts: Sorted start times of disjoint intervals (float64)
+        ends: End times in the same order (float64)
+        t: Time in seconds
+
+    Returns:
+        Index into starts/ends, or -1 if no interval contains t
+    """
+    i = _first_end_at_or_after(ends, t)
+    if i < starts.shape[0] and starts[i] <= t:
+        return i
+    return -1
+
+@njit(cache=True)
+def check_overlap(starts, ends, cut_ids, new_start, new_end, self_id):
+    """
+    Check whether [new_start, new_end] overlaps any interval other than self_id
+
+    Intervals must be disjoint and sorted by start time, so only the first
+    interval (besides self_id) ending after new_start needs to be checked.
+    """
+    lo = 0
+    hi = ends.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if ends[mid] <= new_start:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    for i in range(lo, min(lo + 2, ends.shape[0])):
+        if cut_ids[i] != self_id:
+            return starts[i] < new_end
+    return False
+
+@njit(cache=True)
+def is_disjoint(starts, ends):
+    """
+    Check whether intervals sorted by start time are pairwise disjoint
+
+    find_cut_at_time and check_overlap rely on this; when it is False the
+    *_scan variants must be used instead. Touching intervals count as disjoint.
+    """
+    for i in range(1, starts.shape[0]):
+        if starts[i] < ends[i - 1]:
+            return False
+    return True
+
+@njit(cache=True)
+def find_cut_at_time_scan(starts, ends, t):
+    """
+    Find the interval containing time t, allowing overlapping intervals
+
+    Args:
+        starts: Sorted start times (float64)
+        ends: End times in the same order (float64)
+        t: Time in seconds
+
+    Returns:
+        Index of the earliest-starting interval containing t, or -1
+    """
+    for i in range(starts.shape[0]):
+        if starts[i] > t:
+            break
+        if ends[i] >= t:
+            return i
+    return -1
+
+@njit(cache=True)
+def check_overlap_scan(starts, ends, cut_ids, new_start, new_end, self_id):
+    """
+    Check whether [new_start, new_end] overlaps any interval other than self_id,
+    allowing the existing intervals to overlap each other (starts sorted)
+    """
+    for i in range(starts.shape[0]):
+        if starts[i] >= new_end:
+            break
+        if ends[i] > new_start and cut_ids[i] != self_id:
+            return True
+    return False
+
+@njit(cache=True)
+def compute_marker_times(t0, t1, interval):
+    """
+    Times of the markers (multiples of interval) from the last one at or
+    before t0 up to t1 inclusive
+
+    The first marker may lie before t0 so a marker straddling the left edge
+    of the view is still drawn.
+    """
+    first = np.floor(t0 / interval)
+    count = int(np.floor(t1 / interval) - first) + 1
+    if count < 0:
+        count = 0
+
+    times = np.empty(count, dtype=np.float64)
+    for k in range(count):
+        times[k] = (first + k) * interval
+    return times
+
+def warm_up():
+    """Compile all helpers up front so the first mouse event does not pay for it"""
+    starts = np.array([0.0, 2.0], dtype=np.float64)
+    ends = np.array([1.0, 3.0], dtype=np.float64)
+    cut_ids = np.array([0, 1], dtype=np.int64)
+
+    is_disjoint(starts, ends)
+    find_cut_at_time(starts, ends, 0.5)
+    find_cut_at_time_scan(starts, ends, 0.5)
+    check_overlap(starts, ends, cut_ids, 0.5, 1.5, 0)
+    check_overlap_scan(starts, ends, cut_ids, 0.5, 1.5, 0)
+    compute_marker_times(0.0, 10.0, 1.0)
@@ -1,26 +1,118 @@
 # core/video_processor.py
 """
 Core video processing operations using FFmpeg
-Depends on: temp_manager.py
+Depends on: temp_manager.py, scene_detector.py
 """
 
 import subprocess
 import os
 import json
+import bisect
+import hashlib
 import logging
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Tuple, Dict, Optional
 from pathlib import Path
 
+from .scene_detector import SceneDetector
+
+# Import orjson secara opsional (faster ffprobe output parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Cuts starting this close to a keyframe are snapped to it and stream-copied
+KEYFRAME_SNAP_TOLERANCE = 0.2
+
 class VideoProcessor:
     """
     Core FFmpeg video processing operations
     """
     
-    def __init__(self, temp_manager):
+    def __init__(self, temp_manager, scene_frame_step: int = 1):
         self.temp_manager = temp_manager
+        self.logger = logging.getLogger(__name__)  # Used by the detection below
         self.ffmpeg_path = self._detect_ffmpeg()
         self.ffprobe_path = self._detect_ffprobe()
-        self.logger = logging.getLogger(__name__)
+        self._build_command_templates()
+        
+        # Shared scene detector; scene_frame_step is its frame_step
+        self.scene_detector = SceneDetector(
+            temp_manager, frame_step=scene_frame_step, ffprobe_path=self.ffprobe_path
+        )
+        
+        # Keyframe lists per input (path:mtime:size); trims run on several threads.
+        # The lock only guards the dict, each probe runs outside it
+        self._keyframe_cache: Dict[str, Future] = {}
+        self._keyframe_lock = threading.Lock()
+    
+    def _build_command_templates(self):
+        """
+        Build the fixed part of each ffmpeg command once
+        
+        None marks a slot filled per call by _command; everything else is
+        shared between calls.
+        """
+        self._trim_copy_cmd = self._template(
+            self.ffmpeg_path,
+            '-ss', None,             # Start time
+            '-i', None,              # Input file
+            '-t', None,              # Duration
+            '-c', 'copy',            # Copy streams (fast, no re-encoding)
+            '-avoid_negative_ts', 'make_zero',
+            '-y',                    # Overwrite output
+            None                     # Output file
+        )
+        self._trim_encode_cmd = self._template(
+            self.ffmpeg_path,
+            '-ss', None,
+            '-i', None,
+            '-t', None,
+            '-c:v', 'libx264',       # Re-encode for a frame-accurate start
+            '-preset', 'veryfast',
+            '-crf', '18',
+            '-c:a', 'aac',
+            '-threads', None,        # Encoder threads (0 = ffmpeg default)
+            '-y',
+            None
+        )
+        self._extract_audio_cmd = self._template(
+            self.ffmpeg_path,
+            '-i', None,
+            '-vn',  # No video
+            '-acodec', 'pcm_s16le',  # Uncompressed audio for analysis
+            '-ar', '44100',          # Sample rate
+            '-ac', '2',              # Stereo
+            '-y',
+            None
+        )
+        self._concat_cmd = self._template(
+            self.ffmpeg_path,
+            '-f', 'concat',
+            '-safe', '0',            # Allow absolute paths in the list
+            '-i', None,
+            '-c', 'copy',            # Cuts share codecs (see cut_clips), no re-encoding
+            '-y',
+            None
+        )
+    
+    @staticmethod
+    def _template(*argv) -> Tuple[List, Tuple[int, ...]]:
+        """Command template: (argv with None slots, indices of the slots)"""
+        return list(argv), tuple(i for i, arg in enumerate(argv) if arg is None)
+    
+    @staticmethod
+    def _command(template: Tuple[List, Tuple[int, ...]], *values) -> List[str]:
+        """Copy a command template and fill its slots in order"""
+        argv, slots = template
+        cmd = argv[:]
+        for i, value in zip(slots, values):
+            cmd[i] = value
+        return cmd
     
     def _detect_ffmpeg(self) -> str:
         """Auto-detect FFmpeg installation"""
@@ -71,7 +163,8 @@ class VideoProcessor:
             if result.returncode != 0:
                 raise RuntimeError(f"FFprobe failed: {result.stderr}")
             
-            info = json.loads(result.stdout)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            info = orjson.loads(result.stdout) if ORJSON_AVAILABLE else json.loads(result.stdout)
             
             # Extract useful information
             video_stream = next((s for s in info['streams'] if s['codec_type'] == 'video'), None)
@@ -95,14 +188,129 @@ class VideoProcessor:
         except subprocess.TimeoutExpired:
             raise RuntimeError("Video analysis timed out")
     
-    def trim_video(self, input_path: str, start_time: float, end_time: float) -> str:
+    def _get_keyframe_times(self, input_path: str) -> List[float]:
+        """
+        Sorted video keyframe timestamps, cached per input file
+        
+        Safe to call from several threads: the first caller for an input
+        probes while later callers for the same input wait for its result;
+        other inputs are not held up. Returns an empty list if the input
+        cannot be probed.
+        """
+        try:
+            stat = os.stat(input_path)
+        except OSError:
+            return []
+        
+        # Key includes mtime/size so an edited file is probed again
+        key = f"{os.path.abspath(input_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        
+        with self._keyframe_lock:
+            future = self._keyframe_cache.get(key)
+            owner = future is None
+            if owner:
+                future = self._keyframe_cache[key] = Future()
+        
+        if owner:
+            try:
+                future.set_result(self._load_keyframe_times(input_path, key))
+            except BaseException as e:
+                # Let the next caller try again instead of caching the failure
+                with self._keyframe_lock:
+                    self._keyframe_cache.pop(key, None)
+                future.set_exception(e)
+                raise
+        return future.result()
+    
+    def _load_keyframe_times(self, input_path: str, key: str) -> List[float]:
+        """Read keyframes from the on-disk cache, probing with ffprobe on a miss"""
+        # Cached times are relative to the container start (see below)
+        cache_file = self.temp_manager.get_cache_file(
+            'keyframes_rel_' + hashlib.md5(key.encode('utf-8')).hexdigest()
+        )
+        
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r') as f:
+                return [float(line) for line in f.read().split()]
+        
+        # Packet flags only - no decoding needed. Rows are prefixed with their
+        # section name: "packet,<pts_time>,<flags>" and "format,<start_time>"
+        cmd = [
+            self.ffprobe_path, '-v', 'error', '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time,flags:format=start_time', '-of', 'csv=p=1',
+            input_path
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Keyframe probe timed out: {input_path}")
+            return []
+        
+        if result.returncode != 0:
+            self.logger.warning(f"Keyframe probe failed: {result.stderr}")
+            return []
+        
+        keyframes = []
+        start_time = 0.0
+        for line in result.stdout.splitlines():
+            section, _, fields = line.partition(',')
+            if section == 'packet':
+                pts_time, _, flags = fields.partition(',')
+                if 'K' in flags and pts_time not in ('', 'N/A'):
+                    keyframes.append(float(pts_time))
+            elif section == 'format' and fields not in ('', 'N/A'):
+                start_time = float(fields)
+        
+        # Input -ss counts from the container start, packet times do not
+        # (e.g. MPEG-TS files rarely start at 0)
+        keyframes = sorted(t - start_time for t in keyframes)
+        
+        # Write to a temp file and rename so a reader never sees a partial list
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write('\n'.join(repr(t) for t in keyframes))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not cache keyframes: {e}")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        
+        return keyframes
+    
+    def _nearest_keyframe(self, input_path: str, time: float) -> Optional[float]:
+        """Keyframe within KEYFRAME_SNAP_TOLERANCE of time, or None"""
+        keyframes = self._get_keyframe_times(input_path)
+        if not keyframes:
+            return None
+        
+        i = bisect.bisect_left(keyframes, time)
+        candidates = keyframes[max(i - 1, 0):i + 1]
+        nearest = min(candidates, key=lambda kf: abs(kf - time))
+        
+        if abs(nearest - time) <= KEYFRAME_SNAP_TOLERANCE:
+            return nearest
+        return None
+    
+    def trim_video(self, input_path: str, start_time: float, end_time: float,
+                   stream_copy: Optional[bool] = None, threads: int = 0) -> str:
         """
         Trim video intro/outro - returns temp file path
         
+        By default cuts starting on (or near) a keyframe are stream-copied and
+        others are re-encoded so the cut starts on the exact frame. Clips that
+        will be concatenated must all use the same mode (see cut_clips).
+        
         Args:
             input_path: Path to input video
             start_time: Start time in seconds
             end_time: End time in seconds
+            stream_copy: Force stream copy (True) or re-encoding (False);
+                None decides per clip
+            threads: Encoder threads when re-encoding (0 = ffmpeg default)
             
         Returns:
             Path to trimmed video file
@@ -113,16 +321,19 @@ class VideoProcessor:
         if duration <= 0:
             raise ValueError("Invalid trim times: end_time must be greater than start_time")
         
-        cmd = [
-            self.ffmpeg_path,
-            '-ss', str(start_time),  # Start time
-            '-i', input_path,        # Input file
-            '-t', str(duration),     # Duration
-            '-c', 'copy',            # Copy streams (fast, no re-encoding)
-            '-avoid_negative_ts', 'make_zero',
-            '-y',                    # Overwrite output
-            output_path
-        ]
+        keyframe = self._nearest_keyframe(input_path, start_time) if stream_copy is not False else None
+        if stream_copy is None:
+            stream_copy = keyframe is not None
+        
+        if stream_copy:
+            if keyframe is not None:
+                start_time = keyframe
+                duration = end_time - keyframe
+            cmd = self._command(self._trim_copy_cmd, str(start_time), input_path,
+                                str(duration), output_path)
+        else:
+            cmd = self._command(self._trim_encode_cmd, str(start_time), input_path,
+                                str(duration), str(threads), output_path)
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
@@ -142,16 +353,7 @@ class VideoProcessor:
         """Extract audio track from video"""
         output_path = self.temp_manager.get_temp_file('_audio.wav')
         
-        cmd = [
-            self.ffmpeg_path,
-            '-i', input_path,
-            '-vn',  # No video
-            '-acodec', 'pcm_s16le',  # Uncompressed audio for analysis
-            '-ar', '44100',          # Sample rate
-            '-ac', '2',              # Stereo
-            '-y',
-            output_path
-        ]
+        cmd = self._command(self._extract_audio_cmd, input_path, output_path)
         
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
@@ -164,6 +366,130 @@ class VideoProcessor:
         except subprocess.TimeoutExpired:
             raise RuntimeError("Audio extraction timed out")
 
+    def create_random_cuts(self, input_path: str, scene_data: List[Dict],
+                           min_duration: float = 3.0, max_duration: float = 7.0) -> List[str]:
+        """
+        Cut one random clip out of each scene
+        
+        Args:
+            input_path: Path to input video
+            scene_data: Scene dictionaries with 'start' and 'end' times
+            min_duration: Minimum cut duration
+            max_duration: Maximum cut duration
+            
+        Returns:
+            Paths to the cut clips, in scene order
+        """
+        windows = []
+        for scene in scene_data:
+            scene_duration = scene['end'] - scene['start']
+            
+            # Skip scenes that are too short
+            if scene_duration < min_duration:
+                continue
+            
+            cut_duration = random.uniform(min_duration, min(max_duration, scene_duration))
+            cut_start = random.uniform(scene['start'], scene['end'] - cut_duration)
+            windows.append((cut_start, cut_start + cut_duration))
+        
+        cuts = self.cut_clips(input_path, windows)
+        
+        self.logger.info(f"Created {len(cuts)} random cuts")
+        return cuts
+    
+    def can_stream_copy(self, input_path: str, windows: List[Tuple[float, float]]) -> bool:
+        """
+        Check whether every clip in a sequence can be stream-copied
+        
+        Args:
+            input_path: Path to input video
+            windows: (start, end) times of the clips
+            
+        Returns:
+            True if every clip starts near a keyframe
+        """
+        return all(
+            self._nearest_keyframe(input_path, start) is not None for start, _ in windows
+        )
+    
+    def cut_clips(self, input_path: str, windows: List[Tuple[float, float]]) -> List[str]:
+        """
+        Trim several clips out of one input for compile_zigzag_sequence
+        
+        The concat demuxer needs every clip to share codecs and parameters, so
+        the mode is chosen once: stream copy only if every clip starts near a
+        keyframe, otherwise every clip is re-encoded with the same settings.
+        
+        Args:
+            input_path: Path to input video
+            windows: (start, end) times of the clips
+            
+        Returns:
+            Paths to the clips, in window order
+        """
+        if not windows:
+            return []
+        
+        # Probes the keyframes once, before any worker needs them
+        stream_copy = self.can_stream_copy(input_path, windows)
+        
+        # Each trim is its own ffmpeg process, so threads are enough to run them side by side;
+        # parallel encodes share the cores instead of each using all of them
+        cpu_count = os.cpu_count() or 1
+        workers = min(cpu_count, len(windows))
+        threads = 0 if stream_copy else max(1, cpu_count // workers)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda window: self.trim_video(input_path, window[0], window[1],
+                                               stream_copy=stream_copy, threads=threads),
+                windows
+            ))
+    
+    def compile_zigzag_sequence(self, cuts_list: List[str]) -> str:
+        """
+        Concatenate cut clips into a single video
+        
+        Args:
+            cuts_list: Paths to the cut clips, already in zigzag order
+            
+        Returns:
+            Path to compiled video file
+        """
+        if not cuts_list:
+            raise ValueError("No cuts to compile")
+        
+        list_path = self.temp_manager.get_temp_file('_concat.txt')
+        output_path = self.temp_manager.get_temp_file('_zigzag.mp4')
+        
+        # Concat demuxer list: absolute paths, single quotes escaped as '\''
+        lines = []
+        for cut_path in cuts_list:
+            escaped = os.path.abspath(cut_path).replace("'", "'\\''")
+            lines.append(f"file '{escaped}'\n")
+        
+        # Build the whole list in memory and hand it to the OS in one write
+        data = memoryview(''.join(lines).encode('utf-8'))
+        fd = os.open(list_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        
+        cmd = self._command(self._concat_cmd, list_path, output_path)
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            if result.returncode != 0:
+                raise RuntimeError(f"Zigzag compilation failed: {result.stderr}")
+            
+            self.logger.info(f"Compiled {len(cuts_list)} cuts into zigzag sequence")
+            return output_path
+            
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("Zigzag compilation timed out")
+
 # Test the video_processor
 if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
@@ -19,8 +19,12 @@ class EditorTab:
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
         
+        # Pending after() jobs by name, cancelled when the tab is destroyed
+        self._pending_jobs: Dict[str, str] = {}
+        
         # Create main frame
         self.frame = self.theme_manager.create_custom_frame(parent, padding=10)
+        self.frame.bind('<Destroy>', self._on_destroy)
         
         # Setup UI components
         self.setup_input_section()
@@ -30,6 +34,18 @@ class EditorTab:
         
         self.logger.info("EditorTab initialized")
     
+    def _on_destroy(self, event):
+        """Cancel scheduled callbacks so they never fire on dead widgets"""
+        if event.widget is not self.frame:
+            return
+        
+        for job_id in self._pending_jobs.values():
+            try:
+                self.frame.after_cancel(job_id)
+            except tk.TclError:
+                pass
+        self._pending_jobs.clear()
+    
     def setup_input_section(self):
         """Setup input file/URL section"""
         input_frame = self.theme_manager.create_custom_frame(self.frame, padding=5)
@@ -63,8 +79,13 @@ class EditorTab:
         )
         self.url_btn.pack(side='left', padx=(0, 5))
         
-        # URL entry (hidden by default)
+        # URL entry (hidden by default). Shown as a place()d overlay on the
+        # free right-hand side of the button row so toggling it never
+        # re-runs pack layout for the rest of the section.
         self.url_frame = self.theme_manager.create_custom_frame(input_frame)
+        self._url_frame_place = {
+            'in_': button_frame, 'relx': 1.0, 'rely': 0.5, 'anchor': 'e'
+        }
         
         url_label = self.theme_manager.create_custom_label(self.url_frame, "URL:")
         url_label.pack(side='left', padx=(0, 5))
@@ -123,11 +144,11 @@ class EditorTab:
         intro_label = self.theme_manager.create_custom_label(intro_frame, "Trim Intro:")
         intro_label.pack(side='left', padx=(0, 5))
         
-        self.intro_var = tk.DoubleVar(value=0.0)
+        self.intro_var = tk.IntVar(value=0)
         intro_scale = self.theme_manager.create_custom_scale(
             intro_frame,
             from_=0, to=60, variable=self.intro_var,
-            orient='horizontal', length=200
+            orient='horizontal', length=200, resolution=1
         )
         intro_scale.pack(side='left', padx=(0, 5))
         
@@ -141,11 +162,11 @@ class EditorTab:
         outro_label = self.theme_manager.create_custom_label(outro_frame, "Trim Outro:")
         outro_label.pack(side='left', padx=(0, 5))
         
-        self.outro_var = tk.DoubleVar(value=180.0)
+        self.outro_var = tk.IntVar(value=180)
         outro_scale = self.theme_manager.create_custom_scale(
             outro_frame,
             from_=0, to=300, variable=self.outro_var,
-            orient='horizontal', length=200
+            orient='horizontal', length=200, resolution=1
         )
         outro_scale.pack(side='left', padx=(0, 5))
         
@@ -159,14 +180,27 @@ class EditorTab:
         silent_label = self.theme_manager.create_custom_label(silent_frame, "Silent Threshold:")
         silent_label.pack(side='left', padx=(0, 5))
         
-        self.threshold_var = tk.DoubleVar(value=-40.0)
+        self.threshold_var = tk.IntVar(value=-40)
+        self.committed_threshold = -40
         threshold_scale = self.theme_manager.create_custom_scale(
             silent_frame,
             from_=-60, to=-20, variable=self.threshold_var,
-            orient='horizontal', length=200
+            orient='horizontal', length=200, resolution=1,
+            command=lambda value: self._debounce('threshold', 120, self.commit_threshold)
         )
         threshold_scale.pack(side='left', padx=(0, 5))
         
+        # Typed entry commits once on Enter/focus loss instead of per drag step
+        threshold_spinbox = self.theme_manager.create_custom_spinbox(
+            silent_frame,
+            from_=-60, to=-20, increment=1,
+            textvariable=self.threshold_var, width=6,
+            command=self.commit_threshold
+        )
+        threshold_spinbox.bind('<Return>', self.commit_threshold)
+        threshold_spinbox.bind('<FocusOut>', self.commit_threshold)
+        threshold_spinbox.pack(side='left', padx=(0, 5))
+        
         self.threshold_label = self.theme_manager.create_custom_label(silent_frame, "-40dB")
         self.threshold_label.pack(side='left')
     
@@ -316,9 +350,11 @@ class EditorTab:
     def show_url_dialog(self):
         """Show URL input dialog"""
         if self.url_frame.winfo_ismapped():
-            self.url_frame.pack_forget()
+            self.url_frame.place_forget()
         else:
-            self.url_frame.pack(fill='x', pady=5)
+            self.url_frame.place(**self._url_frame_place)
+            self.url_frame.lift()
+            self.url_entry.focus_set()
     
     def download_url(self):
         """Download video from URL"""
@@ -363,26 +399,44 @@ class EditorTab:
         self.logger.info("Starting processing")
         messagebox.showinfo("Processing", "Starting video processing...")
     
+    def _debounce(self, name: str, delay_ms: int, callback):
+        """Run callback once after delay_ms, restarting the timer on each call"""
+        job_id = self._pending_jobs.pop(name, None)
+        if job_id is not None:
+            self.frame.after_cancel(job_id)
+        
+        def run():
+            self._pending_jobs.pop(name, None)
+            callback()
+        
+        self._pending_jobs[name] = self.frame.after(delay_ms, run)
+    
+    def commit_threshold(self, event=None):
+        """Validate and apply the silent threshold value"""
+        try:
+            threshold = min(max(self.threshold_var.get(), -60), -20)
+        except tk.TclError:
+            # Non-numeric text typed into the spinbox
+            threshold = self.committed_threshold
+        
+        self.threshold_var.set(threshold)
+        if threshold != self.committed_threshold:
+            self.committed_threshold = threshold
+            self.logger.debug(f"Silent threshold set to {threshold}dB")
+        self.threshold_label.config(text=f"{threshold}dB")
+    
     def update_time_labels(self):
         """Update time display labels"""
         # Update intro time
-        intro_time = self.intro_var.get()
-        minutes = int(intro_time // 60)
-        seconds = int(intro_time % 60)
+        minutes, seconds = divmod(self.intro_var.get(), 60)
         self.intro_time_label.config(text=f"{minutes:02d}:{seconds:02d}")
         
         # Update outro time
-        outro_time = self.outro_var.get()
-        minutes = int(outro_time // 60)
-        seconds = int(outro_time % 60)
+        minutes, seconds = divmod(self.outro_var.get(), 60)
         self.outro_time_label.config(text=f"{minutes:02d}:{seconds:02d}")
         
-        # Update threshold label
-        threshold = self.threshold_var.get()
-        self.threshold_label.config(text=f"{threshold:.0f}dB")
-        
         # Schedule next update
-        self.frame.after(100, self.update_time_labels)
+        self._pending_jobs['time_labels'] = self.frame.after(100, self.update_time_labels)
 
 # Test the editor tab
 if __name__ == "__main__":
@@ -412,8 +466,11 @@ if __name__ == "__main__":
         def create_custom_combobox(self, parent, values=None, width=None):
             return ttk.Combobox(parent, values=values, width=width)
         
-        def create_custom_scale(self, parent, from_=0, to=100, variable=None, orient='horizontal', length=200):
-            return ttk.Scale(parent, from_=from_, to=to, variable=variable, orient=orient, length=length)
+        def create_custom_scale(self, parent, from_=0, to=100, variable=None, orient='horizontal', length=200, resolution=None, command=None):
+            return ttk.Scale(parent, from_=from_, to=to, variable=variable, orient=orient, length=length, command=command)
+        
+        def create_custom_spinbox(self, parent, from_=0, to=100, increment=1, textvariable=None, width=None, command=None):
+            return ttk.Spinbox(parent, from_=from_, to=to, increment=increment, textvariable=textvariable, width=width, command=command)
         
         def create_custom_checkbutton(self, parent, text, variable=None):
             return ttk.Checkbutton(parent, text=text, variable=variable)
@@ -4,111 +4,204 @@ Theme management for Purple Blackhole theme
 """
 import tkinter as tk
 from tkinter import ttk
-import json
-import os
 import logging
-from typing import Dict, Any, Optional
+import weakref
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, Callable
+
+# Import orjson secara opsional (faster theme serialization)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Tcl script for the base ttk styles, built once per process; only the
+# theme colors are filled in per configure pass, each quoted with
+# _tcl_quote (Tcl braces are doubled)
+STYLE_SCRIPT_TEMPLATE = "\n".join([
+    # Configure root window
+    "ttk::style configure TFrame -background {bg_primary}",
+    "ttk::style configure TLabel -background {bg_primary} -foreground {text_primary}",
+    "ttk::style configure TButton -background {accent_primary} "
+    "-foreground {text_primary} -padding {{12 8}}",
+    "ttk::style map TButton -background {{active {hover}}}",
+    
+    # Configure notebook (tabs)
+    "ttk::style configure TNotebook -background {bg_primary} -borderwidth 0",
+    "ttk::style configure TNotebook.Tab -background {bg_secondary} "
+    "-foreground {text_primary} -padding {{12 8}}",
+    "ttk::style map TNotebook.Tab -background {{selected {accent_primary} active {hover}}}",
+    
+    # Configure progress bar
+    "ttk::style configure TProgressbar -background {accent_primary} "
+    "-troughcolor {bg_secondary}",
+    
+    # Configure scale (slider)
+    "ttk::style configure TScale -background {bg_primary} -troughcolor {bg_secondary} "
+    "-lightcolor {accent_primary} -darkcolor {accent_secondary}",
+    
+    # Configure entry
+    "ttk::style configure TEntry -fieldbackground {bg_secondary} "
+    "-foreground {text_primary} -borderwidth 1",
+    
+    # Configure combobox
+    "ttk::style configure TCombobox -fieldbackground {bg_secondary} "
+    "-foreground {text_primary} -background {accent_primary}",
+    
+    # Configure checkbutton
+    "ttk::style configure TCheckbutton -background {bg_primary} -foreground {text_primary}",
+    
+    # Configure radiobutton
+    "ttk::style configure TRadiobutton -background {bg_primary} -foreground {text_primary}",
+])
+
+# Backslash-quoting makes any value a single Tcl word, also inside {...} lists
+_TCL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+_TCL_SPECIAL = frozenset(' \\[]{}"$;#')
+
+def _tcl_quote(value) -> str:
+    """Quote a theme value so Tcl sees it as one literal word (no substitution)"""
+    text = str(value)
+    if not text:
+        return '{}'
+    return ''.join(
+        _TCL_ESCAPES.get(ch) or ('\\' + ch if ch in _TCL_SPECIAL else ch)
+        for ch in text
+    )
+
+class _ColorTable(dict):
+    """Color lookup table that answers unknown names with black"""
+    
+    def __missing__(self, key):
+        return '#000000'
 
 class ThemeManager:
     """
     Manages application themes and styling
     """
     
+    # Style names already configured by configure_styles()
+    BASE_STYLES = frozenset({
+        'TFrame', 'TLabel', 'TButton', 'TNotebook', 'TProgressbar', 'TScale',
+        'TEntry', 'TCombobox', 'TCheckbutton', 'TRadiobutton'
+    })
+    
+    # Default Purple Blackhole theme
+    DEFAULT_THEME = MappingProxyType({
+        'name': 'Purple Blackhole',
+        'bg_primary': '#1a0d26',      # Deep purple-black
+        'bg_secondary': '#2d1b3d',    # Lighter purple-black
+        'accent_primary': '#6b46c1',  # Purple
+        'accent_secondary': '#a855f7', # Light purple
+        'accent_tertiary': '#ec4899',  # Pink-purple
+        'text_primary': '#f8fafc',     # Light gray
+        'text_secondary': '#cbd5e1',   # Medium gray
+        'border': '#4c1d95',          # Purple border
+        'hover': '#7c3aed',           # Hover purple
+        'success': '#10b981',         # Green
+        'error': '#ef4444',           # Red
+        'warning': '#f59e0b'          # Orange
+    })
+    
+    # Shared immutable defaults for the widget factories
+    DEFAULT_LABEL_FONT = ('Arial', 10)
+    NO_VALUES = ()
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.current_theme = self.config.get('theme', {})
         
         # Setup logger terlebih dahulu
-        self.logger = logging.getLogger(__name__)
-        
-        # Default Purple Blackhole theme
-        self.default_theme = {
-            'name': 'Purple Blackhole',
-            'bg_primary': '#1a0d26',      # Deep purple-black
-            'bg_secondary': '#2d1b3d',    # Lighter purple-black
-            'accent_primary': '#6b46c1',  # Purple
-            'accent_secondary': '#a855f7', # Light purple
-            'accent_tertiary': '#ec4899',  # Pink-purple
-            'text_primary': '#f8fafc',     # Light gray
-            'text_secondary': '#cbd5e1',   # Medium gray
-            'border': '#4c1d95',          # Purple border
-            'hover': '#7c3aed',           # Hover purple
-            'success': '#10b981',         # Green
-            'error': '#ef4444',           # Red
-            'warning': '#f59e0b'          # Orange
-        }
+        self.logger = logger
+        
+        # Default Purple Blackhole theme (shared, read-only)
+        self.default_theme = self.DEFAULT_THEME
         
         # Merge with config theme
-        self.theme = {**self.default_theme, **self.current_theme}
+        self._set_theme(self.current_theme)
         
         # Configure styles
         self.style = ttk.Style()
+        self._configured_styles: set = set()
+        self._applied_roots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         self.configure_styles()
         
         self.logger.info("ThemeManager initialized")
     
     def configure_styles(self):
         """Configure ttk styles with theme colors"""
-        # Configure root window
-        self.style.configure('TFrame', background=self.theme['bg_primary'])
-        self.style.configure('TLabel', background=self.theme['bg_primary'], 
-                           foreground=self.theme['text_primary'])
-        self.style.configure('TButton', background=self.theme['accent_primary'],
-                           foreground=self.theme['text_primary'])
-        self.style.map('TButton', 
-                     background=[('active', self.theme['hover'])])
-        
-        # Configure notebook (tabs)
-        self.style.configure('TNotebook', background=self.theme['bg_primary'],
-                           borderwidth=0)
-        self.style.configure('TNotebook.Tab', background=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           padding=[12, 8])
-        self.style.map('TNotebook.Tab',
-                     background=[('selected', self.theme['accent_primary']),
-                               ('active', self.theme['hover'])])
-        
-        # Configure progress bar
-        self.style.configure('TProgressbar', background=self.theme['accent_primary'],
-                           troughcolor=self.theme['bg_secondary'])
-        
-        # Configure scale (slider)
-        self.style.configure('TScale', background=self.theme['bg_primary'],
-                           troughcolor=self.theme['bg_secondary'],
-                           lightcolor=self.theme['accent_primary'],
-                           darkcolor=self.theme['accent_secondary'])
-        
-        # Configure entry
-        self.style.configure('TEntry', fieldbackground=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           borderwidth=1)
-        
-        # Configure combobox
-        self.style.configure('TCombobox', fieldbackground=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           background=self.theme['accent_primary'])
-        
-        # Configure checkbutton
-        self.style.configure('TCheckbutton', background=self.theme['bg_primary'],
-                           foreground=self.theme['text_primary'])
-        
-        # Configure radiobutton
-        self.style.configure('TRadiobutton', background=self.theme['bg_primary'],
-                           foreground=self.theme['text_primary'])
+        # One interpreter round-trip instead of one per configure/map call
+        # Values come from config/theme files, so quote them before they reach Tcl
+        quoted = {key: _tcl_quote(value) for key, value in self.theme.items()}
+        self.style.tk.eval(STYLE_SCRIPT_TEMPLATE.format_map(quoted))
+        
+        # Custom styles must pick up the new colors on their next use
+        self._configured_styles = set(self.BASE_STYLES)
+    
+    def _ensure_style(self, style: str, configurator: Callable[[], None]):
+        """
+        Run a style configurator only the first time a style name is used
+        
+        Args:
+            style: Style name
+            configurator: Callable issuing the style configure/map calls
+        """
+        if style not in self._configured_styles:
+            configurator()
+            self._configured_styles.add(style)
+    
+    @property
+    def theme(self) -> MappingProxyType:
+        """Current theme colors (read-only; use load_theme/reset_to_default)"""
+        return self._theme_view
+    
+    def _set_theme(self, overrides: Dict[str, Any]):
+        """
+        Replace the theme with the defaults plus overrides
+        
+        This is the only place the theme changes, so the derived lookups
+        below can never go stale.
+        
+        Args:
+            overrides: Theme values that take precedence over the defaults
+        """
+        theme = self.default_theme.copy()
+        theme.update(overrides)
+        self._theme = theme
+        self._theme_view = MappingProxyType(theme)
+        # Mirror theme colors as attributes, e.g. ``self.colors.bg_primary``
+        self.colors = SimpleNamespace(**theme)
+        # Shadow get_color with a C-level dict lookup (no Python frame)
+        self.get_color = _ColorTable(theme).__getitem__
+        self._is_default_cached = theme == self.default_theme
     
     def get_color(self, color_name: str) -> str:
-        """Get a theme color by name"""
-        return self.theme.get(color_name, '#000000')
+        """Get a theme color by name (instances bind a faster equivalent)"""
+        return getattr(self.colors, color_name, '#000000')
     
     def apply_theme(self, root: tk.Tk):
         """Apply theme to root window"""
-        root.configure(bg=self.theme['bg_primary'])
+        c = self.colors
+        signature = (c.bg_primary, c.text_primary, c.accent_primary)
         
-        # Configure standard widgets
-        root.option_add('*background', self.theme['bg_primary'])
-        root.option_add('*foreground', self.theme['text_primary'])
-        root.option_add('*selectBackground', self.theme['accent_primary'])
-        root.option_add('*selectForeground', self.theme['text_primary'])
+        # Nothing to do if this root already has these colors
+        if self._applied_roots.get(root) == signature:
+            return
+        
+        bg, fg, select_bg = (_tcl_quote(color) for color in signature)
+        root.tk.eval("\n".join([
+            f"{root} configure -background {bg}",
+            
+            # Configure standard widgets
+            f"option add *background {bg}",
+            f"option add *foreground {fg}",
+            f"option add *selectBackground {select_bg}",
+            f"option add *selectForeground {fg}",
+        ]))
+        self._applied_roots[root] = signature
     
     def create_custom_frame(self, parent, style: str = 'TFrame', padding: int = 0) -> ttk.Frame:
         """
@@ -160,11 +253,14 @@ class ThemeManager:
             Styled button widget
         """
         # Define custom button style
-        self.style.configure(style, background=self.theme['accent_primary'],
-                           foreground=self.theme['text_primary'],
-                           padding=[12, 8])
-        self.style.map(style,
-                     background=[('active', self.theme['hover'])])
+        def configure():
+            c = self.colors
+            self.style.configure(style, background=c.accent_primary,
+                               foreground=c.text_primary,
+                               padding=[12, 8])
+            self.style.map(style,
+                         background=[('active', c.hover)])
+        self._ensure_style(style, configure)
         
         button = ttk.Button(parent, text=text, command=command, style=style)
         
@@ -187,7 +283,7 @@ class ThemeManager:
             Styled label widget
         """
         return ttk.Label(parent, text=text, 
-                        font=font or ('Arial', 10))
+                        font=font or self.DEFAULT_LABEL_FONT)
     
     def create_custom_progressbar(self, parent, style: str = 'TProgressbar', 
                                 variable=None, length: int = 200) -> ttk.Progressbar:
@@ -204,14 +300,16 @@ class ThemeManager:
             Styled progress bar widget
         """
         # Define custom progress bar style
-        self.style.configure(style, background=self.theme['accent_primary'],
-                           troughcolor=self.theme['bg_secondary'])
+        self._ensure_style(style, lambda: self.style.configure(
+            style, background=self.colors.accent_primary,
+            troughcolor=self.colors.bg_secondary))
         
         return ttk.Progressbar(parent, style=style, variable=variable, length=length)
     
     def create_custom_scale(self, parent, style: str = 'TScale', 
                           from_=0, to=100, variable=None, 
-                          orient='horizontal', length=200) -> ttk.Scale:
+                          orient='horizontal', length=200,
+                          resolution: float = None, command=None) -> ttk.Scale:
         """
         Create a custom styled scale/slider
         
@@ -223,18 +321,68 @@ class ThemeManager:
             variable: Variable to bind to scale
             orient: Orientation ('horizontal' or 'vertical')
             length: Length of scale in pixels
+            resolution: Optional step the value snaps to (ttk.Scale has no
+                native resolution option)
+            command: Optional callback invoked with the new value
             
         Returns:
             Styled scale widget
         """
         # Define custom scale style
-        self.style.configure(style, background=self.theme['bg_primary'],
-                           troughcolor=self.theme['bg_secondary'],
-                           lightcolor=self.theme['accent_primary'],
-                           darkcolor=self.theme['accent_secondary'])
+        self._ensure_style(style, lambda: self.style.configure(
+            style, background=self.colors.bg_primary,
+            troughcolor=self.colors.bg_secondary,
+            lightcolor=self.colors.accent_primary,
+            darkcolor=self.colors.accent_secondary))
+        
+        scale = ttk.Scale(parent, style=style, from_=from_, to=to, 
+                         variable=variable, orient=orient, length=length)
+        
+        if resolution and variable is not None:
+            # Snap dragged values so integer variables never see a fraction
+            def snap(value):
+                variable.set(round(float(value) / resolution) * resolution)
+                if command:
+                    command(value)
+            scale.configure(command=snap)
+        elif command:
+            scale.configure(command=command)
+        
+        return scale
+    
+    def create_custom_spinbox(self, parent, style: str = 'TSpinbox',
+                            from_=0, to=100, increment=1, textvariable=None,
+                            width: int = None, command=None) -> ttk.Spinbox:
+        """
+        Create a custom styled spinbox
+        
+        Args:
+            parent: Parent widget
+            style: Style name for the spinbox
+            from_: Minimum value
+            to: Maximum value
+            increment: Step applied by the arrow buttons
+            textvariable: Variable to bind to spinbox
+            width: Spinbox width in characters
+            command: Callback invoked when an arrow button is pressed
+            
+        Returns:
+            Styled spinbox widget
+        """
+        # Define custom spinbox style
+        self._ensure_style(style, lambda: self.style.configure(
+            style, fieldbackground=self.colors.bg_secondary,
+            foreground=self.colors.text_primary,
+            background=self.colors.accent_primary))
+        
+        spinbox = ttk.Spinbox(parent, style=style, from_=from_, to=to,
+                              increment=increment, textvariable=textvariable,
+                              command=command)
         
-        return ttk.Scale(parent, style=style, from_=from_, to=to, 
-                        variable=variable, orient=orient, length=length)
+        if width:
+            spinbox.configure(width=width)
+        
+        return spinbox
     
     def create_custom_entry(self, parent, style: str = 'TEntry', 
                           width: int = None) -> ttk.Entry:
@@ -250,9 +398,10 @@ class ThemeManager:
             Styled entry widget
         """
         # Define custom entry style
-        self.style.configure(style, fieldbackground=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           borderwidth=1)
+        self._ensure_style(style, lambda: self.style.configure(
+            style, fieldbackground=self.colors.bg_secondary,
+            foreground=self.colors.text_primary,
+            borderwidth=1))
         
         entry = ttk.Entry(parent, style=style)
         
@@ -276,11 +425,12 @@ class ThemeManager:
             Styled combobox widget
         """
         # Define custom combobox style
-        self.style.configure(style, fieldbackground=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           background=self.theme['accent_primary'])
+        self._ensure_style(style, lambda: self.style.configure(
+            style, fieldbackground=self.colors.bg_secondary,
+            foreground=self.colors.text_primary,
+            background=self.colors.accent_primary))
         
-        combobox = ttk.Combobox(parent, values=values or [], style=style)
+        combobox = ttk.Combobox(parent, values=values or self.NO_VALUES, style=style)
         
         if width:
             combobox.configure(width=width)
@@ -299,14 +449,18 @@ class ThemeManager:
             Styled notebook widget
         """
         # Define custom notebook style
-        self.style.configure(style, background=self.theme['bg_primary'],
-                           borderwidth=0)
-        self.style.configure(f'{style}.Tab', background=self.theme['bg_secondary'],
-                           foreground=self.theme['text_primary'],
-                           padding=[12, 8])
-        self.style.map(f'{style}.Tab',
-                     background=[('selected', self.theme['accent_primary']),
-                               ('active', self.theme['hover'])])
+        def configure():
+            c = self.colors
+            tab_style = f'{style}.Tab'
+            self.style.configure(style, background=c.bg_primary,
+                               borderwidth=0)
+            self.style.configure(tab_style, background=c.bg_secondary,
+                               foreground=c.text_primary,
+                               padding=[12, 8])
+            self.style.map(tab_style,
+                         background=[('selected', c.accent_primary),
+                                   ('active', c.hover)])
+        self._ensure_style(style, configure)
         
         return ttk.Notebook(parent, style=style)
     
@@ -327,17 +481,16 @@ class ThemeManager:
             Styled checkbutton widget
         """
         # Define custom checkbutton style
-        self.style.configure(style, background=self.theme['bg_primary'],
-                           foreground=self.theme['text_primary'])
+        self._ensure_style(style, lambda: self.style.configure(
+            style, background=self.colors.bg_primary,
+            foreground=self.colors.text_primary))
         
         # Create checkbutton with variable support
+        options = {'text': text, 'style': style, **kwargs}
         if variable is not None:
-            checkbutton = ttk.Checkbutton(parent, text=text, style=style, 
-                                        variable=variable, **kwargs)
-        else:
-            checkbutton = ttk.Checkbutton(parent, text=text, style=style, **kwargs)
+            options['variable'] = variable
         
-        return checkbutton
+        return ttk.Checkbutton(parent, **options)
     
     def create_custom_radiobutton(self, parent, text: str, 
                                 style: str = 'TRadiobutton', 
@@ -357,45 +510,56 @@ class ThemeManager:
             Styled radiobutton widget
         """
         # Define custom radiobutton style
-        self.style.configure(style, background=self.theme['bg_primary'],
-                           foreground=self.theme['text_primary'])
+        self._ensure_style(style, lambda: self.style.configure(
+            style, background=self.colors.bg_primary,
+            foreground=self.colors.text_primary))
         
         # Create radiobutton with variable and value support
-        if variable is not None and value is not None:
-            radiobutton = ttk.Radiobutton(parent, text=text, style=style,
-                                        variable=variable, value=value, **kwargs)
-        elif variable is not None:
-            radiobutton = ttk.Radiobutton(parent, text=text, style=style,
-                                        variable=variable, **kwargs)
-        else:
-            radiobutton = ttk.Radiobutton(parent, text=text, style=style, **kwargs)
+        options = {'text': text, 'style': style, **kwargs}
+        if variable is not None:
+            options['variable'] = variable
+            if value is not None:
+                options['value'] = value
         
-        return radiobutton
+        return ttk.Radiobutton(parent, **options)
     
-    def save_theme(self, filepath: str):
-        """Save current theme to file"""
+    def save_theme(self, filepath: str, pretty: bool = False):
+        """Save current theme to file, indented only when pretty is set"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.theme, f, indent=2)
+            if ORJSON_AVAILABLE:
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                with open(filepath, 'wb', buffering=65536) as f:
+                    f.write(orjson.dumps(self._theme, option=option))
+            else:
+                import json
+                
+                with open(filepath, 'w', buffering=65536) as f:
+                    if pretty:
+                        json.dump(self._theme, f, indent=2)
+                    else:
+                        json.dump(self._theme, f, separators=(',', ':'))
             self.logger.info(f"Theme saved to {filepath}")
         except Exception as e:
             self.logger.error(f"Failed to save theme: {e}")
     
     def load_theme(self, filepath: str):
-        """Load theme from file"""
+        """Load theme from file (a missing file is silently ignored)"""
+        import json
+        
         try:
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    loaded_theme = json.load(f)
-                    self.theme = {**self.default_theme, **loaded_theme}
-                    self.configure_styles()
-                self.logger.info(f"Theme loaded from {filepath}")
+            with open(filepath, 'r', buffering=65536) as f:
+                loaded_theme = json.load(f)
+            self._set_theme(loaded_theme)
+            self.configure_styles()
+            self.logger.info(f"Theme loaded from {filepath}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.logger.error(f"Failed to load theme: {e}")
     
     def reset_to_default(self):
         """Reset theme to default"""
-        self.theme = self.default_theme.copy()
+        self._set_theme({})
         self.configure_styles()
         self.logger.info("Theme reset to default")
     
@@ -404,7 +568,7 @@ class ThemeManager:
         return {
             'name': self.theme.get('name', 'Unknown'),
             'colors': self.theme,
-            'is_default': self.theme == self.default_theme
+            'is_default': self._is_default_cached
         }
 
 # Test the theme_manager
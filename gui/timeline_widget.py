@@ -6,15 +6,45 @@ Timeline widget with visual representation of cuts and scenes
 import tkinter as tk
 from tkinter import ttk, Canvas
 import logging
+from collections import namedtuple
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple, Callable
 
+import numpy as np
+
 from core.timeline_manager import TimelineCut, TimelineScene, TimelineManager
+from core import timeline_fast
+
+# Scene label appearance shared by every scene, resolved once per palette
+_SceneStyle = namedtuple('_SceneStyle', 'text_fill font')
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(total_seconds: int) -> str:
+    """Format a whole number of seconds as MM:SS"""
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+def format_time(time_seconds: float) -> str:
+    """Format time as MM:SS"""
+    # Only whole seconds are shown, so cache on those rather than the raw float
+    return _format_whole_seconds(int(time_seconds // 1))
+
+@lru_cache(maxsize=4096)
+def format_duration(duration_seconds: float) -> str:
+    """Format duration as X.Xs"""
+    return f"{duration_seconds:.1f}s"
 
 class TimelineWidget:
     """
     Visual timeline widget for displaying and manipulating cuts and scenes
     """
     
+    # Theme colors used for canvas items, resolved once per update
+    PALETTE_COLORS = (
+        'border', 'text_primary', 'text_secondary',
+        'accent_primary', 'accent_secondary', 'bg_secondary'
+    )
+    
     def __init__(self, parent, timeline_manager: TimelineManager, theme_manager, 
                  width: int = 800, height: int = 200):
         self.parent = parent
@@ -32,18 +62,62 @@ class TimelineWidget:
         self.scroll_position = 0.0
         self.total_duration = 0.0
         self.pixels_per_second = 50.0  # Default zoom level
+        self._scale = self.pixels_per_second * self.zoom_level  # pixels per second at current zoom
         
         # Selection and interaction
         self.selected_cut = None
         self.selected_scene = None
         self.drag_start_x = 0
         self.is_dragging = False
+        self._selected_cuts: Dict[int, TimelineCut] = {}      # cut_id -> cut with selected=True
+        self._selected_scenes: Dict[int, TimelineScene] = {}  # scene_id -> scene with selected=True
+        
+        # Canvas item ids, kept across redraws and updated in place
+        self._cut_items: Dict[int, Tuple[int, int]] = {}    # cut_id -> (rect, label)
+        self._cut_states: Dict[int, str] = {}               # cut_id -> state tag of its rect
+        self._scene_items: Dict[int, Tuple[int, int]] = {}  # scene_id -> (rect, label)
+        self._scene_fills: Dict[int, str] = {}              # scene_id -> current rect fill
+        self._marker_items: Dict[float, Tuple[int, int]] = {}  # marker time -> (line, label)
+        self._marker_geometry: Optional[Tuple[float, int]] = None  # (scale, height) of placed markers
+        self._palette: Dict[str, str] = {}
+        self._last_scrollregion: Optional[Tuple[float, float, float, float]] = None
+        self._scene_style = _SceneStyle(None, ('Arial', 10, 'bold'))
+        self._cut_colors: Dict[str, Tuple[str, str]] = {}  # state tag -> (fill, outline)
+        
+        # Deferred redraw state; bursts of events collapse into one idle redraw
+        self._redraw_pending = False
+        self._full_redraw = False
+        self._dirty_cuts: Dict[int, TimelineCut] = {}
+        self._pending_motion: Optional[Tuple[int, int]] = None
+        self._idle_jobs: Dict[str, str] = {}
+        
+        # Cuts and scenes sorted by start time, as float64 arrays for the
+        # compiled helpers in core.timeline_fast
+        self._cut_order: List[TimelineCut] = []
+        self._cut_starts = np.empty(0, dtype=np.float64)
+        self._cut_ends = np.empty(0, dtype=np.float64)
+        self._cut_ids = np.empty(0, dtype=np.int64)
+        self._scene_order: List[TimelineScene] = []
+        self._scene_starts = np.empty(0, dtype=np.float64)
+        self._scene_ends = np.empty(0, dtype=np.float64)
+        # TimelineManager accepts overlapping cuts; the binary-search helpers
+        # are only used while the intervals are disjoint
+        self._cuts_disjoint = True
+        self._scenes_disjoint = True
+        self._index_valid = False
+        
+        # Time range that currently has canvas items
+        self._visible_t0 = 0.0
+        self._visible_t1 = 0.0
         
         # Callbacks
         self.on_cut_selected: Optional[Callable[[TimelineCut], None]] = None
         self.on_scene_selected: Optional[Callable[[TimelineScene], None]] = None
         self.on_cut_moved: Optional[Callable[[TimelineCut, float], None]] = None
         
+        # Compile the hit-test helpers before the first mouse event
+        timeline_fast.warm_up()
+        
         # Create widget
         self.create_widget()
         
@@ -114,154 +188,386 @@ class TimelineWidget:
         self.canvas.bind('<MouseWheel>', self.on_mouse_wheel)
         self.canvas.bind('<Button-4>', self.on_mouse_wheel)  # Linux
         self.canvas.bind('<Button-5>', self.on_mouse_wheel)  # Linux
+        self.canvas.bind('<Destroy>', self._on_destroy)
+    
+    def _on_destroy(self, event):
+        """Cancel idle callbacks that would run against a destroyed canvas"""
+        if event.widget is not self.canvas:
+            return
+        for job in self._idle_jobs.values():
+            try:
+                self.canvas.after_cancel(job)
+            except tk.TclError:
+                pass
+        self._idle_jobs.clear()
+    
+    def _schedule_redraw(self, cut: Optional[TimelineCut] = None):
+        """Request a redraw on the next idle pass (a single cut, or everything)"""
+        if cut is None:
+            self._full_redraw = True
+        else:
+            self._dirty_cuts[cut.cut_id] = cut
+        
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self._idle_jobs['redraw'] = self.canvas.after_idle(self._flush_redraw)
+    
+    def _flush_redraw(self):
+        """Perform the redraw requested since the last idle pass"""
+        self._idle_jobs.pop('redraw', None)
+        if not self._redraw_pending:
+            return
+        self._redraw_pending = False
+        
+        dirty_cuts = list(self._dirty_cuts.values())
+        self._dirty_cuts.clear()
+        
+        if self._full_redraw:
+            # Zoom/scroll only; the cut/scene index is still valid
+            self._full_redraw = False
+            self._render_timeline()
+        else:
+            for cut in dirty_cuts:
+                self.draw_cut(cut)
+    
+    def _invalidate_index(self):
+        """Mark the cut/scene interval index as stale"""
+        self._index_valid = False
+    
+    def _ensure_index(self):
+        """Rebuild the sorted cut/scene interval index if it is stale"""
+        if self._index_valid:
+            return
+        
+        self._cut_order = sorted(self.timeline_manager.cuts, key=lambda c: c.start_time)
+        self._cut_starts = np.array([cut.start_time for cut in self._cut_order], dtype=np.float64)
+        self._cut_ends = np.array([cut.end_time for cut in self._cut_order], dtype=np.float64)
+        self._cut_ids = np.array([cut.cut_id for cut in self._cut_order], dtype=np.int64)
+        
+        self._scene_order = sorted(self.timeline_manager.scenes, key=lambda s: s.start_time)
+        self._scene_starts = np.array([scene.start_time for scene in self._scene_order], dtype=np.float64)
+        self._scene_ends = np.array([scene.end_time for scene in self._scene_order], dtype=np.float64)
+        
+        self._cuts_disjoint = timeline_fast.is_disjoint(self._cut_starts, self._cut_ends)
+        self._scenes_disjoint = timeline_fast.is_disjoint(self._scene_starts, self._scene_ends)
+        
+        # Pick up selection flags set outside the widget (e.g. a loaded project)
+        self._selected_cuts = {cut.cut_id: cut for cut in self._cut_order if cut.selected}
+        self._selected_scenes = {scene.scene_id: scene for scene in self._scene_order if scene.selected}
+        
+        self._index_valid = True
+    
+    def _reindex_cut(self, pos: int, cut: TimelineCut):
+        """Refresh a moved cut's index entry, or drop the index if its order changed"""
+        order = self._cut_order
+        if (pos < len(order) and order[pos] is cut
+                and (pos == 0 or self._cut_ends[pos - 1] <= cut.start_time)
+                and (pos + 1 == len(order) or cut.end_time <= self._cut_starts[pos + 1])):
+            self._cut_starts[pos] = cut.start_time
+            self._cut_ends[pos] = cut.end_time
+        else:
+            self._invalidate_index()
     
     def update_timeline(self):
         """Update timeline visualization"""
-        # Clear canvas
-        self.canvas.delete('all')
-        
+        # Cuts/scenes may have been replaced since the last update
+        self._invalidate_index()
+        self._render_timeline()
+    
+    def _render_timeline(self):
+        """Redraw the visible part of the timeline from the current index"""
         # Get timeline data
         self.total_duration = self.timeline_manager.timeline_duration
+        self._scale = self.pixels_per_second * self.zoom_level
         
-        # Update scrollbar
+        # Update scroll region (the scrollbar follows via xscrollcommand);
+        # skipped when neither the duration nor the zoom changed
         if self.total_duration > 0:
-            canvas_width = self.total_duration * self.pixels_per_second * self.zoom_level
-            self.canvas.configure(scrollregion=(0, 0, canvas_width, self.timeline_height))
-            self.scrollbar.configure(to=canvas_width - self.width)
-        
-        # Draw time markers
+            canvas_width = self.total_duration * self._scale
+            scrollregion = (0, 0, canvas_width, self.timeline_height)
+            if scrollregion != self._last_scrollregion:
+                self.canvas.configure(scrollregion=scrollregion)
+                self._last_scrollregion = scrollregion
+        
+        # Resolve theme colors once; recolor existing items if the theme changed
+        palette = self._resolve_palette()
+        if palette != self._palette:
+            self._palette = palette
+            self._scene_style = self._scene_style._replace(text_fill=palette['text_primary'])
+            self._recolor_items()
+        
+        # Only the scrolled-to part of the timeline gets canvas items
+        self._visible_t0, self._visible_t1 = self._visible_range()
+        
+        # Existing canvas items are moved/recolored in place rather than
+        # deleting everything and recreating it
         self.draw_time_markers()
-        
-        # Draw scenes
-        self.draw_scenes()
-        
-        # Draw cuts
+        self.draw_scenes(self._scene_style)
         self.draw_cuts()
         
+        # Newly created items land on top; restore the layer order
+        for tag in ('scene', 'scene_label', 'cut', 'cut_label'):
+            self.canvas.tag_raise(tag)
+        
         # Update labels
         self.update_labels()
     
+    def _resolve_palette(self) -> Dict[str, str]:
+        """Look up the theme colors used by the timeline"""
+        get_color = self.theme_manager.get_color
+        return {name: get_color(name) for name in self.PALETTE_COLORS}
+    
+    def _recolor_items(self):
+        """Apply the current palette to items whose color is fixed at creation"""
+        palette = self._palette
+        self.canvas.itemconfigure('time_marker', fill=palette['border'])
+        self.canvas.itemconfigure('time_label', fill=palette['text_secondary'])
+        self.canvas.itemconfigure('scene_label', fill=palette['text_primary'])
+        self.canvas.itemconfigure('cut_label', fill=palette['text_primary'])
+        
+        # Cut rects share one tag per state, so each state is a single call
+        self._cut_colors = {
+            'cut_selected': (palette['accent_secondary'], palette['text_primary']),
+            'cut_enabled': (palette['accent_primary'], palette['border']),
+            'cut_disabled': (palette['bg_secondary'], palette['text_secondary']),
+        }
+        for state_tag, (fill_color, outline_color) in self._cut_colors.items():
+            self.canvas.itemconfigure(state_tag, fill=fill_color, outline=outline_color)
+    
+    def _visible_range(self) -> Tuple[float, float]:
+        """Time range currently scrolled into view, padded by half a screen"""
+        view_width = self.canvas.winfo_width()
+        if view_width <= 1:  # Not mapped yet
+            view_width = self.width
+        
+        margin = view_width / 2
+        x0 = self.canvas.canvasx(0) - margin
+        x1 = x0 + view_width + 2 * margin
+        return max(self.x_to_time(x0), 0.0), self.x_to_time(x1)
+    
     def draw_time_markers(self):
         """Draw time markers on timeline"""
-        if self.total_duration == 0:
-            return
-        
-        # Calculate marker interval based on zoom
-        if self.zoom_level > 2.0:
-            interval = 1.0  # 1 second markers
-        elif self.zoom_level > 1.0:
-            interval = 5.0  # 5 second markers
-        else:
-            interval = 10.0  # 10 second markers
+        markers = self._marker_items
+        border = self._palette['border']
+        text_secondary = self._palette['text_secondary']
         
-        # Draw markers
-        current_time = 0.0
-        while current_time <= self.total_duration:
-            x = self.time_to_x(current_time)
-            
-            # Draw marker line
-            self.canvas.create_line(
-                x, 0, x, self.timeline_height,
-                fill=self.theme_manager.get_color('border'),
-                width=1,
-                tags='time_marker'
-            )
+        if self.total_duration > 0:
+            # Calculate marker interval based on zoom
+            if self.zoom_level > 2.0:
+                interval = 1.0  # 1 second markers
+            elif self.zoom_level > 1.0:
+                interval = 5.0  # 5 second markers
+            else:
+                interval = 10.0  # 10 second markers
             
-            # Draw time label
-            time_text = self.format_time(current_time)
-            self.canvas.create_text(
-                x, self.timeline_height - 5,
-                text=time_text,
-                fill=self.theme_manager.get_color('text_secondary'),
-                font=('Arial', 8),
-                anchor='s',
-                tags='time_label'
-            )
+            # Times of the markers in the visible range
+            last_time = min(self.total_duration, self._visible_t1)
+            times = timeline_fast.compute_marker_times(self._visible_t0, last_time, interval)
+            wanted = times.tolist()
+        else:
+            wanted = []
+        
+        # Each marker keeps its label item for as long as its time stays in
+        # view, so scrolling never re-sends label text; only markers that
+        # left the view are retargeted to newly exposed times
+        geometry = (self._scale, self.timeline_height)
+        geometry_changed = geometry != self._marker_geometry
+        self._marker_geometry = geometry
+        
+        wanted_set = set(wanted)
+        spare = [markers.pop(t) for t in list(markers) if t not in wanted_set]
+        
+        for current_time in wanted:
+            items = markers.get(current_time)
+            if items and not geometry_changed:
+                continue
             
-            current_time += interval
+            x = self.time_to_x(current_time)
+            if items:
+                line_id, text_id = items
+                self.canvas.coords(line_id, x, 0, x, self.timeline_height)
+                self.canvas.coords(text_id, x, self.timeline_height - 5)
+            elif spare:
+                line_id, text_id = spare.pop()
+                self.canvas.coords(line_id, x, 0, x, self.timeline_height)
+                self.canvas.coords(text_id, x, self.timeline_height - 5)
+                self.canvas.itemconfigure(text_id, text=self.format_time(current_time))
+                markers[current_time] = (line_id, text_id)
+            else:
+                # Draw marker line
+                line_id = self.canvas.create_line(
+                    x, 0, x, self.timeline_height,
+                    fill=border,
+                    width=1,
+                    tags='time_marker'
+                )
+                
+                # Draw time label
+                text_id = self.canvas.create_text(
+                    x, self.timeline_height - 5,
+                    text=self.format_time(current_time),
+                    fill=text_secondary,
+                    font=('Arial', 8),
+                    anchor='s',
+                    tags='time_label'
+                )
+                markers[current_time] = (line_id, text_id)
+        
+        # Remove markers that are no longer needed
+        for line_id, text_id in spare:
+            self.canvas.delete(line_id, text_id)
     
-    def draw_scenes(self):
+    def draw_scenes(self, style: _SceneStyle):
         """Draw scenes on timeline"""
-        for scene in self.timeline_manager.scenes:
-            x1 = self.time_to_x(scene.start_time)
-            x2 = self.time_to_x(scene.end_time)
-            
-            # Draw scene background
-            self.canvas.create_rectangle(
-                x1, 0, x2, self.timeline_height,
-                fill=scene.color,
-                outline='',
-                tags=('scene', f'scene_{scene.scene_id}')
-            )
-            
-            # Draw scene label
-            if x2 - x1 > 50:  # Only show label if scene is wide enough
-                center_x = (x1 + x2) / 2
-                self.canvas.create_text(
-                    center_x, 15,
-                    text=f"Scene {scene.scene_id + 1}",
-                    fill=self.theme_manager.get_color('text_primary'),
-                    font=('Arial', 10, 'bold'),
-                    tags=('scene_label', f'scene_label_{scene.scene_id}')
-                )
+        self._ensure_index()
+        stale = set(self._scene_items)
+        
+        # Scenes ending before the view are skipped via the sorted index
+        # (ends are only sorted when the scenes are disjoint)
+        i = int(np.searchsorted(self._scene_ends, self._visible_t0)) if self._scenes_disjoint else 0
+        for scene in self._scene_order[i:]:
+            if scene.start_time > self._visible_t1:
+                break
+            if scene.end_time < self._visible_t0:
+                continue
+            stale.discard(scene.scene_id)
+            self.draw_scene(scene, style)
+        
+        for scene_id in stale:
+            self.canvas.delete(*self._scene_items.pop(scene_id))
+            del self._scene_fills[scene_id]
+    
+    def draw_scene(self, scene: TimelineScene, style: _SceneStyle):
+        """Create or update the canvas items of a single scene"""
+        x1 = self.time_to_x(scene.start_time)
+        x2 = self.time_to_x(scene.end_time)
+        center_x = (x1 + x2) / 2
+        
+        # Only show label if scene is wide enough
+        label_state = 'normal' if x2 - x1 > 50 else 'hidden'
+        
+        items = self._scene_items.get(scene.scene_id)
+        if items:
+            rect_id, label_id = items
+            self.canvas.coords(rect_id, x1, 0, x2, self.timeline_height)
+            # Scene colors rarely change; only send them to Tk when they do
+            if self._scene_fills[scene.scene_id] != scene.color:
+                self.canvas.itemconfigure(rect_id, fill=scene.color)
+                self._scene_fills[scene.scene_id] = scene.color
+            self.canvas.coords(label_id, center_x, 15)
+            self.canvas.itemconfigure(label_id, state=label_state)
+            return
+        
+        # Draw scene background
+        rect_id = self.canvas.create_rectangle(
+            x1, 0, x2, self.timeline_height,
+            fill=scene.color,
+            outline='',
+            tags=('scene', f'scene_{scene.scene_id}')
+        )
+        
+        # Draw scene label
+        label_id = self.canvas.create_text(
+            center_x, 15,
+            text=f"Scene {scene.scene_id + 1}",
+            fill=style.text_fill,
+            font=style.font,
+            state=label_state,
+            tags=('scene_label', f'scene_label_{scene.scene_id}')
+        )
+        self._scene_items[scene.scene_id] = (rect_id, label_id)
+        self._scene_fills[scene.scene_id] = scene.color
     
     def draw_cuts(self):
         """Draw cuts on timeline"""
-        for cut in self.timeline_manager.cuts:
-            x1 = self.time_to_x(cut.start_time)
-            x2 = self.time_to_x(cut.end_time)
-            
-            # Determine cut color based on selection and state
-            if cut.selected:
-                fill_color = self.theme_manager.get_color('accent_secondary')
-                outline_color = self.theme_manager.get_color('text_primary')
-            elif cut.enabled:
-                fill_color = self.theme_manager.get_color('accent_primary')
-                outline_color = self.theme_manager.get_color('border')
-            else:
-                fill_color = self.theme_manager.get_color('bg_secondary')
-                outline_color = self.theme_manager.get_color('text_secondary')
+        self._ensure_index()
+        stale = set(self._cut_items)
+        
+        # Cuts ending before the view are skipped via the sorted index
+        # (ends are only sorted when the cuts are disjoint)
+        i = int(np.searchsorted(self._cut_ends, self._visible_t0)) if self._cuts_disjoint else 0
+        for cut in self._cut_order[i:]:
+            if cut.start_time > self._visible_t1:
+                break
+            if cut.end_time < self._visible_t0:
+                continue
+            stale.discard(cut.cut_id)
+            self.draw_cut(cut)
+        
+        for cut_id in stale:
+            self.canvas.delete(*self._cut_items.pop(cut_id))
+            del self._cut_states[cut_id]
+    
+    def draw_cut(self, cut: TimelineCut):
+        """Create or update the canvas items of a single cut"""
+        x1 = self.time_to_x(cut.start_time)
+        x2 = self.time_to_x(cut.end_time)
+        center_x = (x1 + x2) / 2
+        center_y = (30 + self.timeline_height - 30) / 2
+        
+        # Determine cut color based on selection and state
+        if cut.selected:
+            state_tag = 'cut_selected'
+        elif cut.enabled:
+            state_tag = 'cut_enabled'
+        else:
+            state_tag = 'cut_disabled'
+        
+        # Only show label if cut is wide enough
+        label_state = 'normal' if x2 - x1 > 30 else 'hidden'
+        duration_text = self.format_duration(cut.duration)
+        
+        items = self._cut_items.get(cut.cut_id)
+        if items:
+            rect_id, label_id = items
+            self.canvas.coords(rect_id, x1, 30, x2, self.timeline_height - 30)
             
-            # Draw cut rectangle
-            self.canvas.create_rectangle(
-                x1, 30, x2, self.timeline_height - 30,
-                fill=fill_color,
-                outline=outline_color,
-                width=2,
-                tags=('cut', f'cut_{cut.cut_id}')
-            )
+            # Recolor only when the cut moves to another state tag
+            old_tag = self._cut_states[cut.cut_id]
+            if old_tag != state_tag:
+                fill_color, outline_color = self._cut_colors[state_tag]
+                self.canvas.dtag(rect_id, old_tag)
+                self.canvas.addtag_withtag(state_tag, rect_id)
+                self.canvas.itemconfigure(rect_id, fill=fill_color, outline=outline_color)
+                self._cut_states[cut.cut_id] = state_tag
             
-            # Draw cut label
-            if x2 - x1 > 30:  # Only show label if cut is wide enough
-                center_x = (x1 + x2) / 2
-                center_y = (30 + self.timeline_height - 30) / 2
-                
-                duration_text = self.format_duration(cut.duration)
-                self.canvas.create_text(
-                    center_x, center_y,
-                    text=duration_text,
-                    fill=self.theme_manager.get_color('text_primary'),
-                    font=('Arial', 9),
-                    tags=('cut_label', f'cut_label_{cut.cut_id}')
-                )
+            self.canvas.coords(label_id, center_x, center_y)
+            self.canvas.itemconfigure(label_id, text=duration_text, state=label_state)
+            return
+        
+        # Draw cut rectangle
+        fill_color, outline_color = self._cut_colors[state_tag]
+        rect_id = self.canvas.create_rectangle(
+            x1, 30, x2, self.timeline_height - 30,
+            fill=fill_color,
+            outline=outline_color,
+            width=2,
+            tags=('cut', f'cut_{cut.cut_id}', state_tag)
+        )
+        
+        # Draw cut label
+        label_id = self.canvas.create_text(
+            center_x, center_y,
+            text=duration_text,
+            fill=self._palette['text_primary'],
+            font=('Arial', 9),
+            state=label_state,
+            tags=('cut_label', f'cut_label_{cut.cut_id}')
+        )
+        self._cut_items[cut.cut_id] = (rect_id, label_id)
+        self._cut_states[cut.cut_id] = state_tag
     
     def time_to_x(self, time: float) -> float:
         """Convert time to x coordinate"""
-        return time * self.pixels_per_second * self.zoom_level
+        return time * self._scale
     
     def x_to_time(self, x: float) -> float:
         """Convert x coordinate to time"""
-        return x / (self.pixels_per_second * self.zoom_level)
-    
-    def format_time(self, time_seconds: float) -> str:
-        """Format time as MM:SS"""
-        minutes = int(time_seconds // 60)
-        seconds = int(time_seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return x / self._scale
     
-    def format_duration(self, duration_seconds: float) -> str:
-        """Format duration as X.Xs"""
-        return f"{duration_seconds:.1f}s"
+    # Cached module-level formatters; kept as attributes for existing callers
+    format_time = staticmethod(format_time)
+    format_duration = staticmethod(format_duration)
     
     def update_labels(self):
         """Update time and duration labels"""
@@ -272,16 +578,20 @@ class TimelineWidget:
     def zoom_in(self):
         """Zoom in timeline"""
         self.zoom_level = min(self.zoom_level * 1.2, 5.0)
-        self.update_timeline()
+        self._scale = self.pixels_per_second * self.zoom_level
+        self._schedule_redraw()
     
     def zoom_out(self):
         """Zoom out timeline"""
         self.zoom_level = max(self.zoom_level / 1.2, 0.2)
-        self.update_timeline()
+        self._scale = self.pixels_per_second * self.zoom_level
+        self._schedule_redraw()
     
     def on_scroll(self, *args):
         """Handle scrollbar scroll"""
         self.canvas.xview(*args)
+        # Bring newly exposed cuts/scenes/markers into view
+        self._schedule_redraw()
     
     def on_canvas_click(self, event):
         """Handle canvas click"""
@@ -322,14 +632,17 @@ class TimelineWidget:
             
             # Validate new position
             if self.is_valid_cut_position(self.selected_cut, new_start_time, new_end_time):
+                index_pos = int(np.searchsorted(self._cut_starts, self.selected_cut.start_time))
                 self.selected_cut.start_time = new_start_time
                 self.selected_cut.end_time = new_end_time
                 self.drag_start_x = canvas_x
+                self._reindex_cut(index_pos, self.selected_cut)
                 
                 if self.on_cut_moved:
                     self.on_cut_moved(self.selected_cut, time_delta)
                 
-                self.update_timeline()
+                # Only the dragged cut changed
+                self._schedule_redraw(self.selected_cut)
     
     def on_canvas_release(self, event):
         """Handle canvas release"""
@@ -337,7 +650,20 @@ class TimelineWidget:
     
     def on_canvas_motion(self, event):
         """Handle canvas motion"""
-        canvas_x = self.canvas.canvasx(event.x)
+        # Only the latest pointer position matters; handle it once per idle pass
+        if self._pending_motion is None:
+            self._idle_jobs['motion'] = self.canvas.after_idle(self._flush_motion)
+        self._pending_motion = (event.x, event.y)
+    
+    def _flush_motion(self):
+        """Update hover feedback for the last pointer position"""
+        self._idle_jobs.pop('motion', None)
+        if self._pending_motion is None:
+            return
+        x, y = self._pending_motion
+        self._pending_motion = None
+        
+        canvas_x = self.canvas.canvasx(x)
         click_time = self.x_to_time(canvas_x)
         
         # Update time label
@@ -345,7 +671,7 @@ class TimelineWidget:
         self.time_label.config(text=time_text)
         
         # Change cursor if hovering over draggable element
-        if self.get_cut_at_position(canvas_x, event.y):
+        if self.get_cut_at_position(canvas_x, y):
             self.canvas.configure(cursor="hand2")
         else:
             self.canvas.configure(cursor="")
@@ -359,60 +685,74 @@ class TimelineWidget:
     
     def get_cut_at_position(self, x: float, y: float) -> Optional[TimelineCut]:
         """Get cut at given position"""
-        for cut in self.timeline_manager.cuts:
-            x1 = self.time_to_x(cut.start_time)
-            x2 = self.time_to_x(cut.end_time)
-            
-            if x1 <= x <= x2 and 30 <= y <= self.timeline_height - 30:
-                return cut
-        return None
+        if not 30 <= y <= self.timeline_height - 30:
+            return None
+        
+        # Disjoint cuts: the first cut ending at/after t is the only candidate
+        self._ensure_index()
+        t = self.x_to_time(x)
+        find = timeline_fast.find_cut_at_time if self._cuts_disjoint else timeline_fast.find_cut_at_time_scan
+        i = find(self._cut_starts, self._cut_ends, t)
+        return self._cut_order[i] if i >= 0 else None
     
     def get_scene_at_position(self, x: float, y: float) -> Optional[TimelineScene]:
         """Get scene at given position"""
-        for scene in self.timeline_manager.scenes:
-            x1 = self.time_to_x(scene.start_time)
-            x2 = self.time_to_x(scene.end_time)
-            
-            if x1 <= x <= x2 and 0 <= y <= self.timeline_height:
-                return scene
-        return None
+        if not 0 <= y <= self.timeline_height:
+            return None
+        
+        self._ensure_index()
+        t = self.x_to_time(x)
+        find = timeline_fast.find_cut_at_time if self._scenes_disjoint else timeline_fast.find_cut_at_time_scan
+        i = find(self._scene_starts, self._scene_ends, t)
+        return self._scene_order[i] if i >= 0 else None
     
     def select_cut(self, cut: TimelineCut):
         """Select a cut"""
-        # Clear previous selection
-        self.clear_selection()
+        # Deselect previous selection
+        self._deselect_all()
         
         # Select new cut
         cut.selected = True
-        self.selected_cut = self.selected_cut
+        self._selected_cuts[cut.cut_id] = cut
+        self.selected_cut = cut
+        self.selected_scene = None
         self.is_dragging = True
         
-        self.update_timeline()
+        self._schedule_redraw(cut)
     
     def select_scene(self, scene: TimelineScene):
         """Select a scene"""
-        # Clear previous selection
-        self.clear_selection()
+        # Deselect previous selection
+        self._deselect_all()
         
-        # Select new scene
+        # Select new scene (scene drawing does not depend on selection)
         scene.selected = True
+        self._selected_scenes[scene.scene_id] = scene
+        self.selected_cut = None
         self.selected_scene = scene
-        
-        self.update_timeline()
+        self.is_dragging = False
     
     def clear_selection(self):
         """Clear all selections"""
-        for cut in self.timeline_manager.cuts:
-            cut.selected = False
-        
-        for scene in self.timeline_manager.scenes:
-            scene.selected = False
+        self._deselect_all()
         
         self.selected_cut = None
         self.selected_scene = None
         self.is_dragging = False
+    
+    def _deselect_all(self):
+        """Reset the selected flag on the tracked cuts/scenes only"""
+        self._ensure_index()
         
-        self.update_timeline()
+        for cut in self._selected_cuts.values():
+            cut.selected = False
+            # Recolor only the cuts that actually lose their selection
+            self._schedule_redraw(cut)
+        self._selected_cuts.clear()
+        
+        for scene in self._selected_scenes.values():
+            scene.selected = False
+        self._selected_scenes.clear()
     
     def is_valid_cut_position(self, cut: TimelineCut, start_time: float, end_time: float) -> bool:
         """Check if cut position is valid"""
@@ -423,13 +763,14 @@ class TimelineWidget:
         if duration > self.timeline_manager.max_cut_duration:
             return False
         
-        # Check for overlaps with other cuts
-        for other_cut in self.timeline_manager.cuts:
-            if other_cut.cut_id != cut.cut_id:
-                if (start_time < other_cut.end_time and end_time > other_cut.start_time):
-                    return False
-        
-        return True
+        # Check for overlaps with other cuts (neighbours in the sorted index,
+        # or every cut once existing cuts overlap each other)
+        self._ensure_index()
+        check = timeline_fast.check_overlap if self._cuts_disjoint else timeline_fast.check_overlap_scan
+        return not check(
+            self._cut_starts, self._cut_ends, self._cut_ids,
+            start_time, end_time, cut.cut_id
+        )
     
     def set_cut_selected_callback(self, callback: Callable[[TimelineCut], None]):
         """Set callback for cut selection"""
@@ -442,80 +783,3 @@ class TimelineWidget:
     def set_cut_moved_callback(self, callback: Callable[[TimelineCut, float], None]):
         """Set callback for cut movement"""
         self.on_cut_moved = callback
-
-# Test the timeline_widget
-if __name__ == "__main__":
-    import logging
-    
-    logging.basicConfig(level=logging.INFO)
-    
-    root = tk.Tk()
-    root.title("Timeline Widget Test")
-    root.geometry("1000x300")
-    
-    # Mock theme manager
-    class MockThemeManager:
-        def create_custom_frame(self, parent, style='TFrame', padding=0):
-            return ttk.Frame(parent)
-        
-        def create_custom_label(self, parent, text, font=None):
-            return ttk.Label(parent, text=text, font=font)
-        
-        def create_custom_button(self, parent, text, command=None, width=None):
-            return ttk.Button(parent, text=text, command=command, width=width)
-        
-        def get_color(self, color_name):
-            colors = {
-                'bg_primary': '#1a0d26',
-                'bg_secondary': '#2d1b3d',
-                'accent_primary': '#6b46c1',
-                'accent_secondary': '#a855f7',
-                'text_primary': '#f8fafc',
-                'text_secondary': '#cbd5e1',
-                'border': '#4c1d95'
-            }
-            return colors.get(color_name, '#000000')
-    
-    # Mock timeline manager
-    class MockTimelineManager:
-        def __init__(self):
-            self.cuts = []
-            self.scenes = []
-            self.timeline_duration = 0.0
-            self.min_cut_duration = 3.0
-            self.max_cut_duration = 7.0
-        
-        def add_scene(self, start, end):
-            from core.timeline_manager import TimelineScene
-            scene = TimelineScene(len(self.scenes), start, end)
-            self.scenes.append(scene)
-            return scene
-        
-        def add_cut(self, start, end, scene_id=-1):
-            from core.timeline_manager import TimelineCut
-            cut = TimelineCut(len(self.cuts), start, end, scene_id)
-            self.cuts.append(cut)
-            self.timeline_duration += cut.duration
-            return cut
-    
-    # Create test data
-    theme_manager = MockThemeManager()
-    timeline_manager = MockTimelineManager()
-    
-    # Add test scenes and cuts
-    scene1 = timeline_manager.add_scene(0, 30)
-    scene2 = timeline_manager.add_scene(30, 60)
-    scene3 = timeline_manager.add_scene(60, 90)
-    
-    timeline_manager.add_cut(2, 8, 0)
-    timeline_manager.add_cut(12, 18, 0)
-    timeline_manager.add_cut(32, 38, 1)
-    timeline_manager.add_cut(42, 48, 1)
-    timeline_manager.add_cut(62, 68, 2)
-    timeline_manager.add_cut(72, 78, 2)
-    
-    # Create timeline widget
-    timeline_widget = TimelineWidget(root, timeline_manager, theme_manager)
-    timeline_widget.frame.pack(fill='both', expand=True, padx=10, pady=10)
-    
-    root.mainloop()
\ No newline at end of file
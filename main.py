@@ -4,29 +4,106 @@ FFmpeg Editor - Main Application Entry Point
 """
 
 import tkinter as tk
+import atexit
+import copy
+import importlib.util
 import logging
+import logging.handlers
+import queue
 import json
 import os
+import shutil
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 
 # Add current directory to path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
+# Import orjson secara opsional (faster config parsing)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from gui.main_window import MainWindow
 from core.temp_manager import TempManager
 
+# Default configuration, used when config.json is missing or unreadable
+_DEFAULT_CONFIG = MappingProxyType({
+    "app_name": "FFmpeg Editor",
+    "version": "1.0.0",
+    "license_required": True,
+    "temp_dir_prefix": "ffmpeg_editor_",
+    "max_temp_files": 100,
+    "cleanup_on_exit": True,
+    "default_video_quality": "720p",
+    "default_audio_threshold": -40.0,
+    "min_scene_duration": 3.0,
+    "max_cut_duration": 7.0,
+    "min_cut_duration": 3.0,
+    "panning_interval": 15,
+    "supported_platforms": [
+        "youtube", "vimeo", "twitter", "instagram", 
+        "tiktok", "direct", "gdrive", "dropbox"
+    ],
+    "performance": {
+        "max_memory_usage_mb": 2048,
+        "preview_latency_ms": 100,
+        "processing_timeout": 300,
+        "max_workers": 4
+    },
+    "theme": {
+        "name": "Purple Blackhole",
+        "bg_primary": "#1a0d26",
+        "bg_secondary": "#2d1b3d",
+        "accent_primary": "#6b46c1",
+        "accent_secondary": "#a855f7",
+        "accent_tertiary": "#ec4899",
+        "text_primary": "#f8fafc",
+        "text_secondary": "#cbd5e1",
+        "border": "#4c1d95",
+        "hover": "#7c3aed",
+        "success": "#10b981",
+        "error": "#ef4444",
+        "warning": "#f59e0b"
+    }
+})
+
+# (import name, pip package name) checked at startup
+REQUIRED_MODULES = (
+    ("cv2", "opencv-python"),
+    ("numpy", "numpy"),
+    ("librosa", "librosa"),
+    ("yt_dlp", "yt-dlp"),
+)
+
+# Resolved FFmpeg binary from the last launch: "<path>\n<mtime_ns>"
+FFMPEG_CACHE_FILE = Path.home() / '.cache' / 'ffmpeg_editor' / 'ffmpeg_path'
+
 def setup_logging():
     """Setup logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('ffmpeg_editor.log'),
-            logging.StreamHandler()
-        ]
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    file_handler = logging.FileHandler('ffmpeg_editor.log', delay=True)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # Callers only enqueue records; file/console I/O runs on the listener thread
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 def load_config() -> dict:
     """Load application configuration"""
@@ -34,75 +111,26 @@ def load_config() -> dict:
     
     if os.path.exists(config_path):
         try:
+            if ORJSON_AVAILABLE:
+                return orjson.loads(Path(config_path).read_bytes())
             with open(config_path, 'r') as f:
                 return json.load(f)
         except Exception as e:
             logging.error(f"Failed to load config: {e}")
     
     # Return default config if file doesn't exist or fails to load
-    return {
-        "app_name": "FFmpeg Editor",
-        "version": "1.0.0",
-        "license_required": True,
-        "temp_dir_prefix": "ffmpeg_editor_",
-        "max_temp_files": 100,
-        "cleanup_on_exit": True,
-        "default_video_quality": "720p",
-        "default_audio_threshold": -40.0,
-        "min_scene_duration": 3.0,
-        "max_cut_duration": 7.0,
-        "min_cut_duration": 3.0,
-        "panning_interval": 15,
-        "supported_platforms": [
-            "youtube", "vimeo", "twitter", "instagram", 
-            "tiktok", "direct", "gdrive", "dropbox"
-        ],
-        "performance": {
-            "max_memory_usage_mb": 2048,
-            "preview_latency_ms": 100,
-            "processing_timeout": 300,
-            "max_workers": 4
-        },
-        "theme": {
-            "name": "Purple Blackhole",
-            "bg_primary": "#1a0d26",
-            "bg_secondary": "#2d1b3d",
-            "accent_primary": "#6b46c1",
-            "accent_secondary": "#a855f7",
-            "accent_tertiary": "#ec4899",
-            "text_primary": "#f8fafc",
-            "text_secondary": "#cbd5e1",
-            "border": "#4c1d95",
-            "hover": "#7c3aed",
-            "success": "#10b981",
-            "error": "#ef4444",
-            "warning": "#f59e0b"
-        }
-    }
+    # (deep copy so callers can't modify the shared nested defaults)
+    return copy.deepcopy(dict(_DEFAULT_CONFIG))
 
 def check_dependencies():
     """Check if required dependencies are available"""
     missing_deps = []
     
-    try:
-        import cv2
-    except ImportError:
-        missing_deps.append("opencv-python")
-    
-    try:
-        import numpy
-    except ImportError:
-        missing_deps.append("numpy")
-    
-    try:
-        import librosa
-    except ImportError:
-        missing_deps.append("librosa")
-    
-    try:
-        import yt_dlp
-    except ImportError:
-        missing_deps.append("yt-dlp")
+    # find_spec only locates the modules; nothing is imported or executed here,
+    # the heavy packages are imported later by the modules that use them
+    for module_name, package_name in REQUIRED_MODULES:
+        if importlib.util.find_spec(module_name) is None:
+            missing_deps.append(package_name)
     
     if missing_deps:
         print("Missing dependencies:")
@@ -114,16 +142,51 @@ def check_dependencies():
     
     return True
 
-def check_ffmpeg():
+def _read_cached_ffmpeg() -> Optional[str]:
+    """Return the cached FFmpeg path if the binary is unchanged since it was cached"""
+    try:
+        path, mtime_ns = FFMPEG_CACHE_FILE.read_text().split('\n')[:2]
+        if os.stat(path).st_mtime_ns == int(mtime_ns):
+            return path
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_cached_ffmpeg(path: str):
+    """Remember the resolved FFmpeg path for the next launch"""
+    try:
+        FFMPEG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        FFMPEG_CACHE_FILE.write_text(f"{path}\n{os.stat(path).st_mtime_ns}")
+    except OSError as e:
+        logging.debug(f"Could not cache FFmpeg path: {e}")
+
+def check_ffmpeg(manual_path: Optional[str] = None) -> bool:
     """Check if FFmpeg is available"""
+    if _read_cached_ffmpeg():
+        return True
+    
+    # Look the binary up on PATH without spawning it
+    path = shutil.which('ffmpeg')
+    if path:
+        _write_cached_ffmpeg(path)
+        return True
+    
+    if not manual_path:
+        return False
+    
+    # Only a user-configured binary outside PATH needs to be run to verify it
     import subprocess
     
     try:
-        result = subprocess.run(['ffmpeg', '-version'], 
+        result = subprocess.run([manual_path, '-version'], 
                               capture_output=True, text=True, timeout=10)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except (subprocess.TimeoutExpired, OSError):
         return False
+    
+    if result.returncode == 0:
+        _write_cached_ffmpeg(manual_path)
+        return True
+    return False
 
 def main():
     """Main application entry point"""
@@ -138,15 +201,15 @@ def main():
         logger.error("Missing dependencies. Please install required packages.")
         return
     
-    # Check FFmpeg
-    if not check_ffmpeg():
-        logger.error("FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.")
-        return
-    
     # Load configuration
     config = load_config()
     logger.info(f"Loaded configuration: {config['app_name']} v{config['version']}")
     
+    # Check FFmpeg
+    if not check_ffmpeg(config.get('ffmpeg_path')):
+        logger.error("FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.")
+        return
+    
     # Initialize temporary file manager
     temp_manager = TempManager(config)
     
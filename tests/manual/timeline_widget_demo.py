@@ -0,0 +1,91 @@
+# tests/manual/timeline_widget_demo.py
+"""
+Manual smoke test for the timeline widget with mock managers
+Run from the project root: python tests/manual/timeline_widget_demo.py
+"""
+
+import os
+import sys
+import logging
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from core.timeline_manager import TimelineCut, TimelineScene
+from gui.timeline_widget import TimelineWidget
+
+# Mock theme manager
+class MockThemeManager:
+    def create_custom_frame(self, parent, style='TFrame', padding=0):
+        return ttk.Frame(parent)
+    
+    def create_custom_label(self, parent, text, font=None):
+        return ttk.Label(parent, text=text, font=font)
+    
+    def create_custom_button(self, parent, text, command=None, width=None):
+        return ttk.Button(parent, text=text, command=command, width=width)
+    
+    def get_color(self, color_name):
+        colors = {
+            'bg_primary': '#1a0d26',
+            'bg_secondary': '#2d1b3d',
+            'accent_primary': '#6b46c1',
+            'accent_secondary': '#a855f7',
+            'text_primary': '#f8fafc',
+            'text_secondary': '#cbd5e1',
+            'border': '#4c1d95'
+        }
+        return colors.get(color_name, '#000000')
+
+# Mock timeline manager
+class MockTimelineManager:
+    def __init__(self):
+        self.cuts = []
+        self.scenes = []
+        self.timeline_duration = 0.0
+        self.min_cut_duration = 3.0
+        self.max_cut_duration = 7.0
+    
+    def add_scene(self, start, end):
+        scene = TimelineScene(len(self.scenes), start, end)
+        self.scenes.append(scene)
+        return scene
+    
+    def add_cut(self, start, end, scene_id=-1):
+        cut = TimelineCut(len(self.cuts), start, end, scene_id)
+        self.cuts.append(cut)
+        self.timeline_duration += cut.duration
+        return cut
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+    
+    root = tk.Tk()
+    root.title("Timeline Widget Test")
+    root.geometry("1000x300")
+    
+    # Create test data
+    theme_manager = MockThemeManager()
+    timeline_manager = MockTimelineManager()
+    
+    # Add test scenes and cuts
+    scene1 = timeline_manager.add_scene(0, 30)
+    scene2 = timeline_manager.add_scene(30, 60)
+    scene3 = timeline_manager.add_scene(60, 90)
+    
+    timeline_manager.add_cut(2, 8, 0)
+    timeline_manager.add_cut(12, 18, 0)
+    timeline_manager.add_cut(32, 38, 1)
+    timeline_manager.add_cut(42, 48, 1)
+    timeline_manager.add_cut(62, 68, 2)
+    timeline_manager.add_cut(72, 78, 2)
+    
+    # Create timeline widget
+    timeline_widget = TimelineWidget(root, timeline_manager, theme_manager)
+    timeline_widget.frame.pack(fill='both', expand=True, padx=10, pady=10)
+    
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
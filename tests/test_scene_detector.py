@@ -44,6 +44,14 @@ class TestSceneDetector:
         assert detector.max_cut_duration == 7.0
         assert detector.min_cut_duration == 3.0
     
+    def test_scene_detector_sampling_defaults(self, temp_manager):
+        """Test default frame sampling settings"""
+        detector = SceneDetector(temp_manager)
+        
+        assert detector.keyframe_stride == 5
+        assert detector.downsample == 2
+        assert detector.frame_step == 1
+    
     def test_detect_scenes_success(self, scene_detector, mock_video_capture):
         """Test successful scene detection"""
         # Mock video frames
@@ -54,9 +62,11 @@ class TestSceneDetector:
             np.ones((480, 640, 3), dtype=np.uint8) * 200,  # Similar frame
         ]
         
-        mock_video_capture.read.side_effect = [
-            (True, frame) for frame in mock_frames
-        ] + [(False, None)]  # End of video
+        # Every frame is grabbed; only sampled frames are retrieved
+        mock_video_capture.grab.side_effect = [True] * len(mock_frames) + [False]  # End of video
+        mock_video_capture.retrieve.side_effect = [
+            (True, frame) for frame in mock_frames[::scene_detector.frame_step]
+        ]
         
         with patch('cv2.VideoCapture') as mock_cv_capture:
             mock_cv_capture.return_value = mock_video_capture
@@ -106,6 +116,17 @@ class TestSceneDetector:
         assert filtered[0]['start'] == 2.0
         assert filtered[1]['start'] == 9.0
     
+    def test_filter_scene_breaks_large(self, scene_detector):
+        """Test scene break filtering on long scene lists"""
+        raw_scenes = [(i * 10.0, i * 10.0 + (2.0 if i % 2 else 5.0)) for i in range(100)]
+        
+        filtered = scene_detector.filter_scene_breaks(raw_scenes, min_scene_duration=3.0)
+        
+        assert filtered == raw_scenes[::2]
+        
+        dict_scenes = [{'start': s, 'end': e, 'duration': e - s} for s, e in raw_scenes]
+        assert scene_detector.filter_scene_breaks(dict_scenes, 3.0) == dict_scenes[::2]
+    
     def test_generate_fair_use_cuts(self, scene_detector):
         """Test fair use cuts generation"""
         scenes = [
@@ -173,24 +194,26 @@ class TestSceneDetector:
         zigzag_indices = scene_detector.create_zigzag_sequence([])
         assert zigzag_indices == []
     
-    def test_detect_keyframes(self, scene_detector, mock_video_capture):
+    def test_detect_keyframes(self, scene_detector):
         """Test keyframe detection"""
-        mock_video_capture.get.side_effect = lambda prop: {
-            cv2.CAP_PROP_FPS: 30.0,
-            cv2.CAP_PROP_FRAME_COUNT: 900
-        }.get(prop, 0)
-        
-        mock_video_capture.read.side_effect = [
-            (True, np.ones((480, 640, 3), dtype=np.uint8))
-        ] * 10 + [(False, None)]
-        
-        with patch('cv2.VideoCapture') as mock_cv_capture:
-            mock_cv_capture.return_value = mock_video_capture
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(
+                returncode=0,
+                stdout='0.000000\n0.500000\n1.001000\nN/A\n2.500000\n'
+            )
             
             keyframes = scene_detector.detect_keyframes('test.mp4', interval=1.0)
             
-            assert len(keyframes) > 0
-            assert all(isinstance(kf, (int, float)) for kf in keyframes)
+            assert keyframes == [0.0, 1.001, 2.5]
+            assert '-skip_frame' in mock_run.call_args[0][0]
+    
+    def test_detect_keyframes_failure(self, scene_detector):
+        """Test keyframe detection when ffprobe fails"""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=1, stderr='bad input')
+            
+            with pytest.raises(RuntimeError, match="Keyframe detection failed"):
+                scene_detector.detect_keyframes('test.mp4')
     
     def test_export_scene_frames(self, scene_detector, mock_video_capture):
         """Test scene frame export"""
@@ -210,13 +233,20 @@ class TestSceneDetector:
         
         with patch('cv2.VideoCapture') as mock_cv_capture:
             mock_cv_capture.return_value = mock_video_capture
-            with patch('cv2.imwrite') as mock_imwrite:
-                mock_imwrite.return_value = True
+            with patch('cv2.imencode') as mock_imencode:
+                mock_imencode.return_value = (True, np.frombuffer(b'jpeg', dtype=np.uint8))
                 
                 frame_paths = scene_detector.export_scene_frames('test.mp4', scenes)
                 
                 assert len(frame_paths) == 2
-                mock_imwrite.assert_called()
+                assert mock_imencode.call_count == 2
+                
+                # Single capture, seeking forward to the second scene only
+                mock_cv_capture.assert_called_once()
+                mock_video_capture.set.assert_called_once_with(cv2.CAP_PROP_POS_FRAMES, 30)
+                
+                with open(frame_paths[0], 'rb') as f:
+                    assert f.read() == b'jpeg'
     
     def test_export_scene_frames_no_output_dir(self, scene_detector, mock_video_capture):
         """Test scene frame export with no output directory"""
@@ -233,8 +263,8 @@ class TestSceneDetector:
         
         with patch('cv2.VideoCapture') as mock_cv_capture:
             mock_cv_capture.return_value = mock_video_capture
-            with patch('cv2.imwrite') as mock_imwrite:
-                mock_imwrite.return_value = True
+            with patch('cv2.imencode') as mock_imencode:
+                mock_imencode.return_value = (True, np.frombuffer(b'jpeg', dtype=np.uint8))
                 
                 frame_paths = scene_detector.export_scene_frames('test.mp4', scenes, None)
                 
@@ -4,6 +4,7 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -118,6 +119,43 @@ class TestTempManager:
         
         assert not os.path.exists(temp_file)
     
+    def test_scratch_file(self):
+        """Test non-persistent scratch files are usable and cleaned up"""
+        temp_mgr = TempManager()
+        
+        scratch = temp_mgr.get_temp_file('', persistent=False)
+        with open(scratch, 'w') as f:
+            f.write("scratch content")
+        with open(scratch) as f:
+            assert f.read() == "scratch content"
+        
+        if temp_mgr._scratch_fds:
+            # Anonymous file: no directory entry in the temp dir
+            assert os.listdir(temp_mgr.temp_dir) == []
+        
+        temp_mgr.cleanup_all()
+        assert not os.path.exists(scratch)
+        assert not temp_mgr._scratch_fds
+    
+    def test_scratch_file_suffix_and_release(self):
+        """Test suffixed scratch files keep their extension and can be released"""
+        temp_mgr = TempManager()
+        
+        # ffmpeg infers the output format from the extension
+        scratch = temp_mgr.get_temp_file('.mp4', persistent=False)
+        assert scratch.endswith('.mp4')
+        assert os.path.exists(scratch)
+        
+        temp_mgr.release_temp_file(scratch)
+        assert not os.path.exists(scratch)
+        assert scratch not in temp_mgr.temp_files
+        
+        anonymous = temp_mgr.get_temp_file('', persistent=False)
+        temp_mgr.release_temp_file(anonymous)
+        assert not temp_mgr._scratch_fds
+        
+        temp_mgr.cleanup_all()
+    
     def test_max_temp_files_limit(self):
         """Test max temp files limit"""
         config = {'max_temp_files': 3}
@@ -153,6 +191,22 @@ class TestTempManager:
         # Cleanup
         temp_mgr.cleanup_all()
     
+    def test_disk_space_check_cached(self):
+        """Test disk space is queried at most once per TTL"""
+        temp_mgr = TempManager()
+        
+        with patch('shutil.disk_usage') as mock_usage:
+            mock_usage.return_value = Mock(free=10 * 1024 ** 3)
+            
+            assert temp_mgr.check_disk_space() is True
+            assert temp_mgr.check_disk_space(20.0) is False
+            assert mock_usage.call_count == 1
+            
+            # Cleanup frees space, so the cache is dropped
+            temp_mgr.cleanup_all()
+            temp_mgr.check_disk_space()
+            assert mock_usage.call_count == 2
+    
     def test_config_override(self):
         """Test configuration override"""
         config = {
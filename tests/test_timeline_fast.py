@@ -0,0 +1,83 @@
+# tests/test_timeline_fast.py
+import pytest
+import os
+import numpy as np
+
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.timeline_fast import (
+    find_cut_at_time, find_cut_at_time_scan, check_overlap, check_overlap_scan,
+    compute_marker_times, is_disjoint
+)
+
+class TestTimelineFast:
+    def setup_method(self):
+        """Three disjoint cuts: [0, 2], [3, 5], [5, 8]"""
+        self.starts = np.array([0.0, 3.0, 5.0], dtype=np.float64)
+        self.ends = np.array([2.0, 5.0, 8.0], dtype=np.float64)
+        self.cut_ids = np.array([10, 11, 12], dtype=np.int64)
+
+    def test_find_cut_at_time(self):
+        """Test hit-testing times against sorted intervals"""
+        assert find_cut_at_time(self.starts, self.ends, 1.0) == 0
+        assert find_cut_at_time(self.starts, self.ends, 2.5) == -1
+        assert find_cut_at_time(self.starts, self.ends, 7.9) == 2
+        assert find_cut_at_time(self.starts, self.ends, 9.0) == -1
+
+        # Shared boundary resolves to the earlier cut
+        assert find_cut_at_time(self.starts, self.ends, 5.0) == 1
+
+    def test_find_cut_at_time_empty(self):
+        """Test hit-testing with no cuts"""
+        empty = np.empty(0, dtype=np.float64)
+        assert find_cut_at_time(empty, empty, 1.0) == -1
+
+    def test_check_overlap(self):
+        """Test overlap detection against neighbouring cuts"""
+        # Fits in the gap between the first two cuts
+        assert not check_overlap(self.starts, self.ends, self.cut_ids, 2.0, 3.0, 99)
+        assert check_overlap(self.starts, self.ends, self.cut_ids, 1.5, 2.5, 99)
+        assert check_overlap(self.starts, self.ends, self.cut_ids, 7.0, 9.0, 99)
+
+        # A cut never overlaps itself
+        assert not check_overlap(self.starts, self.ends, self.cut_ids, 3.5, 5.0, 11)
+        assert check_overlap(self.starts, self.ends, self.cut_ids, 3.5, 5.5, 11)
+
+    def test_is_disjoint(self):
+        """Test disjointness detection (touching cuts are still disjoint)"""
+        assert is_disjoint(self.starts, self.ends)
+
+        starts = np.array([0.0, 2.0], dtype=np.float64)
+        ends = np.array([10.0, 4.0], dtype=np.float64)
+        assert not is_disjoint(starts, ends)
+
+    def test_scan_helpers_with_overlapping_cuts(self):
+        """Test the scan fallbacks on cuts nested inside each other"""
+        # [0, 10] contains [2, 4]; ends are not sorted
+        starts = np.array([0.0, 2.0, 12.0], dtype=np.float64)
+        ends = np.array([10.0, 4.0, 15.0], dtype=np.float64)
+        cut_ids = np.array([0, 1, 2], dtype=np.int64)
+
+        assert find_cut_at_time_scan(starts, ends, 6.0) == 0
+        assert find_cut_at_time_scan(starts, ends, 3.0) == 0
+        assert find_cut_at_time_scan(starts, ends, 11.0) == -1
+        assert find_cut_at_time_scan(starts, ends, 13.0) == 2
+
+        # [5, 8] only overlaps the outer cut
+        assert check_overlap_scan(starts, ends, cut_ids, 5.0, 8.0, 1)
+        assert not check_overlap_scan(starts, ends, cut_ids, 5.0, 8.0, 0)
+        assert not check_overlap_scan(starts, ends, cut_ids, 10.0, 12.0, 99)
+
+        # Same answers as the fast path on disjoint cuts
+        for t in (1.0, 2.5, 5.0, 7.9, 9.0):
+            assert (find_cut_at_time_scan(self.starts, self.ends, t)
+                    == find_cut_at_time(self.starts, self.ends, t))
+
+    def test_compute_marker_times(self):
+        """Test marker times snap to multiples of the interval"""
+        times = compute_marker_times(12.0, 41.0, 10.0)
+        assert times.tolist() == [10.0, 20.0, 30.0, 40.0]
+
+        assert compute_marker_times(0.0, 0.0, 5.0).tolist() == [0.0]
+        assert len(compute_marker_times(35.0, 21.0, 10.0)) == 0
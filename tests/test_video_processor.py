@@ -3,6 +3,8 @@ import pytest
 import os
 import tempfile
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 
 import sys
@@ -34,6 +36,16 @@ class TestVideoProcessor:
             assert processor.ffmpeg_path == 'ffmpeg'
             assert processor.ffprobe_path == 'ffprobe'
     
+    def test_scene_detector_frame_step(self, temp_manager):
+        """Test the shared scene detector is built with the requested frame step"""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout='ffmpeg version 4.4')
+            
+            assert VideoProcessor(temp_manager).scene_detector.frame_step == 1
+            assert VideoProcessor(temp_manager, scene_frame_step=2).scene_detector.frame_step == 2
+            # Goes through SceneDetector's clamp
+            assert VideoProcessor(temp_manager, scene_frame_step=0).scene_detector.frame_step == 1
+    
     def test_ffmpeg_detection_failure(self, temp_manager):
         """Test FFmpeg detection failure"""
         with patch('subprocess.run') as mock_run:
@@ -106,6 +118,107 @@ class TestVideoProcessor:
                     assert result.endswith('_trimmed.mp4')
                     mock_run.assert_called_once()
     
+    def test_trim_video_keyframe_aligned(self, video_processor):
+        """Test trimming near a keyframe snaps to it and stream-copies"""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            
+            with patch.object(video_processor, '_get_keyframe_times', return_value=[0.0, 9.9, 20.0]), \
+                 patch('os.path.exists', return_value=True), \
+                 patch('os.path.getsize', return_value=1024):
+                
+                video_processor.trim_video('input.mp4', 10.0, 20.0)
+                
+                cmd = mock_run.call_args[0][0]
+                assert cmd[cmd.index('-ss') + 1] == '9.9'
+                assert cmd[cmd.index('-c') + 1] == 'copy'
+    
+    def test_trim_video_not_aligned(self, video_processor):
+        """Test trimming away from keyframes re-encodes"""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            
+            with patch.object(video_processor, '_get_keyframe_times', return_value=[0.0, 5.0]), \
+                 patch('os.path.exists', return_value=True), \
+                 patch('os.path.getsize', return_value=1024):
+                
+                video_processor.trim_video('input.mp4', 10.0, 20.0)
+                
+                cmd = mock_run.call_args[0][0]
+                assert cmd[cmd.index('-ss') + 1] == '10.0'
+                assert 'libx264' in cmd
+    
+    def test_get_keyframe_times_cached(self, video_processor, tmp_path):
+        """Test keyframes are parsed from ffprobe packets and cached"""
+        video = tmp_path / 'input.mp4'
+        video.write_bytes(b'data')
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(
+                returncode=0,
+                stdout='packet,0.000000,K_\npacket,0.040000,__\npacket,2.000000,K_\nformat,0.000000\n'
+            )
+            
+            assert video_processor._get_keyframe_times(str(video)) == [0.0, 2.0]
+            assert video_processor._get_keyframe_times(str(video)) == [0.0, 2.0]
+            
+            # Dropping the in-memory copy falls back to the on-disk cache
+            video_processor._keyframe_cache.clear()
+            assert video_processor._get_keyframe_times(str(video)) == [0.0, 2.0]
+            mock_run.assert_called_once()
+    
+    def test_get_keyframe_times_probes_once_per_input(self, video_processor, tmp_path):
+        """Test concurrent callers share one probe and other inputs do not wait"""
+        slow = tmp_path / 'slow.mp4'
+        fast = tmp_path / 'fast.mp4'
+        slow.write_bytes(b'slow')
+        fast.write_bytes(b'fast')
+        release = threading.Event()
+        calls = []
+        
+        def load(input_path, key):
+            calls.append(input_path)
+            if input_path == str(slow):
+                assert release.wait(5)
+            return [1.0]
+        
+        with patch.object(video_processor, '_load_keyframe_times', side_effect=load):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                slow_results = [executor.submit(video_processor._get_keyframe_times, str(slow))
+                                for _ in range(3)]
+                # Answered while the slow probe is still running
+                assert video_processor._get_keyframe_times(str(fast)) == [1.0]
+                release.set()
+                assert [f.result(5) for f in slow_results] == [[1.0]] * 3
+        
+        assert calls.count(str(slow)) == 1
+    
+    def test_get_keyframe_times_relative_to_start(self, video_processor, tmp_path):
+        """Test keyframes are shifted by the container start time"""
+        video = tmp_path / 'input.ts'
+        video.write_bytes(b'data')
+        
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(
+                returncode=0,
+                stdout='packet,1.400000,K_\npacket,3.400000,K_\nformat,1.400000\n'
+            )
+            
+            assert video_processor._get_keyframe_times(str(video)) == pytest.approx([0.0, 2.0])
+    
+    def test_cut_clips_single_mode(self, video_processor):
+        """Test one unaligned clip makes every clip re-encode"""
+        with patch.object(video_processor, '_get_keyframe_times', return_value=[0.0, 10.0]), \
+             patch.object(video_processor, 'trim_video', return_value='cut.mp4') as mock_trim:
+            
+            video_processor.cut_clips('input.mp4', [(10.0, 14.0), (22.0, 26.0)])
+            assert {call.kwargs['stream_copy'] for call in mock_trim.call_args_list} == {False}
+            assert all(call.kwargs['threads'] >= 1 for call in mock_trim.call_args_list)
+            
+            mock_trim.reset_mock()
+            video_processor.cut_clips('input.mp4', [(0.1, 4.0), (10.0, 14.0)])
+            assert {call.kwargs['stream_copy'] for call in mock_trim.call_args_list} == {True}
+    
     def test_trim_video_invalid_times(self, video_processor):
         """Test video trimming with invalid times"""
         with pytest.raises(ValueError, match="Invalid trim times"):
@@ -183,22 +296,36 @@ class TestVideoProcessor:
             cuts = video_processor.create_random_cuts('input.mp4', scene_data)
             
             assert len(cuts) == 2
-            mock_trim.assert_called()
+            assert mock_trim.call_count == 2
+            
+            # Each cut stays inside its own scene, whatever order the trims ran in
+            windows = sorted(call.args[1:] for call in mock_trim.call_args_list)
+            assert 0.0 <= windows[0][0] < windows[0][1] <= 30.0
+            assert 30.0 <= windows[1][0] < windows[1][1] <= 60.0
     
     def test_compile_zigzag_sequence(self, video_processor):
         """Test zigzag sequence compilation"""
         cuts_list = ['cut1.mp4', 'cut2.mp4', 'cut3.mp4']
         
+        # tempfile probes the temp dir with os.open, so create it before patching
+        video_processor.temp_manager.create_temp_dir()
+        
         with patch('subprocess.run') as mock_run:
             mock_run.return_value = Mock(returncode=0)
             
-            with patch('builtins.open') as mock_open:
-                mock_open.return_value.__enter__.return_value.write = Mock()
+            with patch('os.open', return_value=3), \
+                 patch('os.write', side_effect=lambda fd, data: len(data)) as mock_write, \
+                 patch('os.close') as mock_close:
                 
                 result = video_processor.compile_zigzag_sequence(cuts_list)
                 
                 assert result.endswith('_zigzag.mp4')
                 mock_run.assert_called_once()
+                
+                # Whole concat list goes out in a single write
+                mock_write.assert_called_once()
+                assert bytes(mock_write.call_args[0][1]).count(b"file '") == 3
+                mock_close.assert_called_once_with(3)
     
     def test_apply_color_grading(self, video_processor):
         """Test color grading application"""
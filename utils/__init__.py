@@ -1,15 +1,34 @@
 """
 Utility modules for FFmpeg Editor
+
+Submodules are imported on first attribute access (PEP 562), so importing
+one utility does not pull in the dependencies of all the others.
 """
 
-from .url_downloader import URLDownloader
-from .file_handler import FileHandler
-from .progress_tracker import ProgressTracker
-from .keyboard_handler import KeyboardHandler
+import importlib
 
 __all__ = [
     'URLDownloader',
     'FileHandler',
     'ProgressTracker',
     'KeyboardHandler'
-]
\ No newline at end of file
+]
+
+# Public name -> (submodule, attribute)
+_LAZY_IMPORTS = {
+    'URLDownloader': ('.url_downloader', 'URLDownloader'),
+    'FileHandler': ('.file_handler', 'FileHandler'),
+    'ProgressTracker': ('.progress_tracker', 'ProgressTracker'),
+    'KeyboardHandler': ('.keyboard_handler', 'KeyboardHandler'),
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,17 +4,122 @@ File I/O operations utility
 """
 
 import os
+import sys
+import errno
+import ctypes
+import fnmatch
+import mmap
+import secrets
 import shutil
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Tuple
 from pathlib import Path
 
+# Import orjson secara opsional (faster JSON read/write)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Directories remembered by ensure_directory as already existing
+KNOWN_DIRS_MAX = 1024
+
+# Below this many entries, stat calls run inline rather than on the pool
+PARALLEL_STAT_MIN = 64
+
+# Files at least this big are read through mmap instead of read()
+MMAP_READ_THRESHOLD = 64 << 10
+
+# Files above this size are copied with sendfile/mmap instead of shutil.copy2
+LARGE_FILE_THRESHOLD = 1 << 20
+
+# Invalid characters for most file systems, each mapped to an underscore
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+@lru_cache(maxsize=4096)
+def _sanitize_filename(filename: str) -> str:
+    """Cached body of FileHandler.sanitize_filename"""
+    # Replace invalid characters in one pass
+    filename = filename.translate(_SANITIZE_TABLE)
+    
+    # Remove leading/trailing whitespace and dots
+    filename = filename.strip('. ')
+    
+    # Limit length
+    if len(filename) > 255:
+        name, ext = os.path.splitext(filename)
+        filename = name[:255-len(ext)] + ext
+    
+    return filename
+
+# cachestat(2), Linux 6.5+: page-cache residency of a file in one syscall
+SYS_CACHESTAT = 451
+
+class _CachestatRange(ctypes.Structure):
+    _fields_ = [('off', ctypes.c_uint64), ('len', ctypes.c_uint64)]
+
+class _Cachestat(ctypes.Structure):
+    _fields_ = [
+        ('nr_cache', ctypes.c_uint64),
+        ('nr_dirty', ctypes.c_uint64),
+        ('nr_writeback', ctypes.c_uint64),
+        ('nr_evicted', ctypes.c_uint64),
+        ('nr_recently_evicted', ctypes.c_uint64),
+    ]
+
+_libc = None
+
+def _cachestat(fd: int) -> Optional[Dict[str, int]]:
+    """Page-cache counters for the whole file, or None if cachestat is unavailable"""
+    global _libc
+    if not sys.platform.startswith('linux'):
+        return None
+    if _libc is None:
+        _libc = ctypes.CDLL(None, use_errno=True)
+    
+    cstat_range = _CachestatRange(0, 0)  # len 0 = up to end of file
+    cstat = _Cachestat()
+    ret = _libc.syscall(ctypes.c_long(SYS_CACHESTAT), ctypes.c_int(fd),
+                        ctypes.byref(cstat_range), ctypes.byref(cstat), ctypes.c_uint(0))
+    if ret != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOSYS, errno.EPERM, errno.EOPNOTSUPP):
+            return None
+        raise OSError(err, os.strerror(err))
+    
+    return {name: getattr(cstat, name) for name, _ in _Cachestat._fields_}
+
 class FileHandler:
     """
     Handles file I/O operations
+    
+    Per-file success messages use lazy %-style arguments, so they cost
+    nothing when INFO is disabled. main.setup_logging already routes records
+    through a QueueHandler, so the file/console writes happen on the
+    listener thread.
     """
     
+    # get_file_info result for missing files; copied, never returned directly
+    _MISSING_FILE_INFO = {
+        'name': '',
+        'stem': '',
+        'suffix': '',
+        'size': 0,
+        'size_mb': 0,
+        'created_time': 0,
+        'modified_time': 0,
+        'is_video': False,
+        'is_audio': False,
+        'is_image': False,
+        'exists': False
+    }
+    
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
@@ -28,6 +133,21 @@ class FileHandler:
         # Supported image formats
         self.image_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff'}
         
+        # Extension -> kind, so one lookup classifies a file
+        self._ext_kind = {
+            **{ext: 'video' for ext in self.video_formats},
+            **{ext: 'audio' for ext in self.audio_formats},
+            **{ext: 'image' for ext in self.image_formats},
+        }
+        
+        # Worker pool for batched file operations, created on first use
+        # (see close())
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._io_executor_lock = threading.Lock()
+        
+        # LRU of directories known to exist, so repeated writes skip makedirs
+        self._known_dirs: OrderedDict = OrderedDict()
+        
         self.logger.info("FileHandler initialized")
     
     def ensure_directory(self, directory: str) -> bool:
@@ -40,12 +160,33 @@ class FileHandler:
         Returns:
             True if directory exists or was created
         """
+        if directory in self._known_dirs:
+            self._known_dirs.move_to_end(directory)
+            return True
+        
         try:
             os.makedirs(directory, exist_ok=True)
-            return True
         except Exception as e:
             self.logger.error(f"Failed to create directory {directory}: {e}")
             return False
+        
+        self._known_dirs[directory] = None
+        if len(self._known_dirs) > KNOWN_DIRS_MAX:
+            self._known_dirs.popitem(last=False)
+        return True
+    
+    def invalidate_dir(self, directory: str):
+        """
+        Forget that directory (and anything below it) exists
+        
+        Call after removing a directory outside of delete_directory.
+        
+        Args:
+            directory: Directory path
+        """
+        prefix = os.path.join(directory, '')
+        for known in [d for d in self._known_dirs if d == directory or d.startswith(prefix)]:
+            del self._known_dirs[known]
     
     def get_file_size(self, filepath: str) -> int:
         """
@@ -62,56 +203,95 @@ class FileHandler:
         except OSError:
             return 0
     
-    def get_file_info(self, filepath: str) -> Dict[str, Any]:
+    def get_cache_info(self, filepath: str) -> Dict[str, Any]:
+        """
+        Get file size and page-cache residency
+        
+        Uses cachestat(2) where the kernel supports it (Linux 6.5+); elsewhere
+        the counters are None. Counters are in pages.
+        
+        Args:
+            filepath: File path
+            
+        Returns:
+            Dictionary with 'size' and the five cachestat counters
+        """
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            counters = _cachestat(fd)
+        finally:
+            os.close(fd)
+        
+        if counters is None:
+            counters = dict.fromkeys(name for name, _ in _Cachestat._fields_)
+        
+        return {'size': size, **counters}
+    
+    def get_file_info(self, filepath: str, include_cache: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive file information
         
         Args:
             filepath: File path
+            include_cache: Also report page-cache residency under 'cache'
             
         Returns:
             Dictionary with file information
         """
         try:
             stat = os.stat(filepath)
-            path_obj = Path(filepath)
             
-            return {
-                'name': path_obj.name,
-                'stem': path_obj.stem,
-                'suffix': path_obj.suffix,
+            # Plain string ops instead of a Path object
+            name = os.path.basename(os.fspath(filepath))
+            stem, suffix = os.path.splitext(name)
+            kind = self._ext_kind.get(suffix.lower())
+            
+            info = {
+                'name': name,
+                'stem': stem,
+                'suffix': suffix,
                 'size': stat.st_size,
                 'size_mb': stat.st_size / (1024 * 1024),
                 'created_time': stat.st_ctime,
                 'modified_time': stat.st_mtime,
-                'is_video': path_obj.suffix.lower() in self.video_formats,
-                'is_audio': path_obj.suffix.lower() in self.audio_formats,
-                'is_image': path_obj.suffix.lower() in self.image_formats,
+                'is_video': kind == 'video',
+                'is_audio': kind == 'audio',
+                'is_image': kind == 'image',
                 'exists': True
             }
+            
+            if include_cache:
+                try:
+                    info['cache'] = self.get_cache_info(filepath)
+                except OSError as e:
+                    self.logger.debug("Cache info unavailable for %s: %s", filepath, e)
+                    info['cache'] = None
+            
+            return info
         except OSError:
-            return {
-                'name': os.path.basename(filepath),
-                'stem': '',
-                'suffix': '',
-                'size': 0,
-                'size_mb': 0,
-                'created_time': 0,
-                'modified_time': 0,
-                'is_video': False,
-                'is_audio': False,
-                'is_image': False,
-                'exists': False
-            }
+            return self._not_exist_info(filepath)
     
-    def copy_file(self, src: str, dst: str, overwrite: bool = False) -> bool:
+    def _not_exist_info(self, filepath: str) -> Dict[str, Any]:
+        """get_file_info result for a missing file"""
+        info = self._MISSING_FILE_INFO.copy()
+        info['name'] = os.path.basename(filepath)
+        return info
+    
+    def copy_file(self, src: str, dst: str, overwrite: bool = False,
+                  use_mmap: bool = False) -> bool:
         """
         Copy file from source to destination
         
+        Large regular files on Linux are copied in-kernel with sendfile
+        (or through an mmap of the source with use_mmap=True); metadata is
+        copied as shutil.copy2 would.
+        
         Args:
             src: Source file path
             dst: Destination file path
             overwrite: Whether to overwrite existing file
+            use_mmap: Write from a memory map of the source instead of sendfile
             
         Returns:
             True if copy successful
@@ -121,14 +301,92 @@ class FileHandler:
                 self.logger.warning(f"Destination file exists: {dst}")
                 return False
             
-            shutil.copy2(src, dst)
-            self.logger.info(f"Copied file: {src} -> {dst}")
+            if os.path.isdir(dst):
+                dst = os.path.join(dst, os.path.basename(src))
+            
+            size = os.path.getsize(src)
+            if (size > LARGE_FILE_THRESHOLD and sys.platform.startswith('linux')
+                    and os.path.isfile(src)):
+                if os.path.exists(dst) and os.path.samefile(src, dst):
+                    raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+                self._copy_large_file(src, dst, size, use_mmap)
+            else:
+                shutil.copy2(src, dst)
+            
+            self.logger.info("Copied file: %s -> %s", src, dst)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to copy file {src} to {dst}: {e}")
             return False
     
+    def _copy_large_file(self, src: str, dst: str, size: int, use_mmap: bool):
+        """Copy file contents without a userspace read loop, then copy metadata"""
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                offset = 0
+                if use_mmap:
+                    with mmap.mmap(src_fd, size, prot=mmap.PROT_READ) as mm, memoryview(mm) as view:
+                        while offset < size:
+                            offset += os.write(dst_fd, view[offset:])
+                else:
+                    while offset < size:
+                        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                        if sent == 0:
+                            break  # Source shrank while copying
+                        offset += sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        
+        shutil.copystat(src, dst)
+    
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Shared worker pool for batched I/O (size from 'io_parallelism')"""
+        executor = self._io_executor
+        if executor is None:
+            # Concurrent first callers must not each build (and leak) a pool
+            with self._io_executor_lock:
+                executor = self._io_executor
+                if executor is None:
+                    executor = self._io_executor = ThreadPoolExecutor(
+                        max_workers=self.config.get('io_parallelism', 32),
+                        thread_name_prefix='file_io'
+                    )
+        return executor
+    
+    def close(self):
+        """Shut down the batched I/O worker pool (it is recreated if used again)"""
+        with self._io_executor_lock:
+            executor, self._io_executor = self._io_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def bulk_copy(self, pairs: List[Tuple[str, str]], overwrite: bool = False) -> List[bool]:
+        """
+        Copy many files at once
+        
+        The copies run on a worker pool, so the blocking open/read/write
+        calls of different files overlap instead of running one by one.
+        
+        Args:
+            pairs: (source, destination) path pairs
+            overwrite: Whether to overwrite existing files
+            
+        Returns:
+            Success flag per pair, in the same order
+        """
+        if not pairs:
+            return []
+        if len(pairs) == 1:
+            return [self.copy_file(pairs[0][0], pairs[0][1], overwrite)]
+        
+        executor = self._get_io_executor()
+        return list(executor.map(lambda pair: self.copy_file(pair[0], pair[1], overwrite), pairs))
+    
     def move_file(self, src: str, dst: str, overwrite: bool = False) -> bool:
         """
         Move file from source to destination
@@ -147,7 +405,7 @@ class FileHandler:
                 return False
             
             shutil.move(src, dst)
-            self.logger.info(f"Moved file: {src} -> {dst}")
+            self.logger.info("Moved file: %s -> %s", src, dst)
             return True
             
         except Exception as e:
@@ -166,7 +424,7 @@ class FileHandler:
         """
         try:
             os.remove(filepath)
-            self.logger.info(f"Deleted file: {filepath}")
+            self.logger.info("Deleted file: %s", filepath)
             return True
         except OSError as e:
             self.logger.error(f"Failed to delete file {filepath}: {e}")
@@ -188,7 +446,8 @@ class FileHandler:
                 shutil.rmtree(directory)
             else:
                 os.rmdir(directory)
-            self.logger.info(f"Deleted directory: {directory}")
+            self.invalidate_dir(directory)
+            self.logger.info("Deleted directory: %s", directory)
             return True
         except OSError as e:
             self.logger.error(f"Failed to delete directory {directory}: {e}")
@@ -206,8 +465,19 @@ class FileHandler:
             File content as string, or None if failed
         """
         try:
-            with open(filepath, 'r', encoding=encoding) as f:
-                return f.read()
+            with open(filepath, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= MMAP_READ_THRESHOLD:
+                    # Decode straight from the page cache, no intermediate bytes
+                    with mmap.mmap(f.fileno(), size, prot=mmap.PROT_READ) as mm:
+                        text = str(mm, encoding)
+                else:
+                    text = f.read().decode(encoding)
+            
+            # Same newline handling as reading in text mode
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
         except Exception as e:
             self.logger.error(f"Failed to read text file {filepath}: {e}")
             return None
@@ -228,15 +498,110 @@ class FileHandler:
             # Ensure directory exists
             self.ensure_directory(os.path.dirname(filepath))
             
-            with open(filepath, 'w', encoding=encoding) as f:
-                f.write(content)
+            # Encode once and replace the file atomically; newlines as text mode would
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            self._write_bytes(filepath, content.encode(encoding))
             
-            self.logger.info(f"Wrote text file: {filepath}")
+            self.logger.info("Wrote text file: %s", filepath)
             return True
         except Exception as e:
             self.logger.error(f"Failed to write text file {filepath}: {e}")
             return False
     
+    def _write_bytes(self, filepath: str, data: bytes):
+        """
+        Atomically replace filepath with data, recreating its directory if needed
+        
+        ensure_directory remembers directories it has seen, so one removed by
+        someone else (e.g. TempManager.cleanup_all) only shows up here as
+        ENOENT; the stale entry is dropped and the write retried once.
+        """
+        try:
+            self._replace_file(filepath, data)
+        except FileNotFoundError:
+            directory = os.path.dirname(filepath)
+            if not directory:
+                raise
+            self.invalidate_dir(directory)
+            if not self.ensure_directory(directory):
+                raise
+            self._replace_file(filepath, data)
+    
+    def _replace_file(self, filepath: str, data: bytes):
+        """
+        Atomically replace filepath with data
+        
+        The bytes are written and fsynced under a temporary file that only
+        gets a name once complete, then renamed over filepath, so readers
+        never see a torn file. On Linux the temporary file is created with
+        O_TMPFILE and linked in at the end; elsewhere it is a named file.
+        
+        A symlinked filepath is written through to its target, and an
+        existing file keeps its permission bits and owner.
+        """
+        # Replace the file a symlink points to, not the link itself
+        filepath = os.path.realpath(filepath)
+        directory = os.path.dirname(filepath) or '.'
+        
+        try:
+            existing = os.stat(filepath)
+        except FileNotFoundError:
+            existing = None
+        tmp_path = f"{filepath}.{secrets.token_hex(6)}.tmp"
+        
+        fd = None
+        if hasattr(os, 'O_TMPFILE'):
+            try:
+                fd = os.open(directory, os.O_TMPFILE | os.O_WRONLY, 0o666)
+            except OSError:
+                fd = None  # Not every filesystem supports O_TMPFILE
+        
+        linked = fd is not None
+        if fd is None:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+                if existing is not None:
+                    self._copy_ownership(fd, existing)
+                os.fsync(fd)
+                
+                if linked:
+                    # Give the anonymous file a name only now that it is complete.
+                    # Passing a dir fd makes os.link use linkat(AT_SYMLINK_FOLLOW),
+                    # which resolves the /proc link to the file itself
+                    dir_fd = os.open(directory, os.O_RDONLY)
+                    try:
+                        os.link(f"/proc/self/fd/{fd}", tmp_path,
+                                src_dir_fd=dir_fd, follow_symlinks=True)
+                    finally:
+                        os.close(dir_fd)
+            finally:
+                os.close(fd)
+            
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _copy_ownership(self, fd: int, st: os.stat_result):
+        """Give the file open on fd the mode and owner described by st"""
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, st.st_mode & 0o7777)
+        if hasattr(os, 'fchown'):
+            try:
+                os.fchown(fd, st.st_uid, st.st_gid)
+            except PermissionError:
+                # Only root can give a file away; keep our own ownership then
+                pass
+    
     def read_json_file(self, filepath: str) -> Optional[Dict[str, Any]]:
         """
         Read JSON file
@@ -248,6 +613,16 @@ class FileHandler:
             JSON data as dictionary, or None if failed
         """
         try:
+            if ORJSON_AVAILABLE:
+                # orjson parses the raw bytes, no separate decode step
+                with open(filepath, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size < MMAP_READ_THRESHOLD:
+                        return orjson.loads(f.read())
+                    
+                    with mmap.mmap(f.fileno(), size, prot=mmap.PROT_READ) as mm, memoryview(mm) as view:
+                        return orjson.loads(view)
+            
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
@@ -270,10 +645,17 @@ class FileHandler:
             # Ensure directory exists
             self.ensure_directory(os.path.dirname(filepath))
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            # orjson only knows compact output or 2-space indentation
+            if ORJSON_AVAILABLE and indent in (None, 2):
+                options = orjson.OPT_NON_STR_KEYS
+                if indent:
+                    options |= orjson.OPT_INDENT_2
+                self._write_bytes(filepath, orjson.dumps(data, option=options))
+            else:
+                text = json.dumps(data, indent=indent, ensure_ascii=False)
+                self._write_bytes(filepath, text.encode('utf-8'))
             
-            self.logger.info(f"Wrote JSON file: {filepath}")
+            self.logger.info("Wrote JSON file: %s", filepath)
             return True
         except Exception as e:
             self.logger.error(f"Failed to write JSON file {filepath}: {e}")
@@ -292,7 +674,14 @@ class FileHandler:
             List of file paths
         """
         try:
-            if recursive:
+            if recursive and os.sep not in pattern and '/' not in pattern:
+                # Walk serially (cheap), decide is_file in parallel: on network
+                # mounts each check can be a round-trip
+                matches = [entry for entry in self._walk_entries(directory)
+                           if fnmatch.fnmatch(entry.name, pattern)]
+                is_file = self._parallel_map(self._entry_is_file, matches)
+                return [entry.path for entry, keep in zip(matches, is_file) if keep]
+            elif recursive:
                 return [str(p) for p in Path(directory).rglob(pattern) if p.is_file()]
             else:
                 return [str(p) for p in Path(directory).glob(pattern) if p.is_file()]
@@ -314,9 +703,21 @@ class FileHandler:
         """
         if not extension.startswith('.'):
             extension = '.' + extension
+        extension = extension.lower()
+        
+        # Plain suffix compare on scandir names; no glob pattern matching
+        if recursive:
+            entries = self._walk_entries(directory)
+        else:
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                self.logger.error(f"Failed to list files in {directory}: {e}")
+                return []
         
-        pattern = f"*{extension}"
-        return self.list_files(directory, pattern, recursive)
+        return [entry.path for entry in entries
+                if entry.name.lower().endswith(extension) and self._entry_is_file(entry)]
     
     def get_unique_filename(self, filepath: str) -> str:
         """
@@ -331,20 +732,27 @@ class FileHandler:
         if not os.path.exists(filepath):
             return filepath
         
-        path_obj = Path(filepath)
-        stem = path_obj.stem
-        suffix = path_obj.suffix
-        parent = path_obj.parent
+        parent, name = os.path.split(filepath)
+        stem, suffix = os.path.splitext(name)
         
-        counter = 1
-        while True:
-            new_name = f"{stem}_{counter}{suffix}"
-            new_path = parent / new_name
-            
-            if not new_path.exists():
-                return str(new_path)
-            
-            counter += 1
+        def candidate(counter: int) -> str:
+            return os.path.join(parent, f"{stem}_{counter}{suffix}")
+        
+        # Numbered copies are usually contiguous: probe 1, 2, 4, 8, ... until
+        # a free name, then binary-search back for the first free one. Every
+        # returned name has been checked to be free, even if there are gaps.
+        taken, free = 0, 1
+        while os.path.lexists(candidate(free)):
+            taken, free = free, free * 2
+        
+        while free - taken > 1:
+            mid = (taken + free) // 2
+            if os.path.lexists(candidate(mid)):
+                taken = mid
+            else:
+                free = mid
+        
+        return candidate(free)
     
     def sanitize_filename(self, filename: str) -> str:
         """
@@ -356,22 +764,7 @@ class FileHandler:
         Returns:
             Sanitized filename
         """
-        # Invalid characters for most file systems
-        invalid_chars = '<>:"/\\|?*'
-        
-        # Replace invalid characters with underscore
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        
-        # Remove leading/trailing whitespace and dots
-        filename = filename.strip('. ')
-        
-        # Limit length
-        if len(filename) > 255:
-            name, ext = os.path.splitext(filename)
-            filename = name[:255-len(ext)] + ext
-        
-        return filename
+        return _sanitize_filename(filename)
     
     def calculate_directory_size(self, directory: str) -> int:
         """
@@ -383,16 +776,57 @@ class FileHandler:
         Returns:
             Total size in bytes
         """
-        total_size = 0
+        files = []
+        for entry in self._walk_entries(directory):
+            try:
+                if entry.is_file():
+                    files.append(entry)
+            except OSError:
+                continue
+        
+        return sum(self._parallel_map(self._entry_size, files))
+    
+    def _walk_entries(self, directory: str):
+        """Yield every non-directory entry under directory (scandir stack, no symlinked dirs)"""
+        pending = [directory]
+        
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    yield entry
+    
+    @staticmethod
+    def _entry_is_file(entry: os.DirEntry) -> bool:
+        """is_file() of a scandir entry, False if it vanished"""
         try:
-            for dirpath, dirnames, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    total_size += os.path.getsize(filepath)
+            return entry.is_file()
         except OSError:
-            pass
-        
-        return total_size
+            return False
+    
+    @staticmethod
+    def _entry_size(entry: os.DirEntry) -> int:
+        """File size of a scandir entry, 0 if it vanished"""
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return 0
+    
+    def _parallel_map(self, func, items: List) -> List:
+        """map() over items, on the I/O pool when there are enough of them"""
+        if len(items) < PARALLEL_STAT_MIN:
+            return [func(item) for item in items]
+        return list(self._get_io_executor().map(func, items))
     
     def get_disk_usage(self, path: str = None) -> Dict[str, int]:
         """
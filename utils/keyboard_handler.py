@@ -3,72 +3,112 @@
 Keyboard shortcuts handler
 """
 
+import json
+import logging
 import tkinter as tk
+from functools import lru_cache
 from typing import Dict, Any, Callable, Optional
 
+# Import orjson secara opsional (faster shortcuts config read/write)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Display names for modifier keys
+_MODIFIER_NAMES = {
+    'Control': 'Ctrl',
+    'Shift': 'Shift',
+    'Alt': 'Alt',
+    'Meta': 'Cmd',
+    'Command': 'Cmd',
+}
+
+@lru_cache(maxsize=256)
+def _format_key(key: str) -> str:
+    """Cached body of KeyboardHandler.format_key_combination"""
+    formatted_parts = []
+    for part in key.strip('<>').split('-'):
+        name = _MODIFIER_NAMES.get(part)
+        if name is None:
+            # Capitalize single letters
+            name = part.upper() if len(part) == 1 else part.capitalize()
+        formatted_parts.append(name)
+    
+    return '+'.join(formatted_parts)
+
 class KeyboardHandler:
     """
     Manages keyboard shortcuts and hotkeys
     """
     
+    # Default shortcuts, built once at import
+    _DEFAULT_SHORTCUTS = {
+        # Playback Controls
+        '<space>': {'name': 'toggle_play_pause', 'description': 'Toggle play/pause'},
+        '<Left>': {'name': 'frame_backward', 'description': 'Frame backward'},
+        '<Right>': {'name': 'frame_forward', 'description': 'Frame forward'},
+        '<Home>': {'name': 'goto_beginning', 'description': 'Go to beginning'},
+        '<End>': {'name': 'goto_end', 'description': 'Go to end'},
+        '<Up>': {'name': 'volume_up', 'description': 'Volume up'},
+        '<Down>': {'name': 'volume_down', 'description': 'Volume down'},
+        
+        # Editing
+        '<i>': {'name': 'set_in_point', 'description': 'Set in point'},
+        '<o>': {'name': 'set_out_point', 'description': 'Set out point'},
+        '<Control-z>': {'name': 'undo', 'description': 'Undo'},
+        '<Control-y>': {'name': 'redo', 'description': 'Redo'},
+        '<Delete>': {'name': 'delete_selected', 'description': 'Delete selected'},
+        '<BackSpace>': {'name': 'delete_selected', 'description': 'Delete selected'},
+        
+        # Application
+        '<Control-o>': {'name': 'open_file', 'description': 'Open file'},
+        '<Control-s>': {'name': 'save_project', 'description': 'Save project'},
+        '<Control-Shift-s>': {'name': 'save_project_as', 'description': 'Save project as'},
+        '<Control-n>': {'name': 'new_project', 'description': 'New project'},
+        '<Control-q>': {'name': 'quit_application', 'description': 'Quit application'},
+        '<Control-w>': {'name': 'close_window', 'description': 'Close window'},
+        
+        # View
+        '<F1>': {'name': 'show_help', 'description': 'Show help'},
+        '<F2>': {'name': 'toggle_fullscreen', 'description': 'Toggle fullscreen'},
+        '<F5>': {'name': 'refresh', 'description': 'Refresh'},
+        '<F11>': {'name': 'toggle_fullscreen', 'description': 'Toggle fullscreen'},
+        '<Control-plus>': {'name': 'zoom_in', 'description': 'Zoom in'},
+        '<Control-minus>': {'name': 'zoom_out', 'description': 'Zoom out'},
+        '<Control-0>': {'name': 'reset_zoom', 'description': 'Reset zoom'},
+        
+        # Timeline
+        '<Control-Left>': {'name': 'seek_backward', 'description': 'Seek backward'},
+        '<Control-Right>': {'name': 'seek_forward', 'description': 'Seek forward'},
+        '<Shift-Left>': {'name': 'seek_backward_fast', 'description': 'Seek backward fast'},
+        '<Shift-Right>': {'name': 'seek_forward_fast', 'description': 'Seek forward fast'},
+        
+        # Markers
+        '<m>': {'name': 'add_marker', 'description': 'Add marker'},
+        '<Shift-m>': {'name': 'clear_markers', 'description': 'Clear markers'},
+        
+        # Selection
+        '<Control-a>': {'name': 'select_all', 'description': 'Select all'},
+        '<Control-d>': {'name': 'deselect_all', 'description': 'Deselect all'},
+        '<Control-i>': {'name': 'invert_selection', 'description': 'Invert selection'},
+    }
+    
     def __init__(self, root: tk.Tk, config: Dict[str, Any] = None):
         self.root = root
         self.config = config or {}
+        self.logger = logging.getLogger(__name__)
         
         # Keyboard shortcuts registry
         self.shortcuts: Dict[str, Dict[str, Any]] = {}
         
-        # Default shortcuts
-        self.default_shortcuts = {
-            # Playback Controls
-            '<space>': {'name': 'toggle_play_pause', 'description': 'Toggle play/pause'},
-            '<Left>': {'name': 'frame_backward', 'description': 'Frame backward'},
-            '<Right>': {'name': 'frame_forward', 'description': 'Frame forward'},
-            '<Home>': {'name': 'goto_beginning', 'description': 'Go to beginning'},
-            '<End>': {'name': 'goto_end', 'description': 'Go to end'},
-            '<Up>': {'name': 'volume_up', 'description': 'Volume up'},
-            '<Down>': {'name': 'volume_down', 'description': 'Volume down'},
-            
-            # Editing
-            '<i>': {'name': 'set_in_point', 'description': 'Set in point'},
-            '<o>': {'name': 'set_out_point', 'description': 'Set out point'},
-            '<Control-z>': {'name': 'undo', 'description': 'Undo'},
-            '<Control-y>': {'name': 'redo', 'description': 'Redo'},
-            '<Delete>': {'name': 'delete_selected', 'description': 'Delete selected'},
-            '<BackSpace>': {'name': 'delete_selected', 'description': 'Delete selected'},
-            
-            # Application
-            '<Control-o>': {'name': 'open_file', 'description': 'Open file'},
-            '<Control-s>': {'name': 'save_project', 'description': 'Save project'},
-            '<Control-Shift-s>': {'name': 'save_project_as', 'description': 'Save project as'},
-            '<Control-n>': {'name': 'new_project', 'description': 'New project'},
-            '<Control-q>': {'name': 'quit_application', 'description': 'Quit application'},
-            '<Control-w>': {'name': 'close_window', 'description': 'Close window'},
-            
-            # View
-            '<F1>': {'name': 'show_help', 'description': 'Show help'},
-            '<F2>': {'name': 'toggle_fullscreen', 'description': 'Toggle fullscreen'},
-            '<F5>': {'name': 'refresh', 'description': 'Refresh'},
-            '<F11>': {'name': 'toggle_fullscreen', 'description': 'Toggle fullscreen'},
-            '<Control-plus>': {'name': 'zoom_in', 'description': 'Zoom in'},
-            '<Control-minus>': {'name': 'zoom_out', 'description': 'Zoom out'},
-            '<Control-0>': {'name': 'reset_zoom', 'description': 'Reset zoom'},
-            
-            # Timeline
-            '<Control-Left>': {'name': 'seek_backward', 'description': 'Seek backward'},
-            '<Control-Right>': {'name': 'seek_forward', 'description': 'Seek forward'},
-            '<Shift-Left>': {'name': 'seek_backward_fast', 'description': 'Seek backward fast'},
-            '<Shift-Right>': {'name': 'seek_forward_fast', 'description': 'Seek forward fast'},
-            
-            # Markers
-            '<m>': {'name': 'add_marker', 'description': 'Add marker'},
-            '<Shift-m>': {'name': 'clear_markers', 'description': 'Clear markers'},
-            
-            # Selection
-            '<Control-a>': {'name': 'select_all', 'description': 'Select all'},
-            '<Control-d>': {'name': 'deselect_all', 'description': 'Deselect all'},
-            '<Control-i>': {'name': 'invert_selection', 'description': 'Invert selection'},
-        }
+        # Derived from self.shortcuts, rebuilt lazily after any change
+        self._name_to_key: Optional[Dict[str, str]] = None
+        self._summary: Optional[str] = None
+        
+        # Default shortcuts (shared template, copied per shortcut on register)
+        self.default_shortcuts = self._DEFAULT_SHORTCUTS
         
         # Load shortcuts from config
         self.load_shortcuts()
@@ -76,6 +116,11 @@ class KeyboardHandler:
         # Register default shortcuts
         self.register_default_shortcuts()
     
+    def _invalidate_shortcuts(self):
+        """Drop caches derived from self.shortcuts"""
+        self._name_to_key = None
+        self._summary = None
+    
     def load_shortcuts(self):
         """Load shortcuts from configuration"""
         custom_shortcuts = self.config.get('keyboard_shortcuts', {})
@@ -87,12 +132,20 @@ class KeyboardHandler:
             else:
                 # Handle simple format: {'<Control-s>': 'save_project'}
                 self.shortcuts[key] = {'name': shortcut_info, 'description': ''}
+        
+        self._invalidate_shortcuts()
     
     def register_default_shortcuts(self):
         """Register default keyboard shortcuts"""
-        for key, shortcut_info in self.default_shortcuts.items():
-            if key not in self.shortcuts:
-                self.shortcuts[key] = shortcut_info.copy()
+        # One update; custom shortcuts keep their keys and stay first in order.
+        # Each entry is copied so edits never reach the class-level template
+        self.shortcuts.update({
+            key: shortcut_info.copy()
+            for key, shortcut_info in self._DEFAULT_SHORTCUTS.items()
+            if key not in self.shortcuts
+        })
+        
+        self._invalidate_shortcuts()
     
     def register_shortcut(self, key: str, name: str, callback: Callable, 
                           description: str = ""):
@@ -110,6 +163,7 @@ class KeyboardHandler:
             'callback': callback,
             'description': description
         }
+        self._invalidate_shortcuts()
         
         # Bind the shortcut
         self.root.bind(key, callback)
@@ -123,6 +177,7 @@ class KeyboardHandler:
         """
         if key in self.shortcuts:
             del self.shortcuts[key]
+            self._invalidate_shortcuts()
             self.root.unbind(key)
     
     def get_shortcut(self, key: str) -> Optional[Dict[str, Any]]:
@@ -147,10 +202,14 @@ class KeyboardHandler:
         Returns:
             Key combination or None
         """
-        for key, shortcut_info in self.shortcuts.items():
-            if shortcut_info.get('name') == name:
-                return key
-        return None
+        if self._name_to_key is None:
+            # First key registered under a name wins, as with a linear scan
+            index = {}
+            for key, shortcut_info in self.shortcuts.items():
+                index.setdefault(shortcut_info.get('name'), key)
+            self._name_to_key = index
+        
+        return self._name_to_key.get(name)
     
     def get_all_shortcuts(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -190,8 +249,7 @@ class KeyboardHandler:
         Returns:
             True if key is a modifier
         """
-        modifier_keys = {'Control', 'Shift', 'Alt', 'Meta', 'Command'}
-        return key in modifier_keys
+        return key in _MODIFIER_NAMES
     
     def format_key_combination(self, key: str) -> str:
         """
@@ -203,31 +261,7 @@ class KeyboardHandler:
         Returns:
             Formatted string (e.g., 'Ctrl+S')
         """
-        # Remove angle brackets
-        key = key.strip('<>')
-        
-        # Split into parts
-        parts = key.split('-')
-        
-        # Format each part
-        formatted_parts = []
-        for part in parts:
-            if part == 'Control':
-                formatted_parts.append('Ctrl')
-            elif part == 'Shift':
-                formatted_parts.append('Shift')
-            elif part == 'Alt':
-                formatted_parts.append('Alt')
-            elif part == 'Meta' or part == 'Command':
-                formatted_parts.append('Cmd')
-            else:
-                # Capitalize single letters
-                if len(part) == 1:
-                    formatted_parts.append(part.upper())
-                else:
-                    formatted_parts.append(part.capitalize())
-        
-        return '+'.join(formatted_parts)
+        return _format_key(key)
     
     def get_shortcuts_summary(self) -> str:
         """
@@ -236,8 +270,10 @@ class KeyboardHandler:
         Returns:
             Formatted string with all shortcuts
         """
-        summary = "Keyboard Shortcuts:\n"
-        summary += "=" * 50 + "\n\n"
+        if self._summary is not None:
+            return self._summary
+        
+        parts = ["Keyboard Shortcuts:\n", "=" * 50, "\n\n"]
         
         # Group shortcuts by category
         categories = {
@@ -255,8 +291,8 @@ class KeyboardHandler:
         }
         
         for category, shortcut_names in categories.items():
-            summary += f"{category}:\n"
-            summary += "-" * 20 + "\n"
+            parts.append(f"{category}:\n")
+            parts.append("-" * 20 + "\n")
             
             for name in shortcut_names:
                 key = self.get_shortcut_by_name(name)
@@ -264,11 +300,12 @@ class KeyboardHandler:
                     shortcut_info = self.shortcuts.get(key, {})
                     description = shortcut_info.get('description', '')
                     formatted_key = self.format_key_combination(key)
-                    summary += f"  {formatted_key:<20} - {description}\n"
+                    parts.append(f"  {formatted_key:<20} - {description}\n")
             
-            summary += "\n"
+            parts.append("\n")
         
-        return summary
+        self._summary = ''.join(parts)
+        return self._summary
     
     def show_shortcuts_help(self):
         """Show shortcuts help dialog"""
@@ -284,8 +321,6 @@ class KeyboardHandler:
         Args:
             filepath: Path to save configuration
         """
-        import json
-        
         # Prepare data for saving
         config_data = {}
         for key, shortcut_info in self.shortcuts.items():
@@ -293,10 +328,14 @@ class KeyboardHandler:
                 config_data[key] = shortcut_info['name']
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w') as f:
+                    json.dump(config_data, f, indent=2)
         except Exception as e:
-            print(f"Failed to save shortcuts config: {e}")
+            self.logger.error(f"Failed to save shortcuts config: {e}")
     
     def load_shortcuts_config(self, filepath: str):
         """
@@ -305,18 +344,21 @@ class KeyboardHandler:
         Args:
             filepath: Path to configuration file
         """
-        import json
-        
         try:
-            with open(filepath, 'r') as f:
-                config_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'rb') as f:
+                    config_data = orjson.loads(f.read())
+            else:
+                with open(filepath, 'r') as f:
+                    config_data = json.load(f)
             
             # Update shortcuts
             for key, name in config_data.items():
                 if key in self.shortcuts:
                     self.shortcuts[key]['name'] = name
+            self._invalidate_shortcuts()
         except Exception as e:
-            print(f"Failed to load shortcuts config: {e}")
+            self.logger.error(f"Failed to load shortcuts config: {e}")
 
 # Test the keyboard_handler
 if __name__ == "__main__":
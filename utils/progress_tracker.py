@@ -6,7 +6,47 @@ Progress tracking utility for long-running operations
 import threading
 import time
 import logging
-from typing import Dict, Any, Optional, Callable
+from collections import deque
+from typing import Dict, Any, List, Optional, Callable
+
+# Import fastrlock secara opsional (lock lebih ringan untuk critical section pendek)
+try:
+    from fastrlock.rlock import FastRLock as _Lock
+    FASTRLOCK_AVAILABLE = True
+except ImportError:
+    # Reentrant like FastRLock, so nesting behaves the same either way
+    from threading import RLock as _Lock
+    FASTRLOCK_AVAILABLE = False
+
+# Elapsed/ETA math uses a clock that does not jump with NTP or DST changes
+_monotonic = time.monotonic
+
+class _Operation:
+    """State of one tracked operation (slots keep it compact and attribute access fast)"""
+    
+    __slots__ = ('current_step', 'total_steps', 'description', 'start_time', 'callback',
+                 'completed_event', 'cancelled_event', 'completion_event', 'error', 'message',
+                 'success', 'lock')
+    
+    def __init__(self, total_steps: int, description: str):
+        self.current_step = 0
+        self.total_steps = total_steps
+        self.description = description
+        self.start_time = _monotonic()
+        self.callback = None
+        self.completed_event = threading.Event()
+        self.cancelled_event = threading.Event()
+        self.completion_event = threading.Event()  # Set once completed or cancelled
+        self.error = None
+        self.message = ''
+        self.success = None
+        # Orders progress writes against completion/cancellation so a late
+        # update_progress cannot undo the final fields
+        self.lock = _Lock()
+    
+    def is_active(self) -> bool:
+        """True while the operation is neither completed nor cancelled"""
+        return not self.completion_event.is_set()
 
 class ProgressTracker:
     """
@@ -15,8 +55,16 @@ class ProgressTracker:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.operations: Dict[str, Dict[str, Any]] = {}
-        self.lock = threading.Lock()
+        self.operations: Dict[str, _Operation] = {}
+        # Only guards inserting/removing entries; each operation's lock orders
+        # its progress writes against completion
+        self._ops_lock = _Lock()
+        
+        # Finished operations are dropped automatically once there are too many
+        # of them or they are older than the retention window
+        self._max_retained = 128
+        self._retention_secs = 300
+        self._finished = deque()  # (operation_id, operation, finish_time), oldest first
         
         self.logger.info("ProgressTracker initialized")
     
@@ -30,19 +78,36 @@ class ProgressTracker:
             total_steps: Total number of steps in the operation
             description: Description of the operation
         """
-        with self.lock:
-            self.operations[operation_id] = {
-                'current_step': 0,
-                'total_steps': total_steps,
-                'description': description,
-                'start_time': time.time(),
-                'callback': None,
-                'completed': False,
-                'error': None
-            }
+        operation = _Operation(total_steps, description)
+        
+        with self._ops_lock:
+            self.operations[operation_id] = operation
+            self._prune_finished(_monotonic())
         
         self.logger.info(f"Started tracking operation: {operation_id}")
     
+    def _retire(self, operation_id: str, operation: _Operation) -> None:
+        """Queue a finished operation for automatic removal"""
+        now = _monotonic()
+        with self._ops_lock:
+            self._finished.append((operation_id, operation, now))
+            self._prune_finished(now)
+    
+    def _prune_finished(self, now: float) -> None:
+        """Drop finished operations past the retention limits (caller holds _ops_lock)"""
+        finished = self._finished
+        while finished and (len(finished) > self._max_retained
+                            or now - finished[0][2] > self._retention_secs):
+            operation_id, operation, _ = finished.popleft()
+            # The id may have been cleaned up or reused by a newer operation since
+            if self.operations.get(operation_id) is operation:
+                del self.operations[operation_id]
+    
+    def _get_operation(self, operation_id: str) -> Optional[_Operation]:
+        """Look up an operation without holding its lock"""
+        with self._ops_lock:
+            return self.operations.get(operation_id)
+    
     def update_progress(self, operation_id: str, current_step: int, 
                        message: str = "") -> None:
         """
@@ -53,26 +118,33 @@ class ProgressTracker:
             current_step: Current step number
             message: Optional progress message
         """
-        with self.lock:
-            if operation_id not in self.operations:
-                self.logger.warning(f"Unknown operation: {operation_id}")
+        # Hot path: atomic dict lookup, no registry lock
+        operation = self.operations.get(operation_id)
+        if operation is None:
+            self.logger.warning(f"Unknown operation: {operation_id}")
+            return
+        
+        # Late updates from worker threads must not overwrite the final
+        # fields once complete_operation/cancel_operation has run
+        with operation.lock:
+            if operation.completion_event.is_set():
                 return
-            
-            operation = self.operations[operation_id]
-            operation['current_step'] = current_step
-            operation['message'] = message
-            
+            operation.current_step = current_step
+            operation.message = message
+        
+        # Call callback if registered; polled operations stop here
+        callback = operation.callback
+        if callback:
             # Calculate progress percentage
-            progress = (current_step / operation['total_steps']) * 100
-            
-            # Call callback if registered
-            if operation['callback']:
-                try:
-                    operation['callback'](progress, message)
-                except Exception as e:
-                    self.logger.error(f"Error in progress callback: {e}")
+            progress = (current_step / operation.total_steps) * 100
+            try:
+                callback(progress, message)
+            except Exception as e:
+                self.logger.error(f"Error in progress callback: {e}")
         
-        self.logger.debug(f"Updated progress for {operation_id}: {current_step}/{operation['total_steps']}")
+        # Called per download chunk: only format the message when DEBUG is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Updated progress for %s: %s/%s", operation_id, current_step, operation.total_steps)
     
     def set_callback(self, operation_id: str, callback: Callable[[float, str], None]) -> None:
         """
@@ -82,9 +154,10 @@ class ProgressTracker:
             operation_id: Operation identifier
             callback: Callback function (progress, message) -> None
         """
-        with self.lock:
-            if operation_id in self.operations:
-                self.operations[operation_id]['callback'] = callback
+        operation = self._get_operation(operation_id)
+        if operation is not None:
+            # Single assignment, atomic under the GIL; readers copy it once
+            operation.callback = callback
     
     def get_progress(self, operation_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -96,37 +169,44 @@ class ProgressTracker:
         Returns:
             Progress information dictionary or None if not found
         """
-        with self.lock:
-            if operation_id not in self.operations:
-                return None
-            
-            operation = self.operations[operation_id]
-            
-            # Calculate progress percentage
-            progress = (operation['current_step'] / operation['total_steps']) * 100
-            
-            # Calculate elapsed time
-            elapsed = time.time() - operation['start_time']
-            
-            # Estimate remaining time
-            if progress > 0:
-                estimated_total = elapsed / (progress / 100)
-                remaining = estimated_total - elapsed
-            else:
-                remaining = None
-            
-            return {
-                'operation_id': operation_id,
-                'current_step': operation['current_step'],
-                'total_steps': operation['total_steps'],
-                'progress': progress,
-                'description': operation['description'],
-                'message': operation.get('message', ''),
-                'elapsed_time': elapsed,
-                'estimated_remaining': remaining,
-                'completed': operation['completed'],
-                'error': operation['error']
-            }
+        # Polled from UI threads: dict.get is atomic, so readers skip the registry lock
+        operation = self.operations.get(operation_id)
+        if operation is None:
+            return None
+        
+        # Snapshot fields once; completion is read first because
+        # complete_operation sets the event after the final fields
+        completed = operation.completed_event.is_set()
+        current_step = operation.current_step
+        total_steps = operation.total_steps
+        message = operation.message
+        error = operation.error
+        
+        # Calculate progress percentage
+        progress = (current_step / total_steps) * 100
+        
+        # Calculate elapsed time
+        elapsed = _monotonic() - operation.start_time
+        
+        # Estimate remaining time
+        if progress > 0:
+            estimated_total = elapsed / (progress / 100)
+            remaining = estimated_total - elapsed
+        else:
+            remaining = None
+        
+        return {
+            'operation_id': operation_id,
+            'current_step': current_step,
+            'total_steps': total_steps,
+            'progress': progress,
+            'description': operation.description,
+            'message': message,
+            'elapsed_time': elapsed,
+            'estimated_remaining': remaining,
+            'completed': completed,
+            'error': error
+        }
     
     def complete_operation(self, operation_id: str, success: bool = True, 
                           error: str = None) -> None:
@@ -138,29 +218,36 @@ class ProgressTracker:
             success: Whether operation completed successfully
             error: Error message if operation failed
         """
-        with self.lock:
-            if operation_id not in self.operations:
-                self.logger.warning(f"Unknown operation: {operation_id}")
-                return
-            
-            operation = self.operations[operation_id]
-            operation['completed'] = True
-            operation['success'] = success
-            operation['error'] = error
+        operation = self._get_operation(operation_id)
+        if operation is None:
+            self.logger.warning(f"Unknown operation: {operation_id}")
+            return
+        
+        # Final fields and completion in one step, so no update_progress
+        # lands in between
+        with operation.lock:
+            operation.success = success
+            operation.error = error
             
             # Calculate final progress
             if success:
-                operation['current_step'] = operation['total_steps']
+                operation.current_step = operation.total_steps
                 progress = 100.0
             else:
-                progress = (operation['current_step'] / operation['total_steps']) * 100
+                progress = (operation.current_step / operation.total_steps) * 100
             
-            # Call callback if registered
-            if operation['callback']:
-                try:
-                    operation['callback'](progress, "Completed" if success else f"Error: {error}")
-                except Exception as e:
-                    self.logger.error(f"Error in progress callback: {e}")
+            # Set last so readers that see completion also see the final fields
+            operation.completed_event.set()
+            operation.completion_event.set()
+        self._retire(operation_id, operation)
+        
+        # Call callback if registered
+        callback = operation.callback
+        if callback:
+            try:
+                callback(progress, "Completed" if success else f"Error: {error}")
+            except Exception as e:
+                self.logger.error(f"Error in progress callback: {e}")
         
         status = "completed successfully" if success else f"failed: {error}"
         self.logger.info(f"Operation {operation_id} {status}")
@@ -172,10 +259,30 @@ class ProgressTracker:
         Args:
             operation_id: Operation identifier
         """
-        with self.lock:
-            if operation_id in self.operations:
-                self.operations[operation_id]['cancelled'] = True
-                self.logger.info(f"Operation {operation_id} cancelled")
+        operation = self._get_operation(operation_id)
+        if operation is not None:
+            with operation.lock:
+                operation.cancelled_event.set()
+                operation.completion_event.set()
+            self._retire(operation_id, operation)
+            self.logger.info(f"Operation {operation_id} cancelled")
+    
+    def wait_for_completion(self, operation_id: str, timeout: Optional[float] = None) -> bool:
+        """
+        Block until an operation is completed or cancelled
+        
+        Args:
+            operation_id: Operation identifier
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+            
+        Returns:
+            True if the operation finished (or is not tracked), False on timeout
+        """
+        operation = self.operations.get(operation_id)
+        if operation is None:
+            return True
+        
+        return operation.completion_event.wait(timeout)
     
     def is_operation_active(self, operation_id: str) -> bool:
         """
@@ -187,25 +294,35 @@ class ProgressTracker:
         Returns:
             True if operation is active, False otherwise
         """
-        with self.lock:
-            if operation_id not in self.operations:
-                return False
-            
-            operation = self.operations[operation_id]
-            return not operation['completed'] and not operation.get('cancelled', False)
+        operation = self.operations.get(operation_id)  # Atomic lookup, no lock needed
+        if operation is None:
+            return False
+        
+        return operation.is_active()
+    
+    def get_active_operation_ids(self) -> List[str]:
+        """
+        Get the ids of all active operations
+        
+        Returns:
+            List of operation identifiers
+        """
+        with self._ops_lock:
+            return [op_id for op_id, operation in self.operations.items() if operation.is_active()]
     
     def get_active_operations(self) -> Dict[str, Dict[str, Any]]:
         """
         Get all active operations
         
         Returns:
-            Dictionary of active operations
+            Dictionary of operation id -> progress information (see get_progress)
         """
-        with self.lock:
-            return {
-                op_id: op_data for op_id, op_data in self.operations.items()
-                if not op_data['completed'] and not op_data.get('cancelled', False)
-            }
+        active = {}
+        for op_id in self.get_active_operation_ids():
+            progress = self.get_progress(op_id)
+            if progress is not None:  # May have been cleaned up since the snapshot
+                active[op_id] = progress
+        return active
     
     def cleanup_operation(self, operation_id: str) -> None:
         """
@@ -214,17 +331,17 @@ class ProgressTracker:
         Args:
             operation_id: Operation identifier
         """
-        with self.lock:
+        with self._ops_lock:
             if operation_id in self.operations:
                 del self.operations[operation_id]
                 self.logger.debug(f"Cleaned up operation: {operation_id}")
     
     def cleanup_all_operations(self) -> None:
         """Remove all completed operations"""
-        with self.lock:
+        with self._ops_lock:
             completed_ops = [
-                op_id for op_id, op_data in self.operations.items()
-                if op_data['completed'] or op_data.get('cancelled', False)
+                op_id for op_id, operation in self.operations.items()
+                if not operation.is_active()
             ]
             
             for op_id in completed_ops:
@@ -265,11 +382,10 @@ if __name__ == "__main__":
     thread.daemon = True
     thread.start()
     
-    # Monitor progress
-    while tracker.is_operation_active("test_op"):
+    # Monitor progress, waking up early as soon as the operation finishes
+    while not tracker.wait_for_completion("test_op", timeout=1):
         progress_info = tracker.get_progress("test_op")
         if progress_info:
             print(f"Active operation: {progress_info['operation_id']} - {progress_info['progress']:.1f}%")
-        time.sleep(1)
     
     print("Test completed")
\ No newline at end of file
@@ -5,8 +5,12 @@ Depends on: temp_manager.py
 """
 
 import os
+import re
 import logging
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Callable
 
 from core.temp_manager import TempManager
@@ -19,11 +23,47 @@ except ImportError:
     YTDLP_AVAILABLE = False
     print("Warning: yt-dlp not available. URL download functionality will be disabled.")
 
+# yt-dlp memanggil progress hook per buffer jaringan; callback hanya diteruskan
+# jika sudah lewat interval ini atau progres naik minimal satu step
+PROGRESS_EMIT_INTERVAL = 0.25
+PROGRESS_EMIT_STEP = 1.0
+
+PLATFORM_PATTERNS = {
+    'youtube': ['youtube.com', 'youtu.be'],
+    'vimeo': ['vimeo.com'],
+    'twitter': ['twitter.com', 'x.com'],
+    'instagram': ['instagram.com'],
+    'tiktok': ['tiktok.com'],
+    'gdrive': ['drive.google.com'],
+    'dropbox': ['dropbox.com/s/'],
+}
+
+@lru_cache(maxsize=1024)
+def _match_platform(url: str, platform_re: re.Pattern) -> str:
+    """Match a URL against the combined platform regex (one named group per platform)"""
+    match = platform_re.search(url)
+    if match:
+        return match.lastgroup
+    
+    # Check if direct URL; only the scheme needs case-folding, not the whole URL
+    if url[:8].lower().startswith(('http://', 'https://')):
+        return 'direct'
+    
+    return 'unknown'
+
 class URLDownloader:
     """
     Downloads videos from various platforms using yt-dlp
     """
     
+    # yt-dlp format string per quality setting
+    _QUALITY_FORMATS = {
+        '1080p': 'best[height<=1080][ext=mp4]/best[height<=1080]/best[ext=mp4]/best',
+        '720p': 'best[height<=720][ext=mp4]/best[height<=720]/best[ext=mp4]/best',
+        '480p': 'best[height<=480][ext=mp4]/best[height<=480]/best[ext=mp4]/best',
+        '360p': 'best[height<=360][ext=mp4]/best[height<=360]/best[ext=mp4]/best',
+    }
+    
     def __init__(self, temp_manager: TempManager, config: Dict[str, Any] = None):
         self.temp_manager = temp_manager
         self.config = config or {}
@@ -38,13 +78,19 @@ class URLDownloader:
         # Download options
         self.default_quality = self.config.get('default_video_quality', '720p')
         
+        # All platform patterns in one regex so detect_platform scans the URL once
+        self._platform_re = re.compile('|'.join(
+            f"(?P<{platform}>{'|'.join(re.escape(p) for p in patterns)})"
+            for platform, patterns in PLATFORM_PATTERNS.items()
+        ), re.IGNORECASE)
+        
         # Check if yt-dlp is available
         if not YTDLP_AVAILABLE:
             self.logger.warning("yt-dlp not available. URL download functionality disabled.")
         
         # yt-dlp options (hanya jika tersedia)
         if YTDLP_AVAILABLE:
-            self.ydl_opts = {
+            self._base_ydl_opts = {
                 'format': 'best[ext=mp4]/best',
                 'outtmpl': os.path.join(temp_manager.temp_dir or '', '%(title)s.%(ext)s'),
                 'quiet': False,
@@ -55,6 +101,12 @@ class URLDownloader:
                     'preferedformat': 'mp4',
                 }],
             }
+            self.ydl_opts = self._base_ydl_opts  # Public alias, same dict
+        
+        # Shared metadata-only YoutubeDL, created on first use; YoutubeDL is not
+        # thread-safe, so calls on it are serialized
+        self._info_ydl = None
+        self._info_lock = threading.Lock()
         
         self.logger.info("URLDownloader initialized")
     
@@ -72,29 +124,22 @@ class URLDownloader:
         Returns:
             Platform name or 'unknown'
         """
-        url_lower = url.lower()
-        
-        platform_patterns = {
-            'youtube': ['youtube.com', 'youtu.be'],
-            'vimeo': ['vimeo.com'],
-            'twitter': ['twitter.com', 'x.com'],
-            'instagram': ['instagram.com'],
-            'tiktok': ['tiktok.com'],
-            'gdrive': ['drive.google.com'],
-            'dropbox': ['dropbox.com/s/'],
-        }
-        
-        for platform, patterns in platform_patterns.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    self.logger.info(f"Detected platform: {platform}")
-                    return platform
-        
-        # Check if direct URL
-        if url_lower.startswith(('http://', 'https://')):
-            return 'direct'
-        
-        return 'unknown'
+        platform = _match_platform(url, self._platform_re)
+        if platform not in ('direct', 'unknown'):
+            self.logger.info(f"Detected platform: {platform}")
+        return platform
+    
+    def _extract_info_only(self, url: str) -> Optional[Dict[str, Any]]:
+        """Run extract_info(download=False) on the shared metadata YoutubeDL instance"""
+        with self._info_lock:
+            if self._info_ydl is None:
+                self._info_ydl = yt_dlp.YoutubeDL({
+                    'quiet': True,
+                    'no_warnings': True,
+                    'skip_download': True,
+                    'extract_flat': 'in_playlist',
+                })
+            return self._info_ydl.extract_info(url, download=False)
     
     def validate_url(self, url: str) -> bool:
         """
@@ -112,19 +157,96 @@ class URLDownloader:
         
         try:
             # Quick validation with yt-dlp
-            with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True}) as ydl:
-                try:
-                    info = ydl.extract_info(url, download=False)
-                    return info is not None
-                except Exception as e:
-                    self.logger.warning(f"URL validation failed: {e}")
-                    return False
+            info = self._extract_info_only(url)
+            return info is not None
         except Exception as e:
-            self.logger.error(f"URL validation error: {e}")
+            self.logger.warning(f"URL validation failed: {e}")
             return False
     
+    def _make_progress_hook(self, progress_callback: Callable[[float, str], None]) -> Callable[[Dict[str, Any]], None]:
+        """Build a yt-dlp progress hook that forwards throttled updates to progress_callback"""
+        last_emit_time = 0.0
+        last_emit_pct = -PROGRESS_EMIT_STEP
+        
+        def progress_hook(d):
+            nonlocal last_emit_time, last_emit_pct
+            
+            if d['status'] == 'downloading':
+                downloaded = d.get('downloaded_bytes') or 0
+                total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                if not total:
+                    if last_emit_time == 0.0:
+                        last_emit_time = time.monotonic()
+                        progress_callback(0, "Starting download...")
+                    return
+                
+                progress = 100.0 * downloaded / total
+                now = time.monotonic()
+                if (now - last_emit_time < PROGRESS_EMIT_INTERVAL
+                        and progress - last_emit_pct < PROGRESS_EMIT_STEP):
+                    return
+                
+                last_emit_time = now
+                last_emit_pct = progress
+                speed = d.get('_speed_str', 'N/A')
+                eta = d.get('_eta_str', 'N/A')
+                status = f"Downloading: {progress:.1f}% - Speed: {speed} - ETA: {eta}"
+                progress_callback(progress, status)
+            elif d['status'] == 'finished':
+                # Reset so the next playlist entry starts reporting from 0%
+                last_emit_pct = -PROGRESS_EMIT_STEP
+                progress_callback(100.0, "Download completed")
+            elif d['status'] == 'error':
+                progress_callback(0, "Download error")
+        
+        return progress_hook
+    
+    def _resolve_downloaded_file(self, ydl, info: Dict[str, Any]) -> str:
+        """Locate the file yt-dlp wrote for info and register it for cleanup"""
+        # yt-dlp records the final path (after post-processing) per requested download
+        requested = info.get('requested_downloads') or []
+        final_path = requested[-1].get('filepath') if requested else None
+        
+        downloaded_file = final_path or ydl.prepare_filename(info)
+        if not final_path and not os.path.exists(downloaded_file):
+            # Try to find the actual file among its siblings in one directory scan
+            directory, base_name = os.path.split(os.path.splitext(downloaded_file)[0])
+            try:
+                with os.scandir(directory or '.') as entries:
+                    for entry in entries:
+                        if (entry.name.startswith(base_name)
+                                and entry.name[len(base_name):] in ('.mp4', '.webm', '.mkv')):
+                            downloaded_file = entry.path
+                            break
+            except OSError as e:
+                self.logger.warning(f"Could not scan {directory} for downloaded file: {e}")
+        
+        # Register file for cleanup
+        self.temp_manager.register_temp_file(downloaded_file)
+        return downloaded_file
+    
+    def _build_video_info(self, info: Dict[str, Any], platform: str, filepath: str,
+                          url: str, quality: str) -> Dict[str, Any]:
+        """Summarize a yt-dlp info dict for a downloaded video"""
+        return {
+            'platform': platform,
+            'title': info.get('title', 'Unknown'),
+            'duration': info.get('duration', 0),
+            'uploader': info.get('uploader', 'Unknown'),
+            'view_count': info.get('view_count', 0),
+            'upload_date': info.get('upload_date', 'Unknown'),
+            'description': info.get('description', ''),
+            'tags': info.get('tags', []),
+            'thumbnail': info.get('thumbnail', ''),
+            'filepath': filepath,
+            'url': url,
+            'quality': quality
+        }
+    
     def download_video(self, url: str, quality: str = None, 
-                      progress_callback: Optional[Callable[[float, str], None]] = None) -> Dict[str, Any]:
+                      progress_callback: Optional[Callable[[float, str], None]] = None,
+                      prefetched_info: Optional[Dict[str, Any]] = None,
+                      output_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Download video from URL
         
@@ -132,9 +254,17 @@ class URLDownloader:
             url: Video URL
             quality: Video quality (e.g., '720p', '1080p')
             progress_callback: Optional progress callback (progress, status)
+            prefetched_info: Info dict already extracted for url (e.g. a playlist
+                entry); when given, it is downloaded without extracting again
+            output_path: yt-dlp output template reserved by the caller; a new
+                temp file is used when omitted
             
         Returns:
             Dictionary with download information
+            
+        Raises:
+            ValueError: If the URL is unsupported, invalid or inaccessible
+            RuntimeError: If the download itself fails
         """
         if not YTDLP_AVAILABLE:
             raise RuntimeError("yt-dlp not available. Cannot download videos.")
@@ -143,87 +273,41 @@ class URLDownloader:
         if platform == 'unknown':
             raise ValueError(f"Unsupported URL: {url}")
         
-        if not self.validate_url(url):
-            raise ValueError(f"Invalid or inaccessible URL: {url}")
-        
         # Set quality
         quality = quality or self.default_quality
         
         # Configure yt-dlp options
-        ydl_opts = self.ydl_opts.copy()
-        
-        # Set format based on quality
-        if quality == '1080p':
-            ydl_opts['format'] = 'best[height<=1080][ext=mp4]/best[height<=1080]/best[ext=mp4]/best'
-        elif quality == '720p':
-            ydl_opts['format'] = 'best[height<=720][ext=mp4]/best[height<=720]/best[ext=mp4]/best'
-        elif quality == '480p':
-            ydl_opts['format'] = 'best[height<=480][ext=mp4]/best[height<=480]/best[ext=mp4]/best'
-        elif quality == '360p':
-            ydl_opts['format'] = 'best[height<=360][ext=mp4]/best[height<=360]/best[ext=mp4]/best'
-        
-        # Set output template
-        output_path = self.temp_manager.get_temp_file('.%(ext)s')
-        ydl_opts['outtmpl'] = output_path
-        
-        # Add progress hook
-        if progress_callback:
-            def progress_hook(d):
-                if d['status'] == 'downloading':
-                    percent = d.get('_percent_str', '0%').replace('%', '')
-                    try:
-                        progress = float(percent)
-                        speed = d.get('_speed_str', 'N/A')
-                        eta = d.get('_eta_str', 'N/A')
-                        status = f"Downloading: {progress:.1f}% - Speed: {speed} - ETA: {eta}"
-                        progress_callback(progress, status)
-                    except ValueError:
-                        progress_callback(0, "Starting download...")
-                elif d['status'] == 'finished':
-                    progress_callback(100.0, "Download completed")
-                elif d['status'] == 'error':
-                    progress_callback(0, "Download error")
-            
-            ydl_opts['progress_hooks'] = [progress_hook]
+        output_path = output_path or self.temp_manager.get_temp_file('.%(ext)s')
+        ydl_opts = {
+            **self._base_ydl_opts,
+            'format': self._QUALITY_FORMATS.get(quality, self._base_ydl_opts['format']),
+            'outtmpl': output_path,
+            'progress_hooks': ([self._make_progress_hook(progress_callback)] if progress_callback
+                               else self._base_ydl_opts['progress_hooks']),
+        }
         
         try:
-            # Download video
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                
-                # Get downloaded file path
-                downloaded_file = ydl.prepare_filename(info)
-                if not os.path.exists(downloaded_file):
-                    # Try to find the actual file
-                    base_name = os.path.splitext(downloaded_file)[0]
-                    for ext in ['.mp4', '.webm', '.mkv']:
-                        test_file = base_name + ext
-                        if os.path.exists(test_file):
-                            downloaded_file = test_file
-                            break
-                
-                # Register file for cleanup
-                self.temp_manager.register_temp_file(downloaded_file)
+                info = prefetched_info
+                if info is None:
+                    # Extraction errors here replace a separate validate_url round-trip;
+                    # only they mean a bad URL, later errors are download failures
+                    try:
+                        info = ydl.extract_info(url, download=False)
+                    except yt_dlp.utils.DownloadError as e:
+                        self.logger.error(f"Download failed: {e}")
+                        raise ValueError(f"Invalid or inaccessible URL: {url}") from e
                 
-                # Get video info
-                video_info = {
-                    'platform': platform,
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'upload_date': info.get('upload_date', 'Unknown'),
-                    'description': info.get('description', ''),
-                    'tags': info.get('tags', []),
-                    'thumbnail': info.get('thumbnail', ''),
-                    'filepath': downloaded_file,
-                    'url': url,
-                    'quality': quality
-                }
+                # Download from the extracted info without extracting again
+                info = ydl.process_ie_result(info, download=True)
+                downloaded_file = self._resolve_downloaded_file(ydl, info)
+                video_info = self._build_video_info(info, platform, downloaded_file, url, quality)
                 
                 self.logger.info(f"Downloaded video: {video_info['title']} ({video_info['duration']}s)")
                 return video_info
                 
+        except ValueError:
+            raise
         except Exception as e:
             self.logger.error(f"Download failed: {e}")
             raise RuntimeError(f"Failed to download video: {e}")
@@ -252,53 +336,75 @@ class URLDownloader:
         quality = quality or self.default_quality
         
         # Configure yt-dlp options for playlist
-        ydl_opts = self.ydl_opts.copy()
-        ydl_opts['playlistend'] = max_videos
-        ydl_opts['noplaylist'] = False
-        
-        # Set format based on quality
-        if quality == '1080p':
-            ydl_opts['format'] = 'best[height<=1080][ext=mp4]/best[height<=1080]/best[ext=mp4]/best'
-        elif quality == '720p':
-            ydl_opts['format'] = 'best[height<=720][ext=mp4]/best[height<=720]/best[ext=mp4]/best'
-        elif quality == '480p':
-            ydl_opts['format'] = 'best[height<=480][ext=mp4]/best[height<=480]/best[ext=mp4]/best'
-        elif quality == '360p':
-            ydl_opts['format'] = 'best[height<=360][ext=mp4]/best[height<=360]/best[ext=mp4]/best'
-        
-        downloaded_videos = []
+        ydl_opts = {
+            **self._base_ydl_opts,
+            'format': self._QUALITY_FORMATS.get(quality, self._base_ydl_opts['format']),
+            'playlistend': max_videos,
+            'noplaylist': False,
+        }
         
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                
-                if 'entries' not in info:
-                    # Single video, not a playlist
-                    video_info = self.download_video(url, quality, progress_callback)
-                    return [video_info]
-                
-                # Process playlist
-                total_videos = min(len(info['entries']), max_videos)
-                for i, entry in enumerate(info['entries'][:max_videos]):
+            
+            if 'entries' not in info:
+                # Single video, not a playlist - download the already extracted info
+                return [self.download_video(url, quality, progress_callback, prefetched_info=info)]
+            
+            entries = list(info['entries'])[:max_videos]
+            total_videos = len(entries)
+            workers = max(1, min(self.config.get('playlist_parallelism', 4), total_videos))
+            
+            # Filled by playlist index so results keep playlist order
+            downloaded_videos = [None] * total_videos
+            
+            # Per-entry progress (0-100); workers report concurrently
+            entry_progress = [0.0] * total_videos
+            progress_lock = threading.Lock()
+            
+            def report(i: int, progress: float, status: str):
+                with progress_lock:
+                    entry_progress[i] = progress
+                    overall_progress = sum(entry_progress) / total_videos
+                progress_callback(overall_progress, status)
+            
+            def entry_callback(i: int) -> Callable[[float, str], None]:
+                return lambda progress, status: report(i, progress, f"Video {i + 1}/{total_videos}: {status}")
+            
+            # Downloads are network-bound, so entries are fetched concurrently; each
+            # download reuses its extracted entry instead of extracting it again.
+            # Output paths are reserved here, not on the workers, so TempManager's
+            # old-file cleanup cannot run while other entries are being written
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for i, entry in enumerate(entries):
                     if entry is None:
                         continue
-                    
+                    video_url = entry.get('webpage_url') or entry.get('url') or url
+                    future = executor.submit(
+                        self.download_video, video_url, quality,
+                        entry_callback(i) if progress_callback else None,
+                        prefetched_info=entry,
+                        output_path=self.temp_manager.get_temp_file('.%(ext)s')
+                    )
+                    futures[future] = i
+                
+                completed = 0
+                for future in as_completed(futures):
+                    i = futures[future]
                     try:
-                        video_url = entry.get('url') or entry.get('webpage_url')
-                        if video_url:
-                            video_info = self.download_video(video_url, quality, progress_callback)
-                            downloaded_videos.append(video_info)
-                            
-                            if progress_callback:
-                                overall_progress = ((i + 1) / total_videos) * 100
-                                progress_callback(overall_progress, f"Downloaded {i + 1}/{total_videos} videos")
-                    
+                        downloaded_videos[i] = future.result()
                     except Exception as e:
                         self.logger.warning(f"Failed to download video {i+1}: {e}")
                         continue
-                
-                self.logger.info(f"Downloaded {len(downloaded_videos)} videos from playlist")
-                return downloaded_videos
+                    
+                    completed += 1
+                    if progress_callback:
+                        report(i, 100.0, f"Downloaded {completed}/{total_videos} videos")
+            
+            downloaded_videos = [video for video in downloaded_videos if video is not None]
+            self.logger.info(f"Downloaded {len(downloaded_videos)} videos from playlist")
+            return downloaded_videos
                 
         except Exception as e:
             self.logger.error(f"Playlist download failed: {e}")
@@ -319,26 +425,25 @@ class URLDownloader:
             return []
         
         try:
-            with yt_dlp.YoutubeDL({'quiet': True, 'listformats': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                formats = []
-                if 'formats' in info:
-                    for fmt in info['formats']:
-                        if fmt.get('vcodec') != 'none' and fmt.get('acodec') != 'none':
-                            formats.append({
-                                'format_id': fmt.get('format_id'),
-                                'ext': fmt.get('ext'),
-                                'resolution': fmt.get('resolution'),
-                                'fps': fmt.get('fps'),
-                                'filesize': fmt.get('filesize'),
-                                'vcodec': fmt.get('vcodec'),
-                                'acodec': fmt.get('acodec'),
-                                'format_note': fmt.get('format_note')
-                            })
-                
-                return formats
-                
+            info = self._extract_info_only(url)
+            
+            formats = []
+            if 'formats' in info:
+                for fmt in info['formats']:
+                    if fmt.get('vcodec') != 'none' and fmt.get('acodec') != 'none':
+                        formats.append({
+                            'format_id': fmt.get('format_id'),
+                            'ext': fmt.get('ext'),
+                            'resolution': fmt.get('resolution'),
+                            'fps': fmt.get('fps'),
+                            'filesize': fmt.get('filesize'),
+                            'vcodec': fmt.get('vcodec'),
+                            'acodec': fmt.get('acodec'),
+                            'format_note': fmt.get('format_note')
+                        })
+            
+            return formats
+            
         except Exception as e:
             self.logger.error(f"Failed to get formats: {e}")
             return []
@@ -358,22 +463,21 @@ class URLDownloader:
             return None
         
         try:
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                
-                return {
-                    'platform': self.detect_platform(url),
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'view_count': info.get('view_count', 0),
-                    'upload_date': info.get('upload_date', 'Unknown'),
-                    'description': info.get('description', ''),
-                    'tags': info.get('tags', []),
-                    'thumbnail': info.get('thumbnail', ''),
-                    'url': url
-                }
-                
+            info = self._extract_info_only(url)
+            
+            return {
+                'platform': self.detect_platform(url),
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'view_count': info.get('view_count', 0),
+                'upload_date': info.get('upload_date', 'Unknown'),
+                'description': info.get('description', ''),
+                'tags': info.get('tags', []),
+                'thumbnail': info.get('thumbnail', ''),
+                'url': url
+            }
+            
         except Exception as e:
             self.logger.error(f"Failed to get video info: {e}")
             return None